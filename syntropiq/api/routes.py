@@ -41,6 +41,7 @@ from syntropiq.optimize.config import (
 from syntropiq.optimize.lambda_adaptation import compute_adaptive_lambda
 from syntropiq.optimize.lambda_optimizer import optimize_tasks
 from syntropiq.optimize.schema import LambdaVector, OptimizeInput
+from syntropiq.persistence.agent_registry import is_routable
 from syntropiq.reflect.config import get_reflect_consensus_mode, get_reflect_mode
 from syntropiq.reflect.consensus import PerspectiveProfile, run_consensus_reflect
 from syntropiq.reflect.engine import run_reflect
@@ -68,6 +69,36 @@ def _emit_event(event: dict):
     server.telemetry_hub.publish_events([event])
 
 
+def _flush_telemetry() -> None:
+    # Events and cycles are persisted write-behind; drain them before reading
+    # them back from the telemetry ledger.
+    if server.telemetry_hub is not None:
+        server.telemetry_hub.flush(timeout=5.0)
+
+
+def _bayes_tracker():
+    return getattr(server.telemetry_hub, "bayes_tracker", None) if server.telemetry_hub is not None else None
+
+
+def _run_posterior(manager, run_id: str, save: bool) -> dict:
+    """
+    Run posterior from the streaming tracker, seeded from the ledger on first
+    use; with ``save`` it is snapshotted to the ledger only when it changed.
+    """
+    tracker = _bayes_tracker()
+
+    def seed():
+        _flush_telemetry()
+        return manager.load_cycles_by_run_id(run_id, limit=tracker.window or 50, latest=True)
+
+    if save:
+        payload = tracker.snapshot(run_id, manager, seed=seed)
+    else:
+        payload = {"run_id": run_id, **tracker.posterior(run_id, seed=seed)}
+    payload.pop("run_id", None)
+    return payload
+
+
 def _emit_invariant_alerts(violations: list[InvariantViolation], base_metadata: Optional[dict] = None) -> None:
     if not violations:
         return
@@ -164,7 +195,20 @@ def _emit_circuit_breaker(run_id: str, reason: str):
         )
 
 
-def select_highest_trust(eligible_agents):
+def _ranked_selection(eligible_agents, ranked, n):
+    """Top-n ids from the trust index, or None if they are not all in ``eligible_agents``."""
+    selected = ranked(n)
+    if len(selected) == min(n, len(eligible_agents)) and all(aid in eligible_agents for aid in selected):
+        return selected
+    # The pool changed between building the map and reading the index.
+    return None
+
+
+def select_highest_trust(eligible_agents, ranked=None):
+    if ranked is not None:
+        selected = _ranked_selection(eligible_agents, ranked, 1)
+        if selected is not None:
+            return selected
     sorted_agents = sorted(
         eligible_agents.items(),
         key=lambda x: x[1]["trust_score"],
@@ -173,7 +217,11 @@ def select_highest_trust(eligible_agents):
     return [sorted_agents[0][0]] if sorted_agents else []
 
 
-def select_top_n_trust(eligible_agents, n=2):
+def select_top_n_trust(eligible_agents, n=2, ranked=None):
+    if ranked is not None:
+        selected = _ranked_selection(eligible_agents, ranked, n)
+        if selected is not None:
+            return selected
     sorted_agents = sorted(
         eligible_agents.items(),
         key=lambda x: x[1]["trust_score"],
@@ -192,6 +240,9 @@ STRATEGY_REGISTRY = {
     "round_robin_v1": select_round_robin,
 }
 
+# Selectors that can read from the registry's trust-ranked index instead of sorting.
+RANKED_SELECTORS = {select_highest_trust, select_top_n_trust}
+
 
 class GovernanceExecuteRequest(BaseModel):
     task: TaskSchema
@@ -347,7 +398,7 @@ def governance_execute(request: GovernanceExecuteRequest):
     # Filter suppressed agents
     eligible_agents = [
         agent for agent in agents_dict.values()
-        if agent.status != "suppressed"
+        if is_routable(agent)
     ]
 
     if CIRCUIT_STATE["active"] and len(eligible_agents) > 0:
@@ -397,7 +448,7 @@ def governance_execute(request: GovernanceExecuteRequest):
     total_trust = sum(float(getattr(agent, "trust_score", 0.0)) for agent in eligible_agents)
     authority_distribution = {}
     for agent_id, agent in agents_dict.items():
-        if getattr(agent, "status", None) == "suppressed":
+        if not is_routable(agent):
             authority_distribution[agent_id] = 0.0
         elif total_trust > 0:
             authority_distribution[agent_id] = float(getattr(agent, "trust_score", 0.0)) / total_trust
@@ -419,10 +470,11 @@ def governance_execute(request: GovernanceExecuteRequest):
         for agent in eligible_agents
     }
 
-    if strategy_name == "top_n_trust_v1":
-        selected_ids = selector(eligible_agent_map, n=2)
-    else:
-        selected_ids = selector(eligible_agent_map)
+    selector_kwargs = {"n": 2} if strategy_name == "top_n_trust_v1" else {}
+    registry = server.agent_registry
+    if selector in RANKED_SELECTORS and hasattr(registry, "top_trusted"):
+        selector_kwargs["ranked"] = registry.top_trusted
+    selected_ids = selector(eligible_agent_map, **selector_kwargs)
 
     selection_violations = []
     if not strategy_name:
@@ -794,6 +846,7 @@ def verify_audit_chain(chain_id: str = Query(default="GLOBAL")):
             "cycles": {"ok": True, "checked": 0, "first_bad_index": None, "reason": "telemetry_state_unavailable"},
         }
 
+    _flush_telemetry()
     return {
         "chain_id": chain_id,
         "events": manager.verify_events_chain(chain_id=chain_id),
@@ -812,6 +865,7 @@ def replay_validate(request: ReplayValidateRequest):
     actor = _actor_dict(request.actor)
     request_id = get_request_id()
 
+    _flush_telemetry()
     artifacts = load_run_artifacts(manager, request.run_id)
     if not artifacts.get("cycles"):
         raise HTTPException(status_code=404, detail="run_artifacts_not_found")
@@ -931,6 +985,7 @@ def optimize_score(request: OptimizeScoreRequest):
     posterior_payload = None
 
     if adapt_mode in {"log", "apply"}:
+        _flush_telemetry()
         recent_cycles = manager.load_cycles_by_run_id(request.run_id, limit=50)
         success_total = sum(int(c.get("successes", 0)) for c in recent_cycles[-10:])
         fail_total = sum(int(c.get("failures", 0)) for c in recent_cycles[-10:])
@@ -939,13 +994,16 @@ def optimize_score(request: OptimizeScoreRequest):
 
         bayes_multiplier = 1.0
         if bayes_mode in {"log", "apply"}:
-            posterior_payload = posterior_from_cycles(recent_cycles[-50:])
-            manager.save_bayes_posterior(
-                {
-                    "run_id": request.run_id,
-                    **posterior_payload,
-                }
-            )
+            if _bayes_tracker() is not None:
+                posterior_payload = _run_posterior(manager, request.run_id, save=True)
+            else:
+                posterior_payload = posterior_from_cycles(recent_cycles[-50:])
+                manager.save_bayes_posterior(
+                    {
+                        "run_id": request.run_id,
+                        **posterior_payload,
+                    }
+                )
             if bayes_mode == "apply":
                 bayes_multiplier = float(posterior_payload.get("suggested_risk_multiplier", 1.0))
 
@@ -1098,11 +1156,15 @@ def verify_optimization_events(run_id: str = Query(...), limit: int = Query(defa
 
 
 @router.get("/optimize/bayes")
-def optimize_bayes(run_id: str = Query(...), window: int = Query(default=50, ge=1, le=500)):
+def optimize_bayes(run_id: str = Query(...), window: Optional[int] = Query(default=None, ge=1, le=500)):
     manager = getattr(server, "telemetry_state_manager", None)
     if manager is None:
         raise HTTPException(status_code=503, detail="telemetry_state_unavailable")
-    cycles = manager.load_cycles_by_run_id(run_id=run_id, limit=window)
+    if window is None and _bayes_tracker() is not None:
+        posterior = _run_posterior(manager, run_id, save=get_bayes_mode() in {"log", "apply"})
+        return {"run_id": run_id, **posterior}
+    _flush_telemetry()
+    cycles = manager.load_cycles_by_run_id(run_id=run_id, limit=window or 50)
     posterior = posterior_from_cycles(cycles)
     payload = {"run_id": run_id, **posterior}
     if get_bayes_mode() in {"log", "apply"}:
@@ -1150,6 +1212,7 @@ def reflect_run(request: ReflectRunRequest):
         suppressed = getattr(server.governance_loop.trust_engine, "suppressed_agents", {})
         suppression_active = bool(suppressed)
 
+    _flush_telemetry()
     recent_cycles = manager.load_cycles_by_run_id(request.run_id, limit=50)
     recent_events = manager.load_events_by_run_id(request.run_id, limit=200)
     if not suppression_active:
@@ -1248,6 +1311,7 @@ def reflect_consensus(request: ReflectConsensusRequest):
     suppression_active = False
     if getattr(server, "governance_loop", None) is not None and hasattr(server.governance_loop, "trust_engine"):
         suppression_active = bool(getattr(server.governance_loop.trust_engine, "suppressed_agents", {}))
+    _flush_telemetry()
     recent_cycles = manager.load_cycles_by_run_id(request.run_id, limit=50)
     recent_events = manager.load_events_by_run_id(request.run_id, limit=200)
     replay_rows = manager.load_replay_validations(request.run_id, limit=1)
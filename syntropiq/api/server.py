@@ -22,9 +22,14 @@ from syntropiq.core.invariants import Invariants, emit_violations, mode_from_env
 from syntropiq.core.logging import configure_logging
 from syntropiq.core.models import Task
 from syntropiq.execution.deterministic_executor import DeterministicExecutor
+from syntropiq.governance.backlog import TaskBacklog
 from syntropiq.governance.loop import GovernanceLoop
 from syntropiq.governance.mutation_engine import MutationEngine
+from syntropiq.governance.trust_decay import IdleTrustDecay
+from syntropiq.optimize.bayes_posterior import BayesPosteriorTracker
+from syntropiq.optimize.config import get_bayes_forgetting, get_bayes_per_agent, get_bayes_window
 from syntropiq.persistence.agent_registry import AgentRegistry
+from syntropiq.persistence.run_state import RunStateStore, set_run_state_store
 from syntropiq.persistence.state_manager import PersistentStateManager
 from syntropiq.api.state_manager import PersistentStateManager as TelemetryStateManager
 from syntropiq.demo.fraud.data import RealDataPool, generate_fraud_batch
@@ -96,6 +101,7 @@ async def synthetic_demo_stream():
                     reason="demo_auto_recovery",
                 )
                 state_manager.update_agent_status(recovery_target.id, "active")
+                agent_registry.refresh_agent(recovery_target.id)
                 fully_suppressed_streak = 0
                 print(
                     f"[demo] auto-recovery activated -> agent={recovery_target.id} trust=0.750"
@@ -174,14 +180,14 @@ async def synthetic_demo_stream():
                     )
                 )
 
-            result = governance_loop.execute_cycle(
+            result = await governance_loop.execute_cycle_async(
                 tasks=tasks,
                 agents=agents,
                 executor=executor,
                 run_id="LIVE_STREAM",
             )
 
-            agent_registry.sync_trust_scores()
+            await asyncio.to_thread(agent_registry.sync_trust_scores)
 
             mutation_engine.trust_threshold = result["mutation"]["trust_threshold"]
             mutation_engine.suppression_threshold = result["mutation"][
@@ -394,6 +400,7 @@ async def fraud_demo_stream():
     for aid, agent in seeded_agents.items():
         if server_agent := agent_registry.get_agent(aid):
             server_agent.status = "active"
+            agent_registry.refresh_agent(aid)
             continue
         agent_registry.register_agent(
             agent_id=aid,
@@ -451,7 +458,7 @@ async def fraud_demo_stream():
 
                 trust_before = {aid: float(agent.trust_score) for aid, agent in live_agents.items()}
 
-                result = governance_loop.execute_cycle(
+                result = await governance_loop.execute_cycle_async(
                     tasks=tasks,
                     agents=live_agents,
                     executor=fraud_executor,
@@ -475,7 +482,7 @@ async def fraud_demo_stream():
                             reflection=result.get("reflection", {}),
                         )
 
-                agent_registry.sync_trust_scores()
+                await asyncio.to_thread(agent_registry.sync_trust_scores)
 
                 mutation_engine.trust_threshold = result["mutation"]["trust_threshold"]
                 mutation_engine.suppression_threshold = result["mutation"][
@@ -512,14 +519,40 @@ async def lifespan(app: FastAPI):
     print("🚀 Syntropiq Governance Engine - Starting...")
     print("=" * 60)
 
-    state_manager = PersistentStateManager(db_path=config.database.db_path)
-    agent_registry = AgentRegistry(state_manager)
+    state_manager = PersistentStateManager(
+        db_path=config.database.db_path,
+        database_config=config.database,
+    )
+    idle_decay = None
+    if config.governance.idle_decay_half_life > 0:
+        idle_decay = IdleTrustDecay(
+            half_life_seconds=config.governance.idle_decay_half_life,
+            floor=config.governance.idle_decay_floor,
+        )
+    agent_registry = AgentRegistry(state_manager, idle_decay=idle_decay)
+    # Lambda adaptation, applied lambdas and healing state survive restarts.
+    run_state = RunStateStore(
+        db_path=config.database.db_path,
+        database_config=config.database,
+        max_entries=config.governance.run_state_max_entries,
+        ttl_seconds=config.governance.run_state_ttl or None,
+    )
+    previous_run_state = set_run_state_store(run_state)
 
-    telemetry_state_manager = TelemetryStateManager()
+    telemetry_state_manager = TelemetryStateManager(database_config=config.database)
     telemetry_hub = GovernanceTelemetryHub(
         state_manager=telemetry_state_manager,
         max_events=int(os.getenv("GOVERNANCE_EVENT_BUFFER_MAX", "2000")),
         max_cycles=int(os.getenv("GOVERNANCE_CYCLE_BUFFER_MAX", "500")),
+        flush_interval=float(os.getenv("TELEMETRY_FLUSH_INTERVAL", "0.05")),
+        max_pending_writes=int(os.getenv("TELEMETRY_WRITE_QUEUE_MAX", "10000")),
+        overflow=os.getenv("TELEMETRY_WRITE_OVERFLOW", "block"),
+        bayes_tracker=BayesPosteriorTracker(
+            # Exponential forgetting, when configured, replaces the sliding window.
+            window=get_bayes_window() if get_bayes_forgetting() >= 1.0 else None,
+            forgetting=get_bayes_forgetting(),
+            per_agent=get_bayes_per_agent(),
+        ),
     )
 
     def _report_invariant_violations(violations, base_metadata):
@@ -555,7 +588,22 @@ async def lifespan(app: FastAPI):
         state_manager=state_manager,
         trust_threshold=config.governance.trust_threshold,
         routing_mode=config.governance.routing_mode,
+        agent_capacity=config.governance.agent_capacity,
+        routing_seed=config.governance.routing_seed,
+        drift_detector=config.governance.drift_detector,
+        asymmetric_reward=config.governance.asymmetric_reward,
+        asymmetric_penalty=config.governance.asymmetric_penalty,
+        idle_decay=idle_decay,
+        backlog=(
+            TaskBacklog(state_manager, aging_rate=config.governance.backlog_aging_rate)
+            if config.governance.task_backlog
+            else None
+        ),
+        run_state=run_state,
         telemetry=telemetry_hub,
+        max_concurrency=config.governance.dispatch_concurrency,
+        profile_every=config.governance.profile_every,
+        engine_backend=config.governance.trust_engine_backend,
     )
 
     mutation_engine = MutationEngine(
@@ -577,7 +625,11 @@ async def lifespan(app: FastAPI):
     yield
 
     print("🛑 Shutting down Syntropiq...")
+    telemetry_hub.close()
+    set_run_state_store(previous_run_state)
+    run_state.close()
     state_manager.close()
+    telemetry_state_manager.close()
 
 
 # ----------------------------------------------------
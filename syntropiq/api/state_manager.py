@@ -2,23 +2,87 @@ import json
 import os
 import sqlite3
 import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from syntropiq.core.audit_chain import compute_hash, derive_chain_id, verify_chain
+from syntropiq.core.config import DatabaseConfig
+from syntropiq.persistence.connection import SQLiteConnectionPool
 
 
 DB_PATH = Path("syntropiq_telemetry.db")
 
+# How each ledger picks its chain tip (mirrors the ORDER BY used by its verifier).
+_CHAIN_TIP_ORDER = {
+    "events": "id DESC",
+    "cycles": "id DESC",
+}
+
+
+# Versioned schema migrations, applied in order and tracked with PRAGMA user_version.
+# SQLite appends the rowid to every index key, so (chain_id, timestamp) also
+# serves ORDER BY timestamp, rowid without a sort.
+_SCHEMA_MIGRATIONS: List[Tuple[int, List[str]]] = [
+    (
+        1,
+        [
+            "CREATE INDEX IF NOT EXISTS idx_events_chain_ts ON events (chain_id, timestamp)",
+            "CREATE INDEX IF NOT EXISTS idx_events_chain_id ON events (chain_id, id)",
+            "CREATE INDEX IF NOT EXISTS idx_events_ts ON events (timestamp)",
+            "CREATE INDEX IF NOT EXISTS idx_events_type_ts ON events (type, timestamp)",
+            "CREATE INDEX IF NOT EXISTS idx_cycles_chain_ts ON cycles (chain_id, timestamp)",
+            "CREATE INDEX IF NOT EXISTS idx_cycles_chain_id ON cycles (chain_id, id)",
+            "CREATE INDEX IF NOT EXISTS idx_cycles_ts ON cycles (timestamp)",
+            "CREATE INDEX IF NOT EXISTS idx_replay_validations_run_ts ON replay_validations (run_id, timestamp)",
+            "CREATE INDEX IF NOT EXISTS idx_replay_validations_chain_ts ON replay_validations (chain_id, timestamp)",
+            "CREATE INDEX IF NOT EXISTS idx_optimization_events_run_ts ON optimization_events (run_id, timestamp)",
+            "CREATE INDEX IF NOT EXISTS idx_optimization_events_chain_ts ON optimization_events (chain_id, timestamp)",
+            "CREATE INDEX IF NOT EXISTS idx_insight_ledger_run_ts ON insight_ledger (run_id, timestamp)",
+            "CREATE INDEX IF NOT EXISTS idx_insight_ledger_chain_ts ON insight_ledger (chain_id, timestamp)",
+            "CREATE INDEX IF NOT EXISTS idx_lambda_history_run_ts ON lambda_history (run_id, timestamp)",
+            "CREATE INDEX IF NOT EXISTS idx_lambda_history_chain_ts ON lambda_history (chain_id, timestamp)",
+            "CREATE INDEX IF NOT EXISTS idx_bayes_posteriors_run_ts ON bayes_posteriors (run_id, timestamp)",
+            "CREATE INDEX IF NOT EXISTS idx_bayes_posteriors_chain_ts ON bayes_posteriors (chain_id, timestamp)",
+            "CREATE INDEX IF NOT EXISTS idx_consensus_insights_run_ts ON consensus_insights (run_id, timestamp)",
+            "CREATE INDEX IF NOT EXISTS idx_consensus_insights_chain_ts ON consensus_insights (chain_id, timestamp)",
+        ],
+    ),
+]
+
+
+@dataclass
+class _ChainHead:
+    """Cached next-sequence and tip of one hash chain."""
+
+    seq: int
+    tip_id: Optional[str]
+    tip_timestamp: Optional[str]
+    tip_hash: Optional[str]
+
 
 class PersistentStateManager:
-    def __init__(self, db_path: Path = DB_PATH):
+    def __init__(self, db_path: Path = DB_PATH, database_config: Optional[DatabaseConfig] = None):
         self.db_path = db_path
+        self._pool = SQLiteConnectionPool.from_config(db_path, database_config)
+        self._chain_heads: Dict[Tuple[str, str], _ChainHead] = {}
+        self._latest_records: Dict[Tuple[str, str], Optional[Dict[str, Any]]] = {}
+        self._data_version: Optional[int] = None
         self._init_db()
 
+    def close(self) -> None:
+        self._pool.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator["PersistentStateManager"]:
+        """Group several save_* calls into one ledger transaction and commit."""
+        with self._ledger_write():
+            yield self
+
     def _init_db(self):
-        with sqlite3.connect(self.db_path) as conn:
+        with self._pool.write() as conn:
             cursor = conn.cursor()
 
             cursor.execute(
@@ -267,8 +331,36 @@ class PersistentStateManager:
                 },
             )
 
+            # Per-chain sequence and tip, advanced in the same transaction as
+            # each ledger insert so every writer process sees a consistent head.
+            cursor.execute(
+                """
+            CREATE TABLE IF NOT EXISTS chain_heads (
+                table_name TEXT NOT NULL,
+                chain_id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                tip_id TEXT,
+                tip_timestamp TEXT,
+                tip_hash TEXT,
+                PRIMARY KEY (table_name, chain_id)
+            )
+            """
+            )
+
+            self._apply_schema_migrations(cursor)
             conn.commit()
 
+    def _apply_schema_migrations(self, cursor: sqlite3.Cursor) -> None:
+        cursor.execute("PRAGMA user_version")
+        current = int(cursor.fetchone()[0])
+        for version, statements in _SCHEMA_MIGRATIONS:
+            if version <= current:
+                continue
+            for statement in statements:
+                cursor.execute(statement)
+            cursor.execute(f"PRAGMA user_version = {int(version)}")
+            current = version
+
     def _migrate_table_columns(self, cursor: sqlite3.Cursor, table: str, columns: Dict[str, str]) -> None:
         cursor.execute(f"PRAGMA table_info({table})")
         existing = {row[1] for row in cursor.fetchall()}
@@ -282,17 +374,6 @@ class PersistentStateManager:
             return mode
         return "log"
 
-    def _last_hash_for_chain(self, conn: sqlite3.Connection, table: str, chain_id: str) -> Optional[str]:
-        cursor = conn.cursor()
-        cursor.execute(
-            f"SELECT hash FROM {table} WHERE chain_id=? ORDER BY timestamp DESC, rowid DESC LIMIT 1",
-            (chain_id,),
-        )
-        row = cursor.fetchone()
-        if not row:
-            return None
-        return row[0]
-
     def _telemetry_chain_id(self, run_id: Any) -> str:
         if run_id is None:
             return "telemetry:GLOBAL"
@@ -302,111 +383,307 @@ class PersistentStateManager:
         run_root = run_text.split(":", 1)[0]
         return f"telemetry:{run_root}"
 
-    def _next_chain_sequence(self, conn: sqlite3.Connection, table: str, chain_id: str) -> int:
-        cursor = conn.cursor()
-        cursor.execute(f"SELECT COUNT(*) FROM {table} WHERE chain_id = ?", (chain_id,))
-        row = cursor.fetchone()
-        current = int(row[0]) if row and row[0] is not None else 0
-        return current + 1
+    @contextmanager
+    def _ledger_write(self) -> Iterator[sqlite3.Connection]:
+        """
+        Writer transaction for hash-chained ledgers.
+
+        Takes the database write lock up front, then drops cached chain heads
+        if another connection committed since our last write.
+        """
+        with self._pool.write() as conn:
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            self._sync_data_version(conn)
+            try:
+                yield conn
+            except BaseException:
+                # The transaction rolls back, so cached heads may be ahead of the DB.
+                self._chain_heads.clear()
+                self._latest_records.clear()
+                raise
+
+    def _sync_data_version(self, conn: sqlite3.Connection) -> None:
+        data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        if data_version != self._data_version:
+            self._chain_heads.clear()
+            self._latest_records.clear()
+            self._data_version = data_version
+
+    def _latest_record(
+        self, table: str, run_id: str, loader: Callable[[], List[Dict[str, Any]]]
+    ) -> Optional[Dict[str, Any]]:
+        key = (table, run_id)
+        with self._pool.write() as conn:
+            self._sync_data_version(conn)
+            if key not in self._latest_records:
+                rows = loader()
+                self._latest_records[key] = rows[0] if rows else None
+            record = self._latest_records[key]
+        return dict(record) if record is not None else None
+
+    def _note_latest_record(self, table: str, run_id: str, record: Dict[str, Any]) -> None:
+        # Called inside the ledger transaction: a rollback clears the cache.
+        # Only warm entries are maintained; cold ones load on first read.
+        key = (table, run_id)
+        if key not in self._latest_records:
+            return
+        current = self._latest_records[key]
+        if current is None:
+            self._latest_records[key] = record
+        elif str(record.get("timestamp")) >= str(current.get("timestamp")):
+            self._latest_records[key] = record
+        elif current.get("id") == record.get("id"):
+            # The latest row was overwritten with an older one; reload lazily.
+            self._latest_records.pop(key, None)
+
+    def latest_replay_validation(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """Most recent replay validation for ``run_id``, served from cache once warm."""
+        return self._latest_record(
+            "replay_validations", run_id, lambda: self.load_replay_validations(run_id, limit=1)
+        )
 
-    def save_event(self, event: Dict[str, Any]):
-        event_id = event.get("id")
+    def latest_bayes_posterior(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """Most recent Bayes posterior for ``run_id``, served from cache once warm."""
+        return self._latest_record(
+            "bayes_posteriors", run_id, lambda: self.load_bayes_posteriors(run_id, limit=1)
+        )
+
+    def _chain_head(self, conn: sqlite3.Connection, table: str, chain_id: str) -> _ChainHead:
+        key = (table, chain_id)
+        head = self._chain_heads.get(key)
+        if head is not None:
+            return head
+
+        row = conn.execute(
+            "SELECT seq, tip_id, tip_timestamp, tip_hash FROM chain_heads WHERE table_name=? AND chain_id=?",
+            (table, chain_id),
+        ).fetchone()
+        if row:
+            head = _ChainHead(seq=int(row[0]), tip_id=row[1], tip_timestamp=row[2], tip_hash=row[3])
+        else:
+            head = self._seed_chain_head(conn, table, chain_id)
+            self._store_chain_head(conn, table, chain_id, head)
+        self._chain_heads[key] = head
+        return head
+
+    def _seed_chain_head(self, conn: sqlite3.Connection, table: str, chain_id: str) -> _ChainHead:
+        order = _CHAIN_TIP_ORDER.get(table, "timestamp DESC, rowid DESC")
+        count = conn.execute(f"SELECT COUNT(*) FROM {table} WHERE chain_id = ?", (chain_id,)).fetchone()
+        tip = conn.execute(
+            f"SELECT id, timestamp, hash FROM {table} WHERE chain_id=? ORDER BY {order} LIMIT 1",
+            (chain_id,),
+        ).fetchone()
+        return _ChainHead(
+            seq=int(count[0]) if count and count[0] is not None else 0,
+            tip_id=tip[0] if tip else None,
+            tip_timestamp=tip[1] if tip else None,
+            tip_hash=tip[2] if tip else None,
+        )
+
+    def _store_chain_head(self, conn: sqlite3.Connection, table: str, chain_id: str, head: _ChainHead) -> None:
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO chain_heads (table_name, chain_id, seq, tip_id, tip_timestamp, tip_hash)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (table, chain_id, head.seq, head.tip_id, head.tip_timestamp, head.tip_hash),
+        )
+
+    def _append_chain_row(
+        self,
+        conn: sqlite3.Connection,
+        table: str,
+        chain_id: str,
+        row: Dict[str, Any],
+        hash_payload: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Hash-link ``row`` onto ``chain_id`` and insert it into ``table``.
+
+        The previous hash and sequence come from the cached chain head rather
+        than scanning the chain; a missing ``row["id"]`` is filled with the next
+        ``<chain_id>:<seq>`` id.
+        """
+        head = self._chain_head(conn, table, chain_id)
+        if not row.get("id"):
+            row["id"] = f"{chain_id}:{head.seq + 1:012d}"
 
-        mode = self._audit_chain_mode()
-        chain_id = self._telemetry_chain_id(event.get("run_id"))
         prev_hash: Optional[str] = None
         current_hash: Optional[str] = None
         hash_algo: Optional[str] = None
+        if self._audit_chain_mode() == "log":
+            prev_hash = head.tip_hash
+            hash_algo = "sha256"
+            current_hash = compute_hash(prev_hash, hash_payload, algo=hash_algo)
+
+        replaced = conn.execute(f"SELECT chain_id FROM {table} WHERE id = ?", (row["id"],)).fetchone()
+
+        columns = {**row, "chain_id": chain_id, "prev_hash": prev_hash, "hash": current_hash, "hash_algo": hash_algo}
+        names = ", ".join(columns)
+        placeholders = ", ".join("?" for _ in columns)
+        conn.execute(
+            f"INSERT OR REPLACE INTO {table} ({names}) VALUES ({placeholders})",
+            tuple(columns.values()),
+        )
 
-        with sqlite3.connect(self.db_path) as conn:
-            if not event_id:
-                seq = self._next_chain_sequence(conn, "events", chain_id)
-                event_id = f"{chain_id}:{seq:012d}"
+        if replaced is not None:
+            # Overwriting an existing id can move a tip backwards; reseed lazily.
+            for affected in {chain_id, replaced[0]}:
+                self._chain_heads.pop((table, affected), None)
+                conn.execute("DELETE FROM chain_heads WHERE table_name=? AND chain_id=?", (table, affected))
+            return columns
+
+        self._advance_chain_head(table, head, row, current_hash)
+        self._store_chain_head(conn, table, chain_id, head)
+        return columns
+
+    def _append_chain_rows(
+        self,
+        conn: sqlite3.Connection,
+        table: str,
+        entries: List[Tuple[str, Dict[str, Any], Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Batch form of ``_append_chain_row`` for ``(chain_id, row, hash_payload)`` entries.
+
+        Hashes are chained in memory in one pass and all rows are written with a
+        single executemany. Batches that would overwrite an existing id take the
+        row-by-row path so chain heads are reseeded exactly as for single saves.
+        """
+        if not entries:
+            return []
+
+        mode = self._audit_chain_mode()
+        heads: Dict[str, _ChainHead] = {}
+        records: List[Dict[str, Any]] = []
+        for chain_id, row, hash_payload in entries:
+            if chain_id not in heads:
+                heads[chain_id] = replace(self._chain_head(conn, table, chain_id))
+            head = heads[chain_id]
+
+            row = dict(row)
+            if not row.get("id"):
+                row["id"] = f"{chain_id}:{head.seq + 1:012d}"
+
+            prev_hash: Optional[str] = None
+            current_hash: Optional[str] = None
+            hash_algo: Optional[str] = None
             if mode == "log":
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    SELECT hash
-                    FROM events
-                    WHERE chain_id = ?
-                    ORDER BY id DESC
-                    LIMIT 1
-                    """,
-                    (chain_id,),
-                )
-                row = cursor.fetchone()
-                prev_hash = row[0] if row else None
+                prev_hash = head.tip_hash
                 hash_algo = "sha256"
-                current_hash = compute_hash(prev_hash, event, algo=hash_algo)
+                current_hash = compute_hash(prev_hash, hash_payload, algo=hash_algo)
 
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO events
-                (id, timestamp, type, payload, chain_id, prev_hash, hash, hash_algo)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    event_id,
-                    event.get("timestamp"),
-                    event.get("type"),
-                    json.dumps(event),
-                    chain_id,
-                    prev_hash,
-                    current_hash,
-                    hash_algo,
-                ),
+            records.append({**row, "chain_id": chain_id, "prev_hash": prev_hash, "hash": current_hash, "hash_algo": hash_algo})
+            self._advance_chain_head(table, head, row, current_hash)
+
+        ids = [record["id"] for record in records]
+        collides = len(set(ids)) != len(ids)
+        for start in range(0, len(ids), 500):
+            if collides:
+                break
+            chunk = ids[start:start + 500]
+            placeholders = ",".join("?" for _ in chunk)
+            collides = conn.execute(
+                f"SELECT 1 FROM {table} WHERE id IN ({placeholders}) LIMIT 1", chunk
+            ).fetchone() is not None
+        if collides:
+            return [self._append_chain_row(conn, table, chain_id, dict(row), hash_payload) for chain_id, row, hash_payload in entries]
+
+        names = list(records[0])
+        conn.executemany(
+            f"INSERT INTO {table} ({', '.join(names)}) VALUES ({', '.join('?' for _ in names)})",
+            [tuple(record.get(name) for name in names) for record in records],
+        )
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO chain_heads (table_name, chain_id, seq, tip_id, tip_timestamp, tip_hash)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (table, chain_id, head.seq, head.tip_id, head.tip_timestamp, head.tip_hash)
+                for chain_id, head in heads.items()
+            ],
+        )
+        for chain_id, head in heads.items():
+            self._chain_heads[(table, chain_id)] = head
+        return records
+
+    def _advance_chain_head(
+        self, table: str, head: _ChainHead, row: Dict[str, Any], current_hash: Optional[str]
+    ) -> None:
+        head.seq += 1
+        timestamp = row.get("timestamp")
+        if head.tip_id is None:
+            is_tip = True
+        elif _CHAIN_TIP_ORDER.get(table) == "id DESC":
+            is_tip = str(row["id"]) >= str(head.tip_id)
+        elif timestamp is None:
+            # SQLite sorts NULL timestamps last under DESC; rowid breaks ties.
+            is_tip = head.tip_timestamp is None
+        else:
+            is_tip = head.tip_timestamp is None or str(timestamp) >= str(head.tip_timestamp)
+        if is_tip:
+            head.tip_id = row["id"]
+            head.tip_timestamp = timestamp
+            head.tip_hash = current_hash
+
+    def save_event(self, event: Dict[str, Any]):
+        chain_id = self._telemetry_chain_id(event.get("run_id"))
+
+        with self._ledger_write() as conn:
+            self._append_chain_row(
+                conn,
+                "events",
+                chain_id,
+                {
+                    "id": event.get("id"),
+                    "timestamp": event.get("timestamp"),
+                    "type": event.get("type"),
+                    "payload": json.dumps(event),
+                },
+                event,
+            )
+
+    def save_events(self, events: List[Dict[str, Any]]) -> None:
+        """Persist many events in one transaction with a single hash-chain pass."""
+        with self._ledger_write() as conn:
+            self._append_chain_rows(
+                conn,
+                "events",
+                [
+                    (
+                        self._telemetry_chain_id(event.get("run_id")),
+                        {
+                            "id": event.get("id"),
+                            "timestamp": event.get("timestamp"),
+                            "type": event.get("type"),
+                            "payload": json.dumps(event),
+                        },
+                        event,
+                    )
+                    for event in events
+                ],
             )
-            conn.commit()
 
     def save_cycle(self, cycle: Dict[str, Any]):
-        cycle_record_id = cycle.get("id")
-        mode = self._audit_chain_mode()
         chain_id = self._telemetry_chain_id(cycle.get("run_id"))
-        prev_hash: Optional[str] = None
-        current_hash: Optional[str] = None
-        hash_algo: Optional[str] = None
-
-        with sqlite3.connect(self.db_path) as conn:
-            if not cycle_record_id:
-                seq = self._next_chain_sequence(conn, "cycles", chain_id)
-                cycle_record_id = f"{chain_id}:{seq:012d}"
-            if mode == "log":
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    SELECT hash
-                    FROM cycles
-                    WHERE chain_id = ?
-                    ORDER BY id DESC
-                    LIMIT 1
-                    """,
-                    (chain_id,),
-                )
-                row = cursor.fetchone()
-                prev_hash = row[0] if row else None
-                hash_algo = "sha256"
-                current_hash = compute_hash(prev_hash, cycle, algo=hash_algo)
 
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO cycles
-                (id, timestamp, payload, chain_id, prev_hash, hash, hash_algo)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    cycle_record_id,
-                    cycle.get("timestamp"),
-                    json.dumps(cycle),
-                    chain_id,
-                    prev_hash,
-                    current_hash,
-                    hash_algo,
-                ),
+        with self._ledger_write() as conn:
+            self._append_chain_row(
+                conn,
+                "cycles",
+                chain_id,
+                {
+                    "id": cycle.get("id"),
+                    "timestamp": cycle.get("timestamp"),
+                    "payload": json.dumps(cycle),
+                },
+                cycle,
             )
-            conn.commit()
 
     def load_recent_events(self, limit: int = 500) -> List[Dict[str, Any]]:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._pool.read() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT payload FROM events ORDER BY timestamp DESC LIMIT ?",
@@ -416,7 +693,7 @@ class PersistentStateManager:
             return [json.loads(row[0]) for row in reversed(rows)]
 
     def load_recent_cycles(self, limit: int = 100) -> List[Dict[str, Any]]:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._pool.read() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT payload FROM cycles ORDER BY timestamp DESC LIMIT ?",
@@ -425,38 +702,41 @@ class PersistentStateManager:
             rows = cursor.fetchall()
             return [json.loads(row[0]) for row in reversed(rows)]
 
-    def load_events_by_run_id(self, run_id: str, limit: int = 5000) -> List[Dict[str, Any]]:
+    def _load_chain_payloads(
+        self, conn: sqlite3.Connection, table: str, chain_ids: List[str], limit: int, latest: bool = False
+    ) -> List[Tuple[Any, ...]]:
+        # One index range scan per chain merged by UNION ALL; an OR across
+        # chain ids would fall back to scanning and sorting the table.
+        chain_ids = list(dict.fromkeys(chain_ids))
+        branches = " UNION ALL ".join(
+            f"SELECT payload, timestamp AS ts, rowid AS rid FROM {table} WHERE chain_id=?"
+            for _ in chain_ids
+        )
+        direction = "DESC" if latest else "ASC"
+        cursor = conn.cursor()
+        cursor.execute(
+            f"{branches} ORDER BY ts {direction}, rid {direction} LIMIT ?",
+            (*chain_ids, limit),
+        )
+        rows = cursor.fetchall()
+        return list(reversed(rows)) if latest else rows
+
+    def load_events_by_run_id(
+        self, run_id: str, limit: int = 5000, latest: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Rows of the run's chains in time order; ``latest`` keeps the newest ``limit``."""
         telemetry_chain = self._telemetry_chain_id(run_id)
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT payload
-                FROM events
-                WHERE chain_id=? OR chain_id=?
-                ORDER BY timestamp ASC, rowid ASC
-                LIMIT ?
-                """,
-                (telemetry_chain, run_id, limit),
-            )
-            rows = cursor.fetchall()
+        with self._pool.read() as conn:
+            rows = self._load_chain_payloads(conn, "events", [telemetry_chain, run_id], limit, latest=latest)
             return [json.loads(row[0]) for row in rows]
 
-    def load_cycles_by_run_id(self, run_id: str, limit: int = 2000) -> List[Dict[str, Any]]:
+    def load_cycles_by_run_id(
+        self, run_id: str, limit: int = 2000, latest: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Rows of the run's chains in time order; ``latest`` keeps the newest ``limit``."""
         telemetry_chain = self._telemetry_chain_id(run_id)
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT payload
-                FROM cycles
-                WHERE chain_id=? OR chain_id=?
-                ORDER BY timestamp ASC, rowid ASC
-                LIMIT ?
-                """,
-                (telemetry_chain, run_id, limit),
-            )
-            rows = cursor.fetchall()
+        with self._pool.read() as conn:
+            rows = self._load_chain_payloads(conn, "cycles", [telemetry_chain, run_id], limit, latest=latest)
             return [json.loads(row[0]) for row in rows]
 
     def save_replay_validation(self, record: Dict[str, Any]) -> Dict[str, Any]:
@@ -470,11 +750,7 @@ class PersistentStateManager:
         payload["component_scores"] = dict(payload.get("component_scores") or {})
         payload["details"] = dict(payload.get("details") or {})
 
-        mode = self._audit_chain_mode()
         chain_id = derive_chain_id({"run_id": payload["run_id"]}, default="GLOBAL")
-        prev_hash: Optional[str] = None
-        current_hash: Optional[str] = None
-        hash_algo: Optional[str] = None
 
         hash_payload = {
             "id": payload["id"],
@@ -487,39 +763,28 @@ class PersistentStateManager:
             "details": payload["details"],
         }
 
-        with sqlite3.connect(self.db_path) as conn:
-            if mode == "log":
-                prev_hash = self._last_hash_for_chain(conn, "replay_validations", chain_id)
-                hash_algo = "sha256"
-                current_hash = compute_hash(prev_hash, hash_payload, algo=hash_algo)
-
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO replay_validations
-                (id, run_id, timestamp, r_score, component_scores, ok, threshold, details, chain_id, prev_hash, hash, hash_algo)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    payload["id"],
-                    payload["run_id"],
-                    payload["timestamp"],
-                    payload["r_score"],
-                    json.dumps(payload["component_scores"]),
-                    1 if payload["ok"] else 0,
-                    payload["threshold"],
-                    json.dumps(payload["details"]),
-                    chain_id,
-                    prev_hash,
-                    current_hash,
-                    hash_algo,
-                ),
+        with self._ledger_write() as conn:
+            self._append_chain_row(
+                conn,
+                "replay_validations",
+                chain_id,
+                {
+                    "id": payload["id"],
+                    "run_id": payload["run_id"],
+                    "timestamp": payload["timestamp"],
+                    "r_score": payload["r_score"],
+                    "component_scores": json.dumps(payload["component_scores"]),
+                    "ok": 1 if payload["ok"] else 0,
+                    "threshold": payload["threshold"],
+                    "details": json.dumps(payload["details"]),
+                },
+                hash_payload,
             )
-            conn.commit()
-
+            self._note_latest_record("replay_validations", payload["run_id"], json.loads(json.dumps(hash_payload)))
         return payload
 
     def load_replay_validations(self, run_id: str, limit: int = 20) -> List[Dict[str, Any]]:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._pool.read() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -556,40 +821,25 @@ class PersistentStateManager:
         payload["run_id"] = str(payload.get("run_id") or "OPT_RUN")
         payload["timestamp"] = str(payload.get("timestamp") or datetime.now(timezone.utc).isoformat())
 
-        mode = self._audit_chain_mode()
         chain_id = derive_chain_id({"run_id": payload["run_id"]}, default="GLOBAL")
-        prev_hash: Optional[str] = None
-        current_hash: Optional[str] = None
-        hash_algo: Optional[str] = None
 
-        with sqlite3.connect(self.db_path) as conn:
-            if mode == "log":
-                prev_hash = self._last_hash_for_chain(conn, "optimization_events", chain_id)
-                hash_algo = "sha256"
-                current_hash = compute_hash(prev_hash, payload, algo=hash_algo)
-
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO optimization_events
-                (id, run_id, timestamp, payload, chain_id, prev_hash, hash, hash_algo)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    payload["id"],
-                    payload["run_id"],
-                    payload["timestamp"],
-                    json.dumps(payload),
-                    chain_id,
-                    prev_hash,
-                    current_hash,
-                    hash_algo,
-                ),
+        with self._ledger_write() as conn:
+            self._append_chain_row(
+                conn,
+                "optimization_events",
+                chain_id,
+                {
+                    "id": payload["id"],
+                    "run_id": payload["run_id"],
+                    "timestamp": payload["timestamp"],
+                    "payload": json.dumps(payload),
+                },
+                payload,
             )
-            conn.commit()
         return payload
 
     def load_optimization_events(self, run_id: str, limit: int = 50) -> List[Dict[str, Any]]:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._pool.read() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -605,7 +855,7 @@ class PersistentStateManager:
         return [json.loads(row[0]) for row in reversed(rows)]
 
     def verify_optimization_chain(self, run_id: str, limit: int = 200) -> Dict[str, Any]:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._pool.read() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -645,43 +895,28 @@ class PersistentStateManager:
         payload["Fs"] = float(payload.get("Fs", 0.0))
         payload["classification"] = str(payload.get("classification") or "unknown")
 
-        mode = self._audit_chain_mode()
         chain_id = derive_chain_id({"run_id": payload["run_id"]}, default="GLOBAL")
-        prev_hash: Optional[str] = None
-        current_hash: Optional[str] = None
-        hash_algo: Optional[str] = None
-
-        with sqlite3.connect(self.db_path) as conn:
-            if mode == "log":
-                prev_hash = self._last_hash_for_chain(conn, "insight_ledger", chain_id)
-                hash_algo = "sha256"
-                current_hash = compute_hash(prev_hash, payload, algo=hash_algo)
 
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO insight_ledger
-                (id, run_id, cycle_id, timestamp, Fs, classification, payload, chain_id, prev_hash, hash, hash_algo)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    payload["id"],
-                    payload["run_id"],
-                    payload["cycle_id"],
-                    payload["timestamp"],
-                    payload["Fs"],
-                    payload["classification"],
-                    json.dumps(payload),
-                    chain_id,
-                    prev_hash,
-                    current_hash,
-                    hash_algo,
-                ),
+        with self._ledger_write() as conn:
+            self._append_chain_row(
+                conn,
+                "insight_ledger",
+                chain_id,
+                {
+                    "id": payload["id"],
+                    "run_id": payload["run_id"],
+                    "cycle_id": payload["cycle_id"],
+                    "timestamp": payload["timestamp"],
+                    "Fs": payload["Fs"],
+                    "classification": payload["classification"],
+                    "payload": json.dumps(payload),
+                },
+                payload,
             )
-            conn.commit()
         return payload
 
     def load_reflect_decisions(self, run_id: str, limit: int = 50) -> List[Dict[str, Any]]:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._pool.read() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -697,7 +932,7 @@ class PersistentStateManager:
         return [json.loads(row[0]) for row in reversed(rows)]
 
     def verify_reflect_chain(self, run_id: str, limit: int = 200) -> Dict[str, Any]:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._pool.read() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -734,39 +969,25 @@ class PersistentStateManager:
         payload["run_id"] = str(payload.get("run_id") or "GLOBAL")
         payload["timestamp"] = str(payload.get("timestamp") or datetime.now(timezone.utc).isoformat())
 
-        mode = self._audit_chain_mode()
         chain_id = derive_chain_id({"run_id": payload["run_id"]}, default="GLOBAL")
-        prev_hash: Optional[str] = None
-        current_hash: Optional[str] = None
-        hash_algo: Optional[str] = None
 
-        with sqlite3.connect(self.db_path) as conn:
-            if mode == "log":
-                prev_hash = self._last_hash_for_chain(conn, "lambda_history", chain_id)
-                hash_algo = "sha256"
-                current_hash = compute_hash(prev_hash, payload, algo=hash_algo)
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO lambda_history
-                (id, run_id, timestamp, payload, chain_id, prev_hash, hash, hash_algo)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    payload["id"],
-                    payload["run_id"],
-                    payload["timestamp"],
-                    json.dumps(payload),
-                    chain_id,
-                    prev_hash,
-                    current_hash,
-                    hash_algo,
-                ),
+        with self._ledger_write() as conn:
+            self._append_chain_row(
+                conn,
+                "lambda_history",
+                chain_id,
+                {
+                    "id": payload["id"],
+                    "run_id": payload["run_id"],
+                    "timestamp": payload["timestamp"],
+                    "payload": json.dumps(payload),
+                },
+                payload,
             )
-            conn.commit()
         return payload
 
     def load_lambda_history(self, run_id: str, limit: int = 50) -> List[Dict[str, Any]]:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._pool.read() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -782,7 +1003,7 @@ class PersistentStateManager:
         return [json.loads(row[0]) for row in reversed(rows)]
 
     def verify_lambda_chain(self, run_id: str, limit: int = 200) -> Dict[str, Any]:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._pool.read() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -812,42 +1033,30 @@ class PersistentStateManager:
         payload["mean"] = float(payload.get("posterior_mean", payload.get("mean", 0.5)))
         payload["uncertainty"] = float(payload.get("posterior_uncertainty", payload.get("uncertainty", 1.0)))
 
-        mode = self._audit_chain_mode()
         chain_id = derive_chain_id({"run_id": payload["run_id"]}, default="GLOBAL")
-        prev_hash: Optional[str] = None
-        current_hash: Optional[str] = None
-        hash_algo: Optional[str] = None
-        with sqlite3.connect(self.db_path) as conn:
-            if mode == "log":
-                prev_hash = self._last_hash_for_chain(conn, "bayes_posteriors", chain_id)
-                hash_algo = "sha256"
-                current_hash = compute_hash(prev_hash, payload, algo=hash_algo)
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO bayes_posteriors
-                (id, run_id, timestamp, alpha, beta, mean, uncertainty, payload, chain_id, prev_hash, hash, hash_algo)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    payload["id"],
-                    payload["run_id"],
-                    payload["timestamp"],
-                    payload["alpha"],
-                    payload["beta"],
-                    payload["mean"],
-                    payload["uncertainty"],
-                    json.dumps(payload),
-                    chain_id,
-                    prev_hash,
-                    current_hash,
-                    hash_algo,
-                ),
+
+        with self._ledger_write() as conn:
+            self._append_chain_row(
+                conn,
+                "bayes_posteriors",
+                chain_id,
+                {
+                    "id": payload["id"],
+                    "run_id": payload["run_id"],
+                    "timestamp": payload["timestamp"],
+                    "alpha": payload["alpha"],
+                    "beta": payload["beta"],
+                    "mean": payload["mean"],
+                    "uncertainty": payload["uncertainty"],
+                    "payload": json.dumps(payload),
+                },
+                payload,
             )
-            conn.commit()
+            self._note_latest_record("bayes_posteriors", payload["run_id"], json.loads(json.dumps(payload)))
         return payload
 
     def load_bayes_posteriors(self, run_id: str, limit: int = 50) -> List[Dict[str, Any]]:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._pool.read() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -863,7 +1072,7 @@ class PersistentStateManager:
         return [json.loads(row[0]) for row in reversed(rows)]
 
     def verify_bayes_chain(self, run_id: str, limit: int = 200) -> Dict[str, Any]:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._pool.read() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -892,41 +1101,28 @@ class PersistentStateManager:
         payload["consensus_Fs"] = float(payload.get("consensus_Fs", 0.0))
         payload["disagreement"] = float(payload.get("disagreement", 0.0))
 
-        mode = self._audit_chain_mode()
         chain_id = derive_chain_id({"run_id": payload["run_id"]}, default="GLOBAL")
-        prev_hash: Optional[str] = None
-        current_hash: Optional[str] = None
-        hash_algo: Optional[str] = None
-        with sqlite3.connect(self.db_path) as conn:
-            if mode == "log":
-                prev_hash = self._last_hash_for_chain(conn, "consensus_insights", chain_id)
-                hash_algo = "sha256"
-                current_hash = compute_hash(prev_hash, payload, algo=hash_algo)
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO consensus_insights
-                (id, run_id, cycle_id, timestamp, consensus_Fs, disagreement, payload, chain_id, prev_hash, hash, hash_algo)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    payload["id"],
-                    payload["run_id"],
-                    payload["cycle_id"],
-                    payload["timestamp"],
-                    payload["consensus_Fs"],
-                    payload["disagreement"],
-                    json.dumps(payload),
-                    chain_id,
-                    prev_hash,
-                    current_hash,
-                    hash_algo,
-                ),
+
+        with self._ledger_write() as conn:
+            self._append_chain_row(
+                conn,
+                "consensus_insights",
+                chain_id,
+                {
+                    "id": payload["id"],
+                    "run_id": payload["run_id"],
+                    "cycle_id": payload["cycle_id"],
+                    "timestamp": payload["timestamp"],
+                    "consensus_Fs": payload["consensus_Fs"],
+                    "disagreement": payload["disagreement"],
+                    "payload": json.dumps(payload),
+                },
+                payload,
             )
-            conn.commit()
         return payload
 
     def load_consensus_insights(self, run_id: str, limit: int = 50) -> List[Dict[str, Any]]:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._pool.read() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -942,7 +1138,7 @@ class PersistentStateManager:
         return [json.loads(row[0]) for row in reversed(rows)]
 
     def verify_consensus_chain(self, run_id: str, limit: int = 200) -> Dict[str, Any]:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._pool.read() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -969,7 +1165,7 @@ class PersistentStateManager:
             if requested_chain.startswith("telemetry:")
             else f"telemetry:{requested_chain.split(':', 1)[0]}"
         )
-        with sqlite3.connect(self.db_path) as conn:
+        with self._pool.read() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -1019,7 +1215,7 @@ class PersistentStateManager:
             if requested_chain.startswith("telemetry:")
             else f"telemetry:{requested_chain.split(':', 1)[0]}"
         )
-        with sqlite3.connect(self.db_path) as conn:
+        with self._pool.read() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -5,21 +5,32 @@ Provides:
 - In-memory ring buffers for events and cycles
 - Thread-safe publish/subscribe for SSE clients
 - Query helpers for events since timestamp and recent cycles
+- Write-behind persistence: a background writer drains a bounded queue and
+  commits events/cycles to the state manager in batches
+- Per-run rolling windows of recent cycles/events for reflect, kept current on
+  publish so the governance loop does not reload them from SQLite each cycle
 """
 
 from __future__ import annotations
 
-from collections import deque
+from collections import OrderedDict, deque
+from contextlib import ExitStack, contextmanager, nullcontext
 from datetime import datetime, timezone
 import queue
 import threading
+import time
 import uuid
-from typing import Deque, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from pydantic import TypeAdapter
 
 from syntropiq.api.schemas import GovernanceCycleResponseV1, GovernanceEventV1
 from syntropiq.core.context import get_request_id
 
 
+_EVENT_LIST_ADAPTER = TypeAdapter(List[GovernanceEventV1])
+
+
 def parse_iso_timestamp(value: str) -> datetime:
     """Parse ISO timestamp with optional trailing Z into aware UTC datetime."""
     normalized = value.strip()
@@ -31,21 +42,91 @@ def parse_iso_timestamp(value: str) -> datetime:
     return parsed.astimezone(timezone.utc)
 
 
+OVERFLOW_POLICIES = {"block", "drop"}
+
+# Striped per-run locks: a cold run_window seed blocks publishers of its own
+# run only, not the whole hub.
+_RUN_LOCK_STRIPES = 64
+
+
+def _run_root(run_id: Any) -> str:
+    # Mirrors the telemetry ledger's chain id so windows match load_*_by_run_id.
+    run_text = str(run_id).strip() if run_id is not None else ""
+    return run_text.split(":", 1)[0] if run_text else "GLOBAL"
+
+
+class _RunWindow:
+    """Most recent cycles/events of one run, oldest first."""
+
+    __slots__ = ("cycles", "events")
+
+    def __init__(self, cycle_limit: int, event_limit: int):
+        self.cycles: Deque[Dict[str, Any]] = deque(maxlen=cycle_limit)
+        self.events: Deque[Dict[str, Any]] = deque(maxlen=event_limit)
+
+
 class GovernanceTelemetryHub:
     """Thread-safe in-memory telemetry store + stream fanout."""
 
-    def __init__(self, max_events: int = 2000, max_cycles: int = 500, state_manager=None):
+    def __init__(
+        self,
+        max_events: int = 2000,
+        max_cycles: int = 500,
+        state_manager=None,
+        flush_interval: float = 0.05,
+        max_pending_writes: int = 10000,
+        max_write_batch: int = 500,
+        overflow: str = "block",
+        max_run_windows: int = 64,
+        window_cycles: int = 50,
+        window_events: int = 200,
+        bayes_tracker: Any = None,
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {sorted(OVERFLOW_POLICIES)}, got {overflow!r}")
+
         self._state_manager = state_manager
         self._events: Deque[GovernanceEventV1] = deque(maxlen=max_events)
         self._cycles: Deque[GovernanceCycleResponseV1] = deque(maxlen=max_cycles)
         self._subscribers: Dict[str, queue.Queue[GovernanceEventV1]] = {}
         self._lock = threading.Lock()
+        # Reflect windows, LRU-bounded by run. Only seeded runs are tracked, so a
+        # window never holds a partial history.
+        self._run_windows: "OrderedDict[str, _RunWindow]" = OrderedDict()
+        self._max_run_windows = max(1, int(max_run_windows))
+        self._window_cycles = max(1, int(window_cycles))
+        self._window_events = max(1, int(window_events))
+        # Optional BayesPosteriorTracker kept current as cycles are recorded.
+        self.bayes_tracker = bayes_tracker
         self._metrics = {
             "execute_calls": 0,
             "suppression_events": 0,
             "circuit_trips": 0,
         }
 
+        # Write-behind persistence. Publishers only enqueue; the writer thread
+        # owns every state-manager write so ledger order matches enqueue order.
+        self._flush_interval = float(flush_interval)
+        self._max_write_batch = max(1, int(max_write_batch))
+        self._overflow = overflow
+        self._write_queue: queue.Queue[Tuple[str, Dict[str, Any]]] = queue.Queue(maxsize=max(1, int(max_pending_writes)))
+        self._enqueue_lock = threading.Lock()
+        self._run_locks = tuple(threading.Lock() for _ in range(_RUN_LOCK_STRIPES))
+        self._writer_cv = threading.Condition()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_stop = False
+        self._unpersisted = 0
+        # Records put on the queue / settled by the writer, in queue order.
+        self._queued_total = 0
+        self._settled_total = 0
+        self._write_stats = {
+            "persisted": 0,
+            "dropped": 0,
+            "blocked": 0,
+            "failed": 0,
+            "batches": 0,
+        }
+
         if self._state_manager is not None:
             try:
                 persisted_events = self._state_manager.load_recent_events()
@@ -59,50 +140,61 @@ class GovernanceTelemetryHub:
                 pass
 
     def publish_event(self, event: GovernanceEventV1 | dict) -> GovernanceEventV1:
-        payload = (
-            event
-            if isinstance(event, GovernanceEventV1)
-            else GovernanceEventV1.model_validate(event)
-        )
+        return self.publish_events([event])[0]
+
+    def publish_events(self, events: Iterable[GovernanceEventV1 | dict]) -> List[GovernanceEventV1]:
+        """
+        Publish a batch of events: validate once, append under a single lock
+        acquisition, fan out to subscribers and enqueue one persistence batch.
+        """
+        items = list(events)
+        if not items:
+            return []
+        raw = [item for item in items if not isinstance(item, GovernanceEventV1)]
+        validated = iter(_EVENT_LIST_ADAPTER.validate_python(raw)) if raw else iter(())
+        payloads = [
+            item if isinstance(item, GovernanceEventV1) else next(validated)
+            for item in items
+        ]
 
         request_id = get_request_id()
-        metadata = dict(payload.metadata or {})
-        if request_id:
-            metadata["request_id"] = request_id
-        payload.metadata = metadata
+        for payload in payloads:
+            metadata = dict(payload.metadata or {})
+            if request_id:
+                metadata["request_id"] = request_id
+            payload.metadata = metadata
 
-        event_type = payload.type.value if hasattr(payload.type, "value") else str(payload.type)
+        roots = {_run_root(payload.run_id) for payload in payloads}
+        with self._run_locked(roots), self._enqueue_lock:
+            with self._lock:
+                self._events.extend(payloads)
+                for payload in payloads:
+                    event_type = payload.type.value if hasattr(payload.type, "value") else str(payload.type)
+                    if event_type == "mediation_decision":
+                        self._metrics["execute_calls"] += 1
+                    elif event_type == "suppression":
+                        self._metrics["suppression_events"] += 1
+                    elif event_type == "circuit_breaker":
+                        self._metrics["circuit_trips"] += 1
 
-        with self._lock:
-            self._events.append(payload)
-            if event_type == "mediation_decision":
-                self._metrics["execute_calls"] += 1
-            elif event_type == "suppression":
-                self._metrics["suppression_events"] += 1
-            elif event_type == "circuit_breaker":
-                self._metrics["circuit_trips"] += 1
-
-            if self._state_manager is not None:
-                try:
-                    self._state_manager.save_event(payload.model_dump())
-                except Exception:
-                    pass
-            stale_subscribers: List[str] = []
-            for key, subscriber in self._subscribers.items():
-                try:
-                    subscriber.put_nowait(payload)
-                except queue.Full:
-                    stale_subscribers.append(key)
-            for key in stale_subscribers:
-                self._subscribers.pop(key, None)
+                stale_subscribers: List[str] = []
+                for key, subscriber in self._subscribers.items():
+                    try:
+                        for payload in payloads:
+                            subscriber.put_nowait(payload)
+                    except queue.Full:
+                        stale_subscribers.append(key)
+                for key in stale_subscribers:
+                    self._subscribers.pop(key, None)
+                if self._run_windows:
+                    for payload in payloads:
+                        window = self._run_windows.get(_run_root(payload.run_id))
+                        if window is not None:
+                            window.events.append(payload.model_dump(mode="json"))
 
-        return payload
+            self._enqueue_write("event", [payload.model_dump() for payload in payloads])
 
-    def publish_events(self, events: Iterable[GovernanceEventV1 | dict]) -> List[GovernanceEventV1]:
-        published: List[GovernanceEventV1] = []
-        for event in events:
-            published.append(self.publish_event(event))
-        return published
+        return payloads
 
     def record_cycle(self, cycle: GovernanceCycleResponseV1 | dict) -> GovernanceCycleResponseV1:
         cycle_payload = (
@@ -117,15 +209,233 @@ class GovernanceTelemetryHub:
 
         payload = GovernanceCycleResponseV1.model_validate(cycle_payload)
 
+        with self._run_locked([_run_root(cycle_payload.get("run_id"))]), self._enqueue_lock:
+            with self._lock:
+                self._cycles.append(payload)
+                window = self._run_windows.get(_run_root(cycle_payload.get("run_id")))
+                if window is not None:
+                    window.cycles.append(cycle_payload)
+            if self.bayes_tracker is not None:
+                self.bayes_tracker.observe_cycle(cycle_payload)
+            self._enqueue_write("cycle", [cycle_payload])
+
+        return payload
+
+    def run_window(
+        self, run_id: str, cycle_limit: int = 50, event_limit: int = 200
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Return the most recent ``(cycles, events)`` for ``run_id``, oldest first.
+
+        The first call for a run seeds its window from the state manager; later
+        calls are served from memory, which publish/record_cycle keep current.
+        """
+        cycle_limit = max(0, int(cycle_limit))
+        event_limit = max(0, int(event_limit))
+        root = _run_root(run_id)
         with self._lock:
-            self._cycles.append(payload)
-            if self._state_manager is not None:
+            window = self._run_windows.get(root)
+            if window is not None and cycle_limit <= self._window_cycles and event_limit <= self._window_events:
+                self._run_windows.move_to_end(root)
+                return self._window_slice(window, cycle_limit, event_limit)
+
+        if self._state_manager is None:
+            return [], []
+
+        # Holding this run's lock keeps its publishers out between the flush and
+        # the seed, so nothing is double-counted or missed; other runs keep
+        # publishing.
+        with self._run_locked([root]):
+            seeded = self._flush_queued(timeout=5.0)
+            window = _RunWindow(max(cycle_limit, self._window_cycles), max(event_limit, self._window_events))
+            loader = getattr(self._state_manager, "load_cycles_by_run_id", None)
+            if callable(loader):
+                window.cycles.extend(loader(run_id, limit=window.cycles.maxlen, latest=True))
+            loader = getattr(self._state_manager, "load_events_by_run_id", None)
+            if callable(loader):
+                window.events.extend(loader(run_id, limit=window.events.maxlen, latest=True))
+            if not seeded:
+                # Unpersisted writes are missing from the load; don't cache it.
+                return self._window_slice(window, cycle_limit, event_limit)
+            with self._lock:
+                self._run_windows[root] = window
+                self._run_windows.move_to_end(root)
+                while len(self._run_windows) > self._max_run_windows:
+                    self._run_windows.popitem(last=False)
+                return self._window_slice(window, cycle_limit, event_limit)
+
+    @contextmanager
+    def _run_locked(self, roots: Iterable[str]):
+        # Stripes are taken in index order so multi-run batches cannot deadlock.
+        stripes = sorted({hash(root) % _RUN_LOCK_STRIPES for root in roots})
+        with ExitStack() as stack:
+            for stripe in stripes:
+                stack.enter_context(self._run_locks[stripe])
+            yield
+
+    @staticmethod
+    def _window_slice(
+        window: _RunWindow, cycle_limit: int, event_limit: int
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        cycles = list(window.cycles)[-cycle_limit:] if cycle_limit else []
+        events = list(window.events)[-event_limit:] if event_limit else []
+        return cycles, events
+
+    # ---------------------------------------------------------
+    # WRITE-BEHIND PERSISTENCE
+    # ---------------------------------------------------------
+
+    def _enqueue_write(self, kind: str, records: List[Dict[str, Any]]) -> None:
+        if self._state_manager is None or not records:
+            return
+        self._ensure_writer()
+        with self._writer_cv:
+            self._unpersisted += len(records)
+        try:
+            self._write_queue.put_nowait((kind, records))
+            self._count_queued(len(records))
+            return
+        except queue.Full:
+            pass
+
+        if self._overflow == "drop":
+            with self._writer_cv:
+                self._unpersisted -= len(records)
+                self._write_stats["dropped"] += len(records)
+                self._writer_cv.notify_all()
+            return
+
+        with self._writer_cv:
+            self._write_stats["blocked"] += 1
+        self._write_queue.put((kind, records))
+        self._count_queued(len(records))
+
+    def _count_queued(self, count: int) -> None:
+        with self._writer_cv:
+            self._queued_total += count
+
+    def _ensure_writer(self) -> None:
+        if self._writer_thread is not None and self._writer_thread.is_alive():
+            return
+        with self._writer_cv:
+            if self._writer_thread is not None and self._writer_thread.is_alive():
+                return
+            self._writer_stop = False
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop,
+                name="syntropiq-telemetry-writer",
+                daemon=True,
+            )
+            self._writer_thread.start()
+
+    def _writer_loop(self) -> None:
+        while True:
+            try:
+                first = self._write_queue.get(timeout=self._flush_interval)
+            except queue.Empty:
+                with self._writer_cv:
+                    if self._writer_stop:
+                        return
+                continue
+
+            batch = [first]
+            while len(batch) < self._max_write_batch:
                 try:
-                    self._state_manager.save_cycle(cycle_payload)
+                    batch.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            persisted, failed = self._persist_batch(batch)
+            with self._writer_cv:
+                self._unpersisted -= persisted + failed
+                self._settled_total += persisted + failed
+                self._write_stats["persisted"] += persisted
+                self._write_stats["failed"] += failed
+                self._write_stats["batches"] += 1
+                self._writer_cv.notify_all()
+
+    def _persist_batch(self, batch: List[Tuple[str, List[Dict[str, Any]]]]) -> Tuple[int, int]:
+        total = sum(len(records) for _, records in batch)
+        transaction = getattr(self._state_manager, "transaction", None)
+        try:
+            with transaction() if callable(transaction) else nullcontext():
+                pending_events: List[Dict[str, Any]] = []
+                for kind, records in batch:
+                    if kind == "event":
+                        pending_events.extend(records)
+                        continue
+                    self._save_events(pending_events)
+                    pending_events = []
+                    for record in records:
+                        self._state_manager.save_cycle(record)
+                self._save_events(pending_events)
+            return total, 0
+        except Exception:
+            pass
+
+        # The batch rolled back; fall back to best-effort single writes.
+        persisted = 0
+        for kind, records in batch:
+            for record in records:
+                try:
+                    if kind == "event":
+                        self._state_manager.save_event(record)
+                    else:
+                        self._state_manager.save_cycle(record)
+                    persisted += 1
                 except Exception:
                     pass
+        return persisted, total - persisted
 
-        return payload
+    def _save_events(self, records: List[Dict[str, Any]]) -> None:
+        if not records:
+            return
+        save_events = getattr(self._state_manager, "save_events", None)
+        if callable(save_events):
+            save_events(records)
+            return
+        for record in records:
+            self._state_manager.save_event(record)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued event/cycle is persisted. Returns False on timeout."""
+        return self._wait_for_writer(lambda: self._unpersisted == 0, timeout)
+
+    def _flush_queued(self, timeout: Optional[float] = None) -> bool:
+        """flush() for records already queued; later publishes do not extend the wait."""
+        with self._writer_cv:
+            mark = self._queued_total
+        return self._wait_for_writer(lambda: self._settled_total >= mark, timeout)
+
+    def _wait_for_writer(self, done: Callable[[], bool], timeout: Optional[float]) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._writer_cv:
+            while not done():
+                if self._writer_thread is None or not self._writer_thread.is_alive():
+                    return False
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._writer_cv.wait(remaining if remaining is not None else 0.1)
+        return True
+
+    def close(self, timeout: Optional[float] = 10.0) -> bool:
+        """Flush pending writes and stop the writer thread (FastAPI shutdown hook)."""
+        flushed = self.flush(timeout=timeout)
+        with self._writer_cv:
+            self._writer_stop = True
+            thread = self._writer_thread
+        if thread is not None:
+            thread.join(timeout=max(self._flush_interval * 4, 0.5))
+        return flushed
+
+    def write_stats(self) -> dict:
+        with self._writer_cv:
+            return {
+                **self._write_stats,
+                "queue_depth": self._write_queue.qsize(),
+                "pending": self._unpersisted,
+            }
 
     def get_events_since(self, since: Optional[str] = None) -> List[GovernanceEventV1]:
         with self._lock:
@@ -168,8 +478,11 @@ class GovernanceTelemetryHub:
 
     def stats(self) -> dict:
         with self._lock:
-            return {
+            stats = {
                 "events": len(self._events),
                 "cycles": len(self._cycles),
                 "subscribers": len(self._subscribers),
+                "run_windows": len(self._run_windows),
             }
+        stats["persistence"] = self.write_stats()
+        return stats
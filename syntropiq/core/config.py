@@ -15,9 +15,21 @@ class GovernanceConfig(BaseModel):
     suppression_threshold: float = 0.75
     max_redemption_cycles: int = 4
     drift_detection_delta: float = 0.1
+    drift_detector: str = "last_delta"  # "last_delta" | "ewma" | "cusum" | "page_hinkley"
     asymmetric_reward: float = 0.02  # η
     asymmetric_penalty: float = 0.05  # γ
-    routing_mode: str = "deterministic"  # "deterministic" | "competitive"
+    routing_mode: str = "deterministic"  # "deterministic" | "competitive" | "capacity"
+    agent_capacity: int = 1  # Max tasks per agent per cycle in "capacity" routing mode
+    routing_seed: Optional[int] = None  # Seeds competitive draws per cycle (re-runs repeat routing); None = global random
+    dispatch_concurrency: int = 1  # Max parallel executor calls per cycle (1 = sequential)
+    profile_every: int = 0  # Profile every Nth cycle with cProfile/tracemalloc (0 = off)
+    trust_engine_backend: str = "python"  # "python" | "array" (NumPy, large agent pools)
+    idle_decay_half_life: float = 0.0  # Seconds for idle trust above the floor to halve (0 = off)
+    idle_decay_floor: float = 0.5  # Idle decay never takes trust below this
+    task_backlog: bool = False  # Defer unassignable tasks to a persistent backlog instead of failing
+    backlog_aging_rate: float = 0.05  # Backlog priority gained per cycle waited
+    run_state_max_entries: int = 10000  # Per-run adaptation/healing states cached in memory
+    run_state_ttl: float = 0.0  # Evict cached per-run state idle this many seconds (0 = never)
 
 
 class DatabaseConfig(BaseModel):
@@ -25,6 +37,10 @@ class DatabaseConfig(BaseModel):
     db_path: str = "governance_state.db"
     connection_pool_size: int = 5
     enable_wal: bool = True  # Write-Ahead Logging for better concurrency
+    synchronous: str = "NORMAL"  # PRAGMA synchronous (OFF, NORMAL, FULL, EXTRA)
+    cache_size: int = -16000  # PRAGMA cache_size (negative = KiB)
+    mmap_size: int = 134217728  # PRAGMA mmap_size in bytes (0 disables)
+    busy_timeout: float = 30.0  # seconds to wait on a locked database
 
 
 class ExecutorConfig(BaseModel):
@@ -59,10 +75,29 @@ class SyntropiqConfig(BaseModel):
                 suppression_threshold=float(os.getenv("SUPPRESSION_THRESHOLD", 0.75)),
                 max_redemption_cycles=int(os.getenv("MAX_REDEMPTION_CYCLES", 4)),
                 drift_detection_delta=float(os.getenv("DRIFT_DETECTION_DELTA", 0.1)),
+                drift_detector=os.getenv("DRIFT_DETECTOR", "last_delta"),
+                asymmetric_reward=float(os.getenv("ASYMMETRIC_REWARD", 0.02)),
+                asymmetric_penalty=float(os.getenv("ASYMMETRIC_PENALTY", 0.05)),
                 routing_mode=os.getenv("ROUTING_MODE", "deterministic"),
+                agent_capacity=int(os.getenv("AGENT_CAPACITY", 1)),
+                routing_seed=int(os.environ["ROUTING_SEED"]) if os.getenv("ROUTING_SEED") else None,
+                dispatch_concurrency=int(os.getenv("DISPATCH_CONCURRENCY", 1)),
+                profile_every=int(os.getenv("CYCLE_PROFILE_EVERY", 0)),
+                trust_engine_backend=os.getenv("TRUST_ENGINE_BACKEND", "python"),
+                idle_decay_half_life=float(os.getenv("TRUST_IDLE_HALF_LIFE", 0.0)),
+                idle_decay_floor=float(os.getenv("TRUST_IDLE_FLOOR", 0.5)),
+                task_backlog=os.getenv("TASK_BACKLOG", "false").lower() == "true",
+                backlog_aging_rate=float(os.getenv("BACKLOG_AGING_RATE", 0.05)),
+                run_state_max_entries=int(os.getenv("RUN_STATE_MAX_ENTRIES", 10000)),
+                run_state_ttl=float(os.getenv("RUN_STATE_TTL", 0.0)),
             ),
             database=DatabaseConfig(
                 db_path=os.getenv("DB_PATH", "governance_state.db"),
+                connection_pool_size=int(os.getenv("DB_POOL_SIZE", 5)),
+                enable_wal=os.getenv("DB_ENABLE_WAL", "true").lower() == "true",
+                synchronous=os.getenv("DB_SYNCHRONOUS", "NORMAL"),
+                cache_size=int(os.getenv("DB_CACHE_SIZE", -16000)),
+                mmap_size=int(os.getenv("DB_MMAP_SIZE", 134217728)),
             ),
             executor=ExecutorConfig(
                 openai_api_key=os.getenv("OPENAI_API_KEY"),
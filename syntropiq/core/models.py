@@ -1,4 +1,6 @@
-from typing import List, Optional
+import threading
+import weakref
+from typing import Callable, List, Optional
 from pydantic import BaseModel
 
 class Task(BaseModel):
@@ -8,12 +10,43 @@ class Task(BaseModel):
     risk: float
     metadata: Optional[dict] = {}
 
+# Observers notified after an Agent's trust_score or status is assigned in place
+_OBSERVED_AGENT_FIELDS = frozenset({"trust_score", "status"})
+_agent_observers: List[weakref.WeakMethod] = []
+_agent_observers_lock = threading.Lock()
+
+
+def add_agent_observer(callback: Callable[["Agent", str], None]) -> None:
+    """
+    Call ``callback(agent, field)`` whenever any Agent's ``trust_score`` or
+    ``status`` is assigned. ``callback`` must be a bound method; it is held
+    weakly, so observers go away with their owner.
+    """
+    with _agent_observers_lock:
+        _agent_observers.append(weakref.WeakMethod(callback))
+
+
+def _notify_agent_observers(agent: "Agent", field: str) -> None:
+    with _agent_observers_lock:
+        callbacks = [ref() for ref in _agent_observers]
+        if None in callbacks:
+            _agent_observers[:] = [ref for ref, cb in zip(_agent_observers, callbacks) if cb is not None]
+    for callback in callbacks:
+        if callback is not None:
+            callback(agent, field)
+
+
 class Agent(BaseModel):
     id: str
     trust_score: float
     capabilities: List[str]
     status: str
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if _agent_observers and name in _OBSERVED_AGENT_FIELDS:
+            _notify_agent_observers(self, name)
+
 class Assignment(BaseModel):
     task_id: str
     agent_id: str
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import random
 from dataclasses import asdict, dataclass
 from typing import Any, Dict, List, Optional
 
@@ -160,6 +161,17 @@ def load_run_artifacts(state_manager: Any, run_id: str) -> Dict[str, Any]:
     }
 
 
+def routing_rng(seed: int, cycle_id: str) -> random.Random:
+    """
+    Random source for competitive routing in one cycle.
+
+    GovernanceLoop(routing_seed=seed) draws from this stream, so re-running
+    the same tasks and agents with the same seed and run_id reproduces every
+    draw. replay_run does not re-execute cycles and does not use it.
+    """
+    return random.Random(f"{seed}:{cycle_id}")
+
+
 def replay_run(run_artifacts: Dict[str, Any], seed: Optional[int] = None, mode: str = "light") -> Dict[str, Any]:
     # seed reserved for future full-fidelity replay harness.
     _ = seed
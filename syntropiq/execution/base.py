@@ -5,6 +5,7 @@ Abstract interface that all executors must implement.
 Allows Syntropiq to work with different execution backends (LLMs, functions, APIs, etc.)
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from syntropiq.core.models import Task, Agent, ExecutionResult
 
@@ -34,6 +35,15 @@ class BaseExecutor(ABC):
             ExecutionResult with success status, latency, and metadata
         """
         pass
+
+    async def aexecute(self, task: Task, agent: Agent) -> ExecutionResult:
+        """
+        Async variant of execute().
+
+        Executors with a native async client (HTTP, LLM SDKs) should override
+        this. The default runs execute() in a worker thread.
+        """
+        return await asyncio.to_thread(self.execute, task, agent)
     
     @abstractmethod
     def validate_agent(self, agent: Agent) -> bool:
@@ -0,0 +1,411 @@
+"""
+Array-Backed Trust Engine - Vectorized Assignment for Large Agent Pools
+
+Drop-in variant of SyntropiqTrustEngine for fleet-scale simulations:
+- Agent IDs map to dense indices
+- Trust history lives in a 2D ring buffer (agents x window)
+- Drift, suppression and probation state are held in arrays/masks
+- Drift detection, filtering and ranking are vectorized; only agents whose
+  suppression state changes this cycle take the per-agent Python path
+
+Assignments match SyntropiqTrustEngine for the same inputs, including tie
+order and the random stream consumed in competitive mode. Requires NumPy.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from syntropiq.core.exceptions import InvalidConfiguration
+from syntropiq.core.models import Agent, Assignment, Task
+from syntropiq.governance.drift_detectors import DriftDetector
+from syntropiq.governance.trust_decay import IdleTrustDecay
+from syntropiq.governance.trust_engine import SyntropiqTrustEngine
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+if TYPE_CHECKING:
+    from syntropiq.persistence.state_manager import PersistentStateManager
+
+
+class _MirroredDict(dict):
+    """
+    Agent-id -> cycle-count dict whose entries are mirrored into engine
+    arrays, so the healing reflex and API can keep editing
+    ``suppressed_agents`` / ``probation_agents`` as plain dicts.
+    """
+
+    def __init__(self, engine: "ArrayTrustEngine", field: str, initial: Optional[Dict[str, int]] = None):
+        super().__init__()
+        self._engine = engine
+        self._field = field
+        if initial:
+            self.update(initial)
+
+    def __setitem__(self, key: str, value: int) -> None:
+        super().__setitem__(key, value)
+        self._engine._mirror(self._field, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._engine._mirror(self._field, key, None)
+
+    def pop(self, key: str, *default: Any) -> Any:
+        present = key in self
+        value = super().pop(key, *default)
+        if present:
+            self._engine._mirror(self._field, key, None)
+        return value
+
+    def popitem(self) -> Tuple[str, int]:
+        key, value = super().popitem()
+        self._engine._mirror(self._field, key, None)
+        return key, value
+
+    def setdefault(self, key: str, default: int = 0) -> int:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        for key in list(self):
+            del self[key]
+
+
+class ArrayTrustEngine(SyntropiqTrustEngine):
+    """
+    Trust engine with array-backed history, drift and suppression state.
+    """
+
+    INITIAL_CAPACITY = 1024
+
+    def __init__(
+        self,
+        trust_threshold: float = 0.7,
+        suppression_threshold: Optional[float] = None,
+        drift_delta: float = 0.1,
+        state_manager: Optional["PersistentStateManager"] = None,
+        routing_mode: str = "deterministic",
+        agent_capacity: int = 1,
+        rng: Optional[Any] = None,
+        drift_detector: Optional[DriftDetector] = None,
+        idle_decay: Optional[IdleTrustDecay] = None
+    ):
+        if np is None:
+            raise InvalidConfiguration("numpy package not installed. Run: pip install numpy")
+
+        self._index: Dict[str, int] = {}
+        self._ids: List[str] = []
+        self._allocate(self.INITIAL_CAPACITY)
+        self._cached_keys: Tuple[str, ...] = ()
+        self._cached_idx = np.empty(0, dtype=np.intp)
+
+        super().__init__(
+            trust_threshold=trust_threshold,
+            suppression_threshold=suppression_threshold,
+            drift_delta=drift_delta,
+            state_manager=state_manager,
+            routing_mode=routing_mode,
+            agent_capacity=agent_capacity,
+            rng=rng,
+            drift_detector=drift_detector,
+            idle_decay=idle_decay,
+        )
+
+    # ---------------------------------------------------------
+    # DENSE STORAGE
+    # ---------------------------------------------------------
+
+    _ARRAYS = (
+        "_history", "_head", "_count", "_drift", "_drift_known",
+        "_suppressed", "_suppression_cycles", "_on_probation",
+    )
+
+    def _allocate(self, capacity: int) -> None:
+        window = self.TRUST_HISTORY_WINDOW
+        self._history = np.zeros((capacity, window), dtype=np.float64)
+        self._head = np.zeros(capacity, dtype=np.intp)  # next ring slot per agent
+        self._count = np.zeros(capacity, dtype=np.intp)
+        self._drift = np.zeros(capacity, dtype=bool)
+        self._drift_known = np.zeros(capacity, dtype=bool)  # key present in drift_warnings
+        self._suppressed = np.zeros(capacity, dtype=bool)
+        self._suppression_cycles = np.zeros(capacity, dtype=np.int64)
+        self._on_probation = np.zeros(capacity, dtype=bool)
+
+    def _grow(self) -> None:
+        old = [getattr(self, name) for name in self._ARRAYS]
+        size = len(self._ids)
+        self._allocate(max(self.INITIAL_CAPACITY, 2 * self._history.shape[0]))
+        for name, prev in zip(self._ARRAYS, old):
+            getattr(self, name)[:size] = prev[:size]
+
+    def _mirror(self, field: str, agent_id: str, value: Optional[int]) -> None:
+        index = self._register(agent_id)
+        if field == "suppressed":
+            self._suppressed[index] = value is not None
+            self._suppression_cycles[index] = value or 0
+        else:
+            self._on_probation[index] = value is not None
+
+    def _register(self, agent_id: str) -> int:
+        index = self._index.get(agent_id)
+        if index is None:
+            if len(self._ids) == self._history.shape[0]:
+                self._grow()
+            index = len(self._ids)
+            self._index[agent_id] = index
+            self._ids.append(agent_id)
+        return index
+
+    def _indices_for(self, agents: Dict[str, Agent]):
+        keys = tuple(agents)
+        if keys != self._cached_keys:
+            self._cached_idx = np.fromiter(
+                (self._register(agent_id) for agent_id in keys), dtype=np.intp, count=len(keys)
+            )
+            self._cached_keys = keys
+        return self._cached_idx
+
+    def _history_list(self, index: int) -> List[float]:
+        count = int(self._count[index])
+        head = int(self._head[index])
+        window = self.TRUST_HISTORY_WINDOW
+        return [float(self._history[index, (head - count + k) % window]) for k in range(count)]
+
+    # ---------------------------------------------------------
+    # DICT VIEWS (compatibility with SyntropiqTrustEngine)
+    # ---------------------------------------------------------
+
+    @property
+    def trust_history(self) -> Dict[str, List[float]]:
+        return {
+            agent_id: self._history_list(index)
+            for agent_id, index in self._index.items()
+            if self._count[index] > 0
+        }
+
+    @trust_history.setter
+    def trust_history(self, value: Dict[str, List[float]]) -> None:
+        self._count[:] = 0
+        self._head[:] = 0
+        for agent_id, history in value.items():
+            index = self._register(agent_id)
+            for score in list(history)[-self.TRUST_HISTORY_WINDOW:]:
+                self._push(index, float(score))
+
+    @property
+    def suppressed_agents(self) -> Dict[str, int]:
+        return self._suppressed_agents
+
+    @suppressed_agents.setter
+    def suppressed_agents(self, value: Dict[str, int]) -> None:
+        self._suppressed[:] = False
+        self._suppression_cycles[:] = 0
+        self._suppressed_agents = _MirroredDict(self, "suppressed", value)
+
+    @property
+    def probation_agents(self) -> Dict[str, int]:
+        return self._probation_agents
+
+    @probation_agents.setter
+    def probation_agents(self, value: Dict[str, int]) -> None:
+        self._on_probation[:] = False
+        self._probation_agents = _MirroredDict(self, "probation", value)
+
+    @property
+    def drift_warnings(self) -> Dict[str, bool]:
+        return {
+            agent_id: bool(self._drift[index])
+            for agent_id, index in self._index.items()
+            if self._drift_known[index]
+        }
+
+    @drift_warnings.setter
+    def drift_warnings(self, value: Dict[str, bool]) -> None:
+        self._drift[:] = False
+        self._drift_known[:] = False
+        for agent_id, flag in value.items():
+            index = self._register(agent_id)
+            self._drift[index] = bool(flag)
+            self._drift_known[index] = True
+
+    def _push(self, index: int, score: float) -> None:
+        head = int(self._head[index])
+        self._history[index, head] = score
+        self._head[index] = (head + 1) % self.TRUST_HISTORY_WINDOW
+        self._count[index] = min(int(self._count[index]) + 1, self.TRUST_HISTORY_WINDOW)
+
+    # ---------------------------------------------------------
+    # PUBLIC ENTRYPOINT
+    # ---------------------------------------------------------
+
+    def assign_agents(
+        self,
+        tasks: List[Task],
+        agents: Dict[str, Agent]
+    ) -> List[Assignment]:
+
+        agent_list = list(agents.values())
+        self._apply_idle_decay(agent_list)
+        idx = self._indices_for(agents)
+        trust = np.fromiter((a.trust_score for a in agent_list), dtype=np.float64, count=len(agent_list))
+
+        self._append_history(idx, trust)
+        if self.drift_detector is not None:
+            self._observe_drift(agent_list, idx)
+        else:
+            self._detect_drift()
+
+        active, probation = self._filter_masks(agent_list, idx, trust)
+
+        # Circuit breaker
+        if not active.any() and not probation.any():
+            raise RuntimeError(
+                "No trusted agents available — system halted to avoid unsafe execution."
+            )
+
+        drifting = self._drift[idx] & self._drift_known[idx]
+        ranked_active = self._rank(agent_list, trust, active, drifting)
+        ranked_probation = self._rank(agent_list, trust, probation, None)
+
+        restricted = None
+        if any(self.required_capabilities(task) for task in tasks):
+            restricted = self._capability_rankings(
+                tasks,
+                [agent_list[p] for p in np.flatnonzero(active)],
+                [agent_list[p] for p in np.flatnonzero(probation)],
+                {agent_list[p].id for p in np.flatnonzero(active & drifting)},
+            )
+        return self._route_tasks(tasks, ranked_active, ranked_probation, restricted)
+
+    # ---------------------------------------------------------
+    # TRUST HISTORY + DRIFT
+    # ---------------------------------------------------------
+
+    def _append_history(self, idx, trust) -> None:
+        head = self._head[idx]
+        self._history[idx, head] = trust
+        self._head[idx] = (head + 1) % self.TRUST_HISTORY_WINDOW
+        self._count[idx] = np.minimum(self._count[idx] + 1, self.TRUST_HISTORY_WINDOW)
+
+    def _detect_drift(self) -> None:
+        size = len(self._ids)
+        rows = np.flatnonzero(self._count[:size] >= 2)
+        if rows.size == 0:
+            return
+        head = self._head[rows]
+        window = self.TRUST_HISTORY_WINDOW
+        delta = self._history[rows, (head - 1) % window] - self._history[rows, (head - 2) % window]
+
+        dropped = rows[delta < -self.drift_delta]
+        recovered = rows[delta > 0]
+        self._drift[dropped] = True
+        self._drift[recovered] = False
+        self._drift_known[dropped] = True
+        self._drift_known[recovered] = True
+
+    def _observe_drift(self, agent_list: List[Agent], idx) -> None:
+        """Feed a streaming drift detector; its per-agent state is not vectorized."""
+        observe = self.drift_detector.observe
+        for agent, index in zip(agent_list, idx.tolist()):
+            drifting = observe(agent.id, agent.trust_score, self.drift_delta)
+            if drifting is not None:
+                self._drift[index] = drifting
+                self._drift_known[index] = True
+
+    # ---------------------------------------------------------
+    # SUPPRESSION + REDEMPTION
+    # ---------------------------------------------------------
+
+    def _filter_masks(self, agent_list: List[Agent], idx, trust):
+        """
+        Vectorized _filter_agents: returns (active, probation) masks over
+        agent_list. Bookkeeping runs per agent only where suppression state
+        changes: new suppressions, recoveries, redemption ticks and the first
+        cycle of permanent exclusion.
+        """
+        suppressed = self._suppressed[idx]
+        cycles = self._suppression_cycles[idx]
+        below = trust < self.suppression_threshold
+
+        recovered = suppressed & ~below
+        redeeming = suppressed & below & (cycles <= self.MAX_REDEMPTION_CYCLES)
+        newly_excluded = suppressed & below & (cycles > self.MAX_REDEMPTION_CYCLES) & self._on_probation[idx]
+        newly_suppressed = ~suppressed & below
+
+        active = (~suppressed & ~below & (trust >= self.trust_threshold)) | recovered
+        probation = redeeming | newly_suppressed
+
+        changed = recovered | redeeming | newly_excluded | newly_suppressed
+        for p in np.flatnonzero(changed):
+            agent = agent_list[p]
+            agent_id = agent.id
+            if recovered[p]:
+                del self.suppressed_agents[agent_id]
+                self.probation_agents.pop(agent_id, None)
+                self._drift_known[idx[p]] = False
+                if self.drift_detector is not None:
+                    self.drift_detector.reset(agent_id)
+                agent.status = "active"
+                if self.state_manager:
+                    self.state_manager.update_agent_status(agent_id, "active")
+            elif redeeming[p]:
+                self.suppressed_agents[agent_id] += 1
+                self.probation_agents[agent_id] = self.suppressed_agents[agent_id]
+            elif newly_excluded[p]:
+                # Permanently excluded
+                self.probation_agents.pop(agent_id, None)
+            else:
+                self.suppressed_agents[agent_id] = 1
+                self.probation_agents[agent_id] = 1
+                agent.status = "suppressed"
+                if self.state_manager:
+                    self.state_manager.update_agent_status(agent_id, "suppressed")
+
+        return active, probation
+
+    # ---------------------------------------------------------
+    # TRUST-RANKED ROUTING
+    # ---------------------------------------------------------
+
+    def _rank(self, agent_list: List[Agent], trust, mask, drifting) -> List[Agent]:
+        """
+        Candidates ordered healthy-before-drifting, then by trust descending,
+        then by registry order (the stable-sort order of the base engine).
+
+        Deterministic routing only ever uses the head, so it is found with an
+        argmax instead of a full sort; competitive and capacity routing need
+        the full order.
+        """
+        positions = np.flatnonzero(mask)
+        if positions.size == 0:
+            return []
+
+        if self.routing_mode == "deterministic":
+            if drifting is not None:
+                healthy = positions[~drifting[positions]]
+                if healthy.size:
+                    positions = healthy
+            return [agent_list[positions[np.argmax(trust[positions])]]]
+
+        keys = (-trust[positions],) if drifting is None else (-trust[positions], drifting[positions])
+        order = positions[np.lexsort(keys)]
+        return [agent_list[p] for p in order]
+
+    # ---------------------------------------------------------
+    # STATUS INTROSPECTION
+    # ---------------------------------------------------------
+
+    def get_agent_status(self, agent_id: str) -> Dict:
+        index = self._index.get(agent_id)
+        return {
+            "trust_history": self._history_list(index) if index is not None else [],
+            "is_suppressed": agent_id in self.suppressed_agents,
+            "suppression_cycles": self.suppressed_agents.get(agent_id, 0),
+            "is_drifting": bool(self._drift[index] and self._drift_known[index]) if index is not None else False,
+        }
@@ -0,0 +1,235 @@
+"""
+Task Backlog - Persistent Priority Queue Across Cycles
+
+Tasks that cannot be assigned in the cycle they are submitted (agents at
+capacity, risk ceilings, capability gaps, an open circuit breaker) wait in
+a per-run backlog instead of failing. Each cycle drains the backlog in
+priority order, as far as routing capacity allows.
+
+Priority is the prioritizer's weighted score plus an aging term:
+
+    priority = score + aging_rate * (tick - enqueued_tick)
+
+where ``tick`` counts cycles for the run. The ``aging_rate * tick`` part is
+shared by every queued task, so the heap is keyed on the static
+``score - aging_rate * enqueued_tick`` and never needs re-keying; ties keep
+submission order. Entries are written through to SQLite (``task_backlog``)
+in the cycle transaction and reloaded lazily per run after a restart.
+
+Delivery is at-least-once: drained tasks are only in flight until the loop
+reports the cycle complete (``complete``), and their rows stay in SQLite
+until then. A cycle that fails before completion hands them back
+(``release``); after a crash they are reloaded with the rest of the run.
+
+Queues with nothing waiting or in flight are dropped from memory at the
+start of the next cycle (and their persisted clock is deleted once no rows
+remain), so the number of distinct run ids seen does not grow memory or
+the tick table.
+"""
+
+import heapq
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+
+from syntropiq.core.models import Task
+from syntropiq.governance.prioritizer import OptimusPrioritizer
+
+if TYPE_CHECKING:
+    from syntropiq.persistence.state_manager import PersistentStateManager
+
+# Heap entry: (-priority_key, seq, task_id, enqueued_tick); seq is unique
+_Entry = Tuple[float, int, str, int]
+
+
+@dataclass
+class _RunQueue:
+    tick: int = 0
+    seq: int = 0
+    heap: List[_Entry] = field(default_factory=list)
+    tasks: Dict[str, Task] = field(default_factory=dict)
+    stored: Set[str] = field(default_factory=set)
+    # task_id -> (entry, task) for tasks drained but not yet completed
+    in_flight: Dict[str, Tuple[_Entry, Task]] = field(default_factory=dict)
+    clock_saved: bool = False
+
+
+class TaskBacklog:
+    """Per-run aging priority queue in front of task routing."""
+
+    def __init__(
+        self,
+        state_manager: Optional["PersistentStateManager"] = None,
+        aging_rate: float = 0.05,
+        prioritizer: Optional[OptimusPrioritizer] = None,
+    ):
+        """
+        Args:
+            state_manager: Persists entries for restart safety. None keeps
+                the backlog in memory only.
+            aging_rate: Priority gained per cycle spent waiting.
+            prioritizer: Source of the base weighted score.
+        """
+        if aging_rate < 0:
+            raise ValueError(f"aging_rate must be >= 0, got {aging_rate}")
+        self.state_manager = state_manager
+        self.aging_rate = aging_rate
+        self.prioritizer = prioritizer or OptimusPrioritizer()
+        self._runs: Dict[str, _RunQueue] = {}
+        # Runs whose queue went empty; dropped at the start of the next schedule()
+        self._idle: Set[str] = set()
+
+    def pending(self, run_id: str) -> int:
+        """Number of tasks waiting in a run's backlog (excluding in-flight tasks)."""
+        queue = self._queue(run_id)
+        waiting = len(queue.heap)
+        self._evict_if_idle(run_id, queue)
+        return waiting
+
+    def schedule(self, run_id: str, tasks: List[Task], limit: Optional[int] = None) -> List[Task]:
+        """
+        Start a cycle: enqueue newly submitted ``tasks`` and drain up to
+        ``limit`` tasks (None drains everything) in priority order.
+
+        Tasks already waiting or in flight under the same id are not added
+        again. Drained tasks are in flight until ``complete``; those that end
+        up unassigned should be handed back via ``defer``.
+        """
+        if limit is not None and limit < 0:
+            raise ValueError(f"limit must be >= 0, got {limit}")
+
+        self._drop_idle()
+        queue = self._queue(run_id)
+        queue.tick += 1
+
+        entries: List[_Entry] = []
+        for task in tasks:
+            if task.id in queue.tasks or task.id in queue.in_flight:
+                continue
+            key = self.prioritizer.score(task) - self.aging_rate * queue.tick
+            entries.append((-key, queue.seq, task.id, queue.tick))
+            queue.tasks[task.id] = task
+            queue.seq += 1
+
+        if len(entries) > len(queue.heap):
+            queue.heap.extend(entries)
+            heapq.heapify(queue.heap)
+        else:
+            for entry in entries:
+                heapq.heappush(queue.heap, entry)
+
+        if limit is None or limit >= len(queue.heap):
+            drained_entries = sorted(queue.heap)
+            queue.heap = []
+        else:
+            drained_entries = [heapq.heappop(queue.heap) for _ in range(limit)]
+
+        drained: List[Task] = []
+        for entry in drained_entries:
+            task = queue.tasks.pop(entry[2])
+            queue.in_flight[task.id] = (entry, task)
+            drained.append(task)
+
+        if self.state_manager is not None:
+            # New tasks are written even when drained straight away, so a crash
+            # before complete() still redelivers them; complete() deletes them.
+            self._save(run_id, queue, entries)
+            self._save_clock(run_id, queue)
+
+        self._evict_if_idle(run_id, queue)
+        return drained
+
+    def defer(self, run_id: str, tasks: List[Task]) -> None:
+        """Return tasks drained this cycle (but not assigned) to the backlog, keeping their age."""
+        queue = self._queue(run_id)
+        entries: List[_Entry] = []
+        for task in tasks:
+            if task.id in queue.tasks:
+                continue
+            held = queue.in_flight.pop(task.id, None)
+            if held is not None:
+                entry = held[0]
+            else:
+                key = self.prioritizer.score(task) - self.aging_rate * queue.tick
+                entry = (-key, queue.seq, task.id, queue.tick)
+                queue.seq += 1
+            heapq.heappush(queue.heap, entry)
+            queue.tasks[task.id] = task
+            if task.id not in queue.stored:
+                entries.append(entry)
+
+        if self.state_manager is not None and entries:
+            self._save(run_id, queue, entries)
+            self._save_clock(run_id, queue)
+
+    def release(self, run_id: str, task_ids: List[str]) -> None:
+        """Hand in-flight tasks of a cycle that failed before completion back to the queue."""
+        queue = self._queue(run_id)
+        tasks = [queue.in_flight[task_id][1] for task_id in task_ids if task_id in queue.in_flight]
+        self.defer(run_id, tasks)
+        self._evict_if_idle(run_id, queue)
+
+    def complete(self, run_id: str, task_ids: List[str]) -> None:
+        """Mark in-flight tasks as done: drop them from the queue and from SQLite."""
+        queue = self._queue(run_id)
+        removed: List[str] = []
+        for task_id in task_ids:
+            if queue.in_flight.pop(task_id, None) is None:
+                continue
+            if task_id in queue.stored:
+                queue.stored.discard(task_id)
+                removed.append(task_id)
+
+        if self.state_manager is not None and removed:
+            self.state_manager.delete_backlog_entries(run_id, removed)
+            self._save_clock(run_id, queue)
+        self._evict_if_idle(run_id, queue)
+
+    def _save(self, run_id: str, queue: _RunQueue, entries: List[_Entry]) -> None:
+        rows = []
+        for neg_key, seq, task_id, enqueued_tick in entries:
+            task = queue.tasks[task_id] if task_id in queue.tasks else queue.in_flight[task_id][1]
+            rows.append((task_id, -neg_key, seq, enqueued_tick, task.model_dump_json()))
+            queue.stored.add(task_id)
+        if rows:
+            self.state_manager.save_backlog_entries(run_id, rows)
+
+    def _save_clock(self, run_id: str, queue: _RunQueue) -> None:
+        # The clock only matters relative to persisted entries; with none
+        # left it restarts from zero, so its row is dropped.
+        if queue.stored:
+            self.state_manager.save_backlog_tick(run_id, queue.tick, queue.seq)
+            queue.clock_saved = True
+        elif queue.clock_saved:
+            self.state_manager.delete_backlog_tick(run_id)
+            queue.clock_saved = False
+
+    def _evict_if_idle(self, run_id: str, queue: _RunQueue) -> None:
+        if not queue.heap and not queue.in_flight:
+            self._idle.add(run_id)
+
+    def _drop_idle(self) -> None:
+        # Deferred to the start of a cycle: deletes buffered in the current
+        # cycle transaction would otherwise be missed by a reload from SQLite.
+        for run_id in self._idle:
+            queue = self._runs.get(run_id)
+            if queue is not None and not queue.heap and not queue.in_flight:
+                del self._runs[run_id]
+        self._idle.clear()
+
+    def _queue(self, run_id: str) -> _RunQueue:
+        queue = self._runs.get(run_id)
+        if queue is not None:
+            return queue
+
+        queue = _RunQueue()
+        if self.state_manager is not None:
+            queue.tick, queue.seq, rows = self.state_manager.load_backlog(run_id)
+            queue.clock_saved = bool(rows) or queue.tick > 0
+            for row in rows:
+                task = Task.model_validate_json(row["payload"])
+                queue.tasks[task.id] = task
+                queue.heap.append((-row["priority"], row["seq"], task.id, row["enqueued_tick"]))
+                queue.stored.add(task.id)
+            heapq.heapify(queue.heap)
+        self._runs[run_id] = queue
+        return queue
@@ -0,0 +1,149 @@
+"""
+Streaming Drift Detectors - Constant-State Per-Agent Trust Drift
+
+Pluggable alternatives to the trust engine's built-in last-two-samples
+check. Each detector keeps a few floats per agent and updates in O(1) per
+trust observation, so longer trends are caught without storing or
+scanning longer histories:
+
+- EWMA: exponentially weighted average of trust deltas
+- CUSUM: one-sided (downward) cumulative sum of deltas beyond an allowance
+- Page-Hinkley: cumulative deviation of trust from its running mean
+
+``observe()`` returns True when the agent is drifting, False when it has
+recovered and None when the verdict is unchanged, matching how the engine
+updates ``drift_warnings``. Alarm thresholds scale with the engine's
+(adaptive) ``drift_delta``.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Type
+
+
+class DriftDetector(ABC):
+    """Abstract base class: per-agent O(1) streaming drift detection."""
+
+    name = "base"
+
+    def __init__(self):
+        self._state: Dict[str, List[float]] = {}
+
+    @abstractmethod
+    def observe(self, agent_id: str, trust_score: float, drift_delta: float) -> Optional[bool]:
+        """
+        Fold one trust observation into the agent's statistics.
+
+        Returns:
+            True if drifting, False if recovered, None if unchanged
+        """
+        pass
+
+    def reset(self, agent_id: str) -> None:
+        """Forget an agent's statistics (e.g. after it recovers from suppression)."""
+        self._state.pop(agent_id, None)
+
+
+class EWMADriftDetector(DriftDetector):
+    """
+    Drift when the EWMA of trust deltas falls below ``-ratio * drift_delta``;
+    cleared once the average turns non-negative.
+    """
+
+    name = "ewma"
+
+    def __init__(self, alpha: float = 0.2, ratio: float = 0.15):
+        super().__init__()
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError(f"alpha must be in (0, 1], got {alpha}")
+        self.alpha = alpha
+        self.ratio = ratio
+
+    def observe(self, agent_id: str, trust_score: float, drift_delta: float) -> Optional[bool]:
+        state = self._state.get(agent_id)
+        if state is None:
+            self._state[agent_id] = [trust_score, 0.0]  # [last, ewma]
+            return None
+        delta = trust_score - state[0]
+        state[0] = trust_score
+        state[1] = self.alpha * delta + (1.0 - self.alpha) * state[1]
+        if state[1] < -self.ratio * drift_delta:
+            return True
+        if state[1] >= 0.0:
+            return False
+        return None
+
+
+class CUSUMDriftDetector(DriftDetector):
+    """
+    One-sided CUSUM for trust decreases: S = max(0, S - delta - k).
+    Drift when S exceeds ``ratio * drift_delta``; cleared when S returns to 0.
+    """
+
+    name = "cusum"
+
+    def __init__(self, allowance: float = 0.005, ratio: float = 1.0):
+        super().__init__()
+        self.allowance = allowance
+        self.ratio = ratio
+
+    def observe(self, agent_id: str, trust_score: float, drift_delta: float) -> Optional[bool]:
+        state = self._state.get(agent_id)
+        if state is None:
+            self._state[agent_id] = [trust_score, 0.0]  # [last, cusum]
+            return None
+        delta = trust_score - state[0]
+        state[0] = trust_score
+        state[1] = max(0.0, state[1] - delta - self.allowance)
+        if state[1] > self.ratio * drift_delta:
+            return True
+        if state[1] == 0.0:
+            return False
+        return None
+
+
+class PageHinkleyDriftDetector(DriftDetector):
+    """
+    Page-Hinkley test for a decrease in mean trust. U accumulates
+    ``x - mean + tolerance``; drift when ``max(U) - U`` exceeds
+    ``ratio * drift_delta``, cleared when U is back at its maximum.
+    """
+
+    name = "page_hinkley"
+
+    def __init__(self, tolerance: float = 0.005, ratio: float = 1.0):
+        super().__init__()
+        self.tolerance = tolerance
+        self.ratio = ratio
+
+    def observe(self, agent_id: str, trust_score: float, drift_delta: float) -> Optional[bool]:
+        state = self._state.get(agent_id)
+        if state is None:
+            # [count, mean, cumulative, max_cumulative]
+            self._state[agent_id] = [1.0, trust_score, self.tolerance, self.tolerance]
+            return None
+        state[0] += 1.0
+        state[1] += (trust_score - state[1]) / state[0]
+        state[2] += trust_score - state[1] + self.tolerance
+        state[3] = max(state[3], state[2])
+        statistic = state[3] - state[2]
+        if statistic > self.ratio * drift_delta:
+            return True
+        if statistic == 0.0:
+            return False
+        return None
+
+
+DRIFT_DETECTORS: Dict[str, Optional[Type[DriftDetector]]] = {
+    "last_delta": None,  # built-in last-two-samples check
+    "ewma": EWMADriftDetector,
+    "cusum": CUSUMDriftDetector,
+    "page_hinkley": PageHinkleyDriftDetector,
+}
+
+
+def create_drift_detector(name: str) -> Optional[DriftDetector]:
+    """Build a detector by name; "last_delta" returns None (engine default)."""
+    if name not in DRIFT_DETECTORS:
+        raise ValueError(f"drift_detector must be one of {sorted(DRIFT_DETECTORS)}, got {name!r}")
+    detector_cls = DRIFT_DETECTORS[name]
+    return detector_cls() if detector_cls is not None else None
@@ -1,10 +1,25 @@
 from typing import List, Dict
+from syntropiq.core.config import GovernanceConfig
 from syntropiq.core.models import ExecutionResult, Agent
 
+_DEFAULTS = GovernanceConfig()
+
+# Cycles with at least this many results take the grouped batch path.
+BATCH_MIN_RESULTS = 64
+
+# Scores are rounded to 3 decimals, i.e. kept in whole thousandths.
+_SCALE = 1000
+
+
 def update_trust_scores(
     results: List[ExecutionResult],
-    agents: Dict[str, Agent]
+    agents: Dict[str, Agent],
+    reward: float = _DEFAULTS.asymmetric_reward,
+    penalty: float = _DEFAULTS.asymmetric_penalty,
 ) -> Dict[str, float]:
+    if len(results) >= BATCH_MIN_RESULTS:
+        return update_trust_scores_batch(results, agents, reward, penalty)
+
     new_scores = {}
 
     for result in results:
@@ -19,11 +34,63 @@ def update_trust_scores(
         current_score = new_scores.get(agent_id, agents[agent_id].trust_score)
 
         if success:
-            updated = min(1.0, current_score + 0.02)
+            updated = min(1.0, current_score + reward)
         else:
-            updated = max(0.0, current_score - 0.05)
+            updated = max(0.0, current_score - penalty)
 
         new_scores[agent_id] = round(updated, 3)
 
     return new_scores
 
+
+def update_trust_scores_batch(
+    results: List[ExecutionResult],
+    agents: Dict[str, Agent],
+    reward: float = _DEFAULTS.asymmetric_reward,
+    penalty: float = _DEFAULTS.asymmetric_penalty,
+) -> Dict[str, float]:
+    """
+    Same values as the per-result recurrence, computed per agent.
+
+    Results are grouped by agent in one pass. After an agent's first
+    (float) step its score is a whole number of thousandths, so when the
+    rates are too, the rest of the clipped recurrence runs in integers.
+    If no prefix can reach 0.0 or 1.0, it collapses to the closed form
+    ``k + up * successes - down * failures``.
+    """
+    outcomes: Dict[str, List[bool]] = {}
+    for result in results:
+        if result.agent_id in agents:
+            outcomes.setdefault(result.agent_id, []).append(result.success)
+
+    up = round(reward * _SCALE)
+    down = round(penalty * _SCALE)
+    integral = abs(reward * _SCALE - up) < 1e-9 and abs(penalty * _SCALE - down) < 1e-9
+
+    new_scores = {}
+    for agent_id, sequence in outcomes.items():
+        current = agents[agent_id].trust_score
+        first = sequence[0]
+        current = round(min(1.0, current + reward) if first else max(0.0, current - penalty), 3)
+
+        if len(sequence) == 1:
+            new_scores[agent_id] = current
+            continue
+
+        if not integral:
+            for success in sequence[1:]:
+                current = round(min(1.0, current + reward) if success else max(0.0, current - penalty), 3)
+            new_scores[agent_id] = current
+            continue
+
+        units = round(current * _SCALE)
+        successes = sequence.count(True) - (1 if first else 0)
+        failures = len(sequence) - 1 - successes
+        if units + up * successes <= _SCALE and units - down * failures >= 0:
+            units += up * successes - down * failures
+        else:
+            for success in sequence[1:]:
+                units = min(_SCALE, units + up) if success else max(0, units - down)
+        new_scores[agent_id] = units / _SCALE
+
+    return new_scores
@@ -11,22 +11,36 @@ Orchestrates the complete governance cycle:
 7. State persistence
 """
 
+import asyncio
+import contextvars
+import functools
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Set
 
 from syntropiq.core.context import get_request_id
 from syntropiq.core.exceptions import CircuitBreakerTriggered, NoAgentsAvailable
 from syntropiq.core.models import Agent, ExecutionResult, Task
+from syntropiq.core.replay import routing_rng
 from syntropiq.governance.healing_reflex import (
     compute_fs_slope,
     rehabilitate_trust,
     should_rehabilitate,
 )
+from syntropiq.governance.array_trust_engine import ArrayTrustEngine
+from syntropiq.governance.backlog import TaskBacklog
+from syntropiq.governance.drift_detectors import create_drift_detector
 from syntropiq.governance.learning_engine import update_trust_scores
 from syntropiq.governance.mutation_engine import MutationEngine
 from syntropiq.governance.prioritizer import OptimusPrioritizer
+from syntropiq.governance.profiling import CycleProfile, CycleProfiler, StageHook, StageTimer
 from syntropiq.governance.reflection_engine import evaluate_reflection
+from syntropiq.governance.trust_decay import IdleTrustDecay
 from syntropiq.governance.trust_engine import SyntropiqTrustEngine
 from syntropiq.optimize.config import get_default_lambda_vector, get_optimize_mode
 from syntropiq.optimize.lambda_optimizer import optimize_tasks
@@ -34,9 +48,34 @@ from syntropiq.optimize.schema import OptimizeInput
 from syntropiq.reflect.config import get_reflect_consensus_mode, get_reflect_mode
 from syntropiq.reflect.consensus import run_consensus_reflect
 from syntropiq.reflect.engine import run_reflect
+from syntropiq.persistence.run_state import RunStateStore
 from syntropiq.persistence.state_manager import PersistentStateManager
 
 
+TRUST_ENGINE_BACKENDS = {
+    "python": SyntropiqTrustEngine,
+    "array": ArrayTrustEngine,
+}
+
+
+@dataclass
+class _CyclePlan:
+    """Pre-dispatch cycle state carried from planning into completion."""
+
+    run_id: str
+    cycle_id: str
+    timestamp: str
+    sorted_tasks: List[Task]
+    assignments: List[Any]
+    trust_before: Dict[str, float]
+    status_before: Dict[str, str]
+    threshold_before: Dict[str, float]
+    suppressed_before: Set[str]
+    authority_before: Dict[str, float]
+    authority_after: Dict[str, float]
+    deferred_tasks: List[str] = field(default_factory=list)
+
+
 class GovernanceLoop:
     """Main governance orchestrator."""
 
@@ -48,16 +87,78 @@ class GovernanceLoop:
         drift_delta: float = 0.1,
         routing_mode: str = "deterministic",
         telemetry: Any = None,
+        max_concurrency: int = 1,
+        on_stage: Optional[StageHook] = None,
+        profile_every: int = 0,
+        engine_backend: str = "python",
+        agent_capacity: int = 1,
+        routing_seed: Optional[int] = None,
+        drift_detector: str = "last_delta",
+        asymmetric_reward: float = 0.02,
+        asymmetric_penalty: float = 0.05,
+        idle_decay: Optional[IdleTrustDecay] = None,
+        backlog: Optional[TaskBacklog] = None,
+        run_state: Optional[RunStateStore] = None,
     ):
+        """
+        Args:
+            max_concurrency: Maximum number of executor calls dispatched in
+                parallel per cycle. 1 keeps the sequential dispatch path.
+            on_stage: Optional ``on_stage(name, duration, context)`` callback
+                invoked after each timed cycle stage.
+            profile_every: Capture cProfile/tracemalloc data for every Nth
+                cycle under ``statistics.profile``. 0 disables profiling.
+            engine_backend: "python" (SyntropiqTrustEngine) or "array"
+                (ArrayTrustEngine, NumPy-backed, for large agent pools).
+            agent_capacity: Per-agent task limit per cycle when
+                ``routing_mode="capacity"``; tasks beyond every eligible
+                agent's capacity are deferred (``statistics.tasks_deferred``).
+            routing_seed: Seed for competitive routing draws. Each cycle uses
+                ``routing_rng(routing_seed, cycle_id)``, so re-running a run
+                with the same seed repeats its routing; None keeps the global
+                ``random`` module.
+            drift_detector: "last_delta" (built-in), "ewma", "cusum" or
+                "page_hinkley" streaming drift detection.
+            asymmetric_reward / asymmetric_penalty: Trust gained per success
+                and lost per failure (GovernanceConfig η / γ).
+            idle_decay: Optional lazy idle-decay policy; the engine applies it
+                when reading trust and the loop resets agents' clocks on every
+                learning update.
+            backlog: Optional persistent task backlog. Submitted tasks are
+                queued per run and each cycle drains as many as routing
+                capacity allows; tasks that cannot be assigned (capacity,
+                risk ceilings, circuit breaker) wait for a later cycle
+                instead of failing it.
+            run_state: Bounded store for per-run healing state; pass a
+                persistent store to keep it across restarts. Defaults to a
+                private in-memory store.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+        if engine_backend not in TRUST_ENGINE_BACKENDS:
+            raise ValueError(
+                f"engine_backend must be one of {sorted(TRUST_ENGINE_BACKENDS)}, got {engine_backend!r}"
+            )
+
         self.state = state_manager
+        self.max_concurrency = max_concurrency
+        self.routing_seed = routing_seed
+        self.asymmetric_reward = asymmetric_reward
+        self.asymmetric_penalty = asymmetric_penalty
+        self.idle_decay = idle_decay
+        self.backlog = backlog
         self.prioritizer = OptimusPrioritizer()
-        self.trust_engine = SyntropiqTrustEngine(
+        self.trust_engine = TRUST_ENGINE_BACKENDS[engine_backend](
             trust_threshold=trust_threshold,
             suppression_threshold=suppression_threshold,
             drift_delta=drift_delta,
             state_manager=state_manager,
             routing_mode=routing_mode,
+            agent_capacity=agent_capacity,
+            drift_detector=create_drift_detector(drift_detector),
+            idle_decay=idle_decay,
         )
+        self.trust_engine.defer_ineligible = backlog is not None
         self.mutation_engine = MutationEngine(
             initial_trust_threshold=trust_threshold,
             initial_suppression_threshold=suppression_threshold,
@@ -65,8 +166,12 @@ class GovernanceLoop:
             state_manager=state_manager,
         )
         self.telemetry = telemetry
+        self.on_stage = on_stage
+        self.profiler = CycleProfiler(every=profile_every)
         self._cycle_sequence = 0
-        self._healing_state: Dict[str, Dict[str, Any]] = {}
+        self.run_state = run_state if run_state is not None else RunStateStore()
+        # Guards planning and completion; executor dispatch runs outside it.
+        self._lock = threading.RLock()
 
     def execute_cycle(
         self,
@@ -74,12 +179,128 @@ class GovernanceLoop:
         agents: Dict[str, Agent],
         executor: Any,
         run_id: str = "CYCLE_1",
+        max_concurrency: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        started = time.perf_counter()
+        timer = StageTimer(self.on_stage, {"run_id": run_id})
+        profile = self.profiler.sample()
+        try:
+            plan = self._run_locked(self._plan_cycle, tasks, agents, run_id, timer, timer=timer, profile=profile)
+
+            try:
+                with timer.stage("dispatch"), profile.phase() if profile is not None else nullcontext():
+                    results = self._dispatch(
+                        assignments=plan.assignments,
+                        sorted_tasks=plan.sorted_tasks,
+                        agents=agents,
+                        executor=executor,
+                        max_concurrency=max_concurrency if max_concurrency is not None else self.max_concurrency,
+                    )
+
+                result = self._run_locked(
+                    self._complete_cycle, plan, agents, results, timer, timer=timer, profile=profile
+                )
+            except BaseException:
+                self._release_backlog(plan)
+                raise
+        finally:
+            profile_data = profile.finish() if profile is not None else None
+        return self._finish_statistics(result, timer, started, profile_data)
+
+    async def execute_cycle_async(
+        self,
+        tasks: List[Task],
+        agents: Dict[str, Agent],
+        executor: Any,
+        run_id: str = "CYCLE_1",
+        max_concurrency: Optional[int] = None,
     ) -> Dict[str, Any]:
+        """
+        Asyncio variant of execute_cycle.
+
+        Planning, persistence and telemetry run in worker threads so the event
+        loop keeps serving other requests; executor calls use ``aexecute`` when
+        the executor provides one and fall back to ``asyncio.to_thread``.
+        """
+        started = time.perf_counter()
+        timer = StageTimer(self.on_stage, {"run_id": run_id})
+        profile = self.profiler.sample()
+        try:
+            plan = await asyncio.to_thread(
+                functools.partial(
+                    self._run_locked, self._plan_cycle, tasks, agents, run_id, timer, timer=timer, profile=profile
+                )
+            )
+
+            try:
+                # Executor coroutines interleave with other requests, so dispatch is
+                # timed but not profiled.
+                with timer.stage("dispatch"):
+                    results = await self._dispatch_async(
+                        assignments=plan.assignments,
+                        sorted_tasks=plan.sorted_tasks,
+                        agents=agents,
+                        executor=executor,
+                        max_concurrency=max_concurrency if max_concurrency is not None else self.max_concurrency,
+                    )
+
+                result = await asyncio.to_thread(
+                    functools.partial(
+                        self._run_locked, self._complete_cycle, plan, agents, results, timer, timer=timer, profile=profile
+                    )
+                )
+            except BaseException:
+                self._release_backlog(plan)
+                raise
+        finally:
+            profile_data = profile.finish() if profile is not None else None
+        return self._finish_statistics(result, timer, started, profile_data)
+
+    def _release_backlog(self, plan: _CyclePlan) -> None:
+        # The cycle never completed: its drained tasks go back to the backlog.
+        if self.backlog is not None:
+            with self._lock:
+                self.backlog.release(plan.run_id, [task.id for task in plan.sorted_tasks])
+
+    def _run_locked(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        timer: StageTimer,
+        profile: Optional[CycleProfile] = None,
+    ) -> Any:
+        # Each locked phase persists through one state transaction (one commit).
+        with self._lock, profile.phase() if profile is not None else nullcontext():
+            self.state.begin_cycle_transaction()
+            try:
+                return fn(*args)
+            finally:
+                with timer.stage("commit"):
+                    self.state.end_cycle_transaction()
+
+    @staticmethod
+    def _finish_statistics(
+        result: Dict[str, Any],
+        timer: StageTimer,
+        started: float,
+        profile_data: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        timer.record("total", time.perf_counter() - started)
+        statistics = result["statistics"]
+        statistics["stage_timings"] = dict(timer.timings)
+        if profile_data is not None:
+            statistics["profile"] = profile_data
+        return result
+
+    def _plan_cycle(
+        self, tasks: List[Task], agents: Dict[str, Agent], run_id: str, timer: StageTimer
+    ) -> _CyclePlan:
         if not agents:
             raise NoAgentsAvailable("No agents available in registry")
 
         self._cycle_sequence += 1
         cycle_id = f"{run_id}:{self._cycle_sequence}"
+        timer.context["cycle_id"] = cycle_id
         timestamp = datetime.now(timezone.utc).isoformat()
 
         trust_before = {aid: float(agent.trust_score) for aid, agent in agents.items()}
@@ -91,42 +312,63 @@ class GovernanceLoop:
             "drift_delta": float(self.trust_engine.drift_delta),
         }
 
-        prioritized = self.prioritizer.optimize(tasks)
-        sorted_tasks = prioritized["sorted_tasks"]
+        with timer.stage("prioritize"):
+            if self.backlog is not None:
+                sorted_tasks = self.backlog.schedule(run_id, tasks, limit=self._routing_capacity(agents))
+            else:
+                prioritized = self.prioritizer.optimize(tasks)
+                sorted_tasks = prioritized["sorted_tasks"]
 
         if get_optimize_mode() == "integrate" and sorted_tasks:
-            try:
-                trust_by_agent = {aid: float(agent.trust_score) for aid, agent in agents.items()}
-                optimize_input = OptimizeInput(
-                    tasks=sorted_tasks,
-                    trust_by_agent=trust_by_agent,
-                    context={
-                        "source": "governance_loop",
-                        "run_id": run_id,
-                        "cycle_id": cycle_id,
-                    },
-                )
-                decision = optimize_tasks(
-                    input=optimize_input,
-                    lambda_vector=get_default_lambda_vector(),
-                    run_id=run_id,
-                )
-                by_id = {task.id: task for task in sorted_tasks}
-                sorted_tasks = [by_id[task_id] for task_id in decision.chosen_task_ids if task_id in by_id]
+            with timer.stage("optimize"):
+                try:
+                    trust_by_agent = {aid: float(agent.trust_score) for aid, agent in agents.items()}
+                    optimize_input = OptimizeInput(
+                        tasks=sorted_tasks,
+                        trust_by_agent=trust_by_agent,
+                        context={
+                            "source": "governance_loop",
+                            "run_id": run_id,
+                            "cycle_id": cycle_id,
+                        },
+                    )
+                    decision = optimize_tasks(
+                        input=optimize_input,
+                        lambda_vector=get_default_lambda_vector(),
+                        run_id=run_id,
+                    )
+                    by_id = {task.id: task for task in sorted_tasks}
+                    sorted_tasks = [by_id[task_id] for task_id in decision.chosen_task_ids if task_id in by_id]
 
-                if self.telemetry is not None:
-                    telemetry_state = getattr(self.telemetry, "_state_manager", None)
-                    if telemetry_state is not None and hasattr(telemetry_state, "save_optimization_event"):
-                        telemetry_state.save_optimization_event(decision.to_dict())
-            except Exception:
-                # Keep integrate mode non-invasive: optimization failures must not block execution.
-                pass
+                    if self.telemetry is not None:
+                        telemetry_state = getattr(self.telemetry, "_state_manager", None)
+                        if telemetry_state is not None and hasattr(telemetry_state, "save_optimization_event"):
+                            telemetry_state.save_optimization_event(decision.to_dict())
+                except Exception:
+                    # Keep integrate mode non-invasive: optimization failures must not block execution.
+                    pass
 
         suppressed_before = set(self.trust_engine.suppressed_agents.keys())
+        if self.routing_seed is not None:
+            self.trust_engine.rng = routing_rng(self.routing_seed, cycle_id)
         try:
-            assignments = self.trust_engine.assign_agents(sorted_tasks, agents)
+            with timer.stage("assign"):
+                assignments = self.trust_engine.assign_agents(sorted_tasks, agents)
+            deferred_tasks = list(self.trust_engine.deferred_tasks)
         except RuntimeError as e:
-            raise CircuitBreakerTriggered(str(e))
+            if self.backlog is None:
+                raise CircuitBreakerTriggered(str(e))
+            # Circuit breaker open: hold this cycle's tasks until agents recover.
+            assignments = []
+            deferred_tasks = [task.id for task in sorted_tasks]
+        except BaseException:
+            if self.backlog is not None:
+                self.backlog.release(run_id, [task.id for task in sorted_tasks])
+            raise
+
+        if self.backlog is not None and deferred_tasks:
+            deferred_ids = set(deferred_tasks)
+            self.backlog.defer(run_id, [task for task in sorted_tasks if task.id in deferred_ids])
 
         assignment_count_by_agent: Dict[str, int] = {aid: 0 for aid in agents.keys()}
         for assignment in assignments:
@@ -142,141 +384,182 @@ class GovernanceLoop:
             aid: assignment_count_by_agent.get(aid, 0) / total_assignments for aid in agents.keys()
         }
 
-        results: List[ExecutionResult] = []
-        for assignment in assignments:
-            task = next(t for t in sorted_tasks if t.id == assignment.task_id)
-            agent = agents[assignment.agent_id]
-            result = executor.execute(task, agent)
-            results.append(result)
+        return _CyclePlan(
+            run_id=run_id,
+            cycle_id=cycle_id,
+            timestamp=timestamp,
+            sorted_tasks=sorted_tasks,
+            assignments=assignments,
+            trust_before=trust_before,
+            status_before=status_before,
+            threshold_before=threshold_before,
+            suppressed_before=suppressed_before,
+            authority_before=authority_before,
+            authority_after=authority_after,
+            deferred_tasks=deferred_tasks,
+        )
 
-        trust_updates = update_trust_scores(results, agents)
-        for aid, new_score in trust_updates.items():
-            agents[aid].trust_score = new_score
+    def _routing_capacity(self, agents: Dict[str, Agent]) -> Optional[int]:
+        """Upper bound on tasks routable this cycle (None when unbounded)."""
+        if self.trust_engine.routing_mode != "capacity":
+            return None
+        limits = self.trust_engine.capacity_limits
+        default = self.trust_engine.agent_capacity
+        return sum(limits.get(aid, default) for aid in agents)
+
+    def _complete_cycle(
+        self,
+        plan: _CyclePlan,
+        agents: Dict[str, Agent],
+        results: List[ExecutionResult],
+        timer: StageTimer,
+    ) -> Dict[str, Any]:
+        run_id = plan.run_id
+        cycle_id = plan.cycle_id
+        timestamp = plan.timestamp
+        trust_before = plan.trust_before
+        status_before = plan.status_before
+        threshold_before = plan.threshold_before
+        suppressed_before = plan.suppressed_before
+        authority_before = plan.authority_before
+        authority_after = plan.authority_after
+
+        with timer.stage("learning"):
+            trust_updates = update_trust_scores(
+                results, agents, reward=self.asymmetric_reward, penalty=self.asymmetric_penalty
+            )
+            for aid, new_score in trust_updates.items():
+                agents[aid].trust_score = new_score
+                if self.idle_decay is not None:
+                    self.idle_decay.touch(aid)
 
         trust_after = {aid: float(agent.trust_score) for aid, agent in agents.items()}
         status_after = {aid: str(agent.status) for aid, agent in agents.items()}
 
-        mutation_result = self.mutation_engine.evaluate_and_mutate(
-            execution_results=results,
-            cycle_id=cycle_id,
-            suppression_active=bool(self.trust_engine.suppressed_agents),
-        )
+        with timer.stage("mutation"):
+            mutation_result = self.mutation_engine.evaluate_and_mutate(
+                execution_results=results,
+                cycle_id=cycle_id,
+                suppression_active=bool(self.trust_engine.suppressed_agents),
+            )
         self.trust_engine.trust_threshold = mutation_result["trust_threshold"]
         self.trust_engine.suppression_threshold = mutation_result["suppression_threshold"]
         self.trust_engine.drift_delta = mutation_result["drift_delta"]
 
-        reflection = evaluate_reflection(
-            execution_results=results,
-            trust_updates=trust_updates,
-            prior_memory=None,
-            run_id=run_id,
-        )
+        with timer.stage("reflection"):
+            reflection = evaluate_reflection(
+                execution_results=results,
+                trust_updates=trust_updates,
+                prior_memory=None,
+                run_id=run_id,
+            )
 
-        self.state.update_trust_scores(trust_updates, reason=run_id)
-        self.state.record_execution_results(results)
-        self.state.record_reflection(reflection["reflection"], reflection)
+        # Writes are buffered here; the flush is timed as "commit".
+        with timer.stage("persistence"):
+            self.state.update_trust_scores(trust_updates, reason=run_id)
+            self.state.record_execution_results(results)
+            self.state.record_reflection(reflection["reflection"], reflection)
 
-        suppressed_now = set(self.trust_engine.suppressed_agents.keys())
-        for aid in suppressed_now:
-            cycles = self.trust_engine.suppressed_agents[aid]
-            self.state.update_suppression_state(aid, is_suppressed=True, redemption_cycle=cycles)
-        for aid in suppressed_before - suppressed_now:
-            self.state.update_suppression_state(aid, is_suppressed=False, redemption_cycle=0)
+            suppressed_now = set(self.trust_engine.suppressed_agents.keys())
+            for aid in suppressed_now:
+                cycles = self.trust_engine.suppressed_agents[aid]
+                self.state.update_suppression_state(aid, is_suppressed=True, redemption_cycle=cycles)
+            for aid in suppressed_before - suppressed_now:
+                self.state.update_suppression_state(aid, is_suppressed=False, redemption_cycle=0)
 
         successes = sum(1 for r in results if r.success)
         failures = sum(1 for r in results if not r.success)
 
-        events = self._build_governance_events(
-            run_id=run_id,
-            cycle_id=cycle_id,
-            timestamp=timestamp,
-            agents=agents,
-            trust_before=trust_before,
-            trust_after=trust_after,
-            status_before=status_before,
-            status_after=status_after,
-            authority_before=authority_before,
-            authority_after=authority_after,
-            trust_updates=trust_updates,
-            threshold_before=threshold_before,
-            mutation_result=mutation_result,
-            reflection=reflection,
-        )
+        with timer.stage("telemetry"):
+            events = self._build_governance_events(
+                run_id=run_id,
+                cycle_id=cycle_id,
+                timestamp=timestamp,
+                agents=agents,
+                trust_before=trust_before,
+                trust_after=trust_after,
+                status_before=status_before,
+                status_after=status_after,
+                authority_before=authority_before,
+                authority_after=authority_after,
+                trust_updates=trust_updates,
+                threshold_before=threshold_before,
+                mutation_result=mutation_result,
+                reflection=reflection,
+            )
 
-        if self.telemetry is not None:
-            try:
-                if hasattr(self.telemetry, "publish_events"):
-                    self.telemetry.publish_events(events)
-                if hasattr(self.telemetry, "record_cycle"):
-                    authority_delta = {
-                        aid: round(authority_after.get(aid, 0.0) - authority_before.get(aid, 0.0), 6)
-                        for aid in agents.keys()
-                    }
-                    self.telemetry.record_cycle(
-                        {
-                            "run_id": run_id,
-                            "cycle_id": cycle_id,
-                            "timestamp": timestamp,
-                            "total_agents": len(agents),
-                            "successes": successes,
-                            "failures": failures,
-                            "trust_delta_total": round(
-                                sum(
-                                    trust_after.get(aid, 0.0) - trust_before.get(aid, 0.0)
-                                    for aid in agents.keys()
-                                ),
-                                6,
-                            ),
-                            "authority_redistribution": authority_delta,
-                            "events": events,
+            if self.telemetry is not None:
+                try:
+                    if hasattr(self.telemetry, "publish_events"):
+                        self.telemetry.publish_events(events)
+                    if hasattr(self.telemetry, "record_cycle"):
+                        authority_delta = {
+                            aid: round(authority_after.get(aid, 0.0) - authority_before.get(aid, 0.0), 6)
+                            for aid in agents.keys()
                         }
-                    )
-            except Exception as telemetry_err:  # pragma: no cover
-                print(f"Telemetry emit failed: {telemetry_err}")
+                        self.telemetry.record_cycle(
+                            {
+                                "run_id": run_id,
+                                "cycle_id": cycle_id,
+                                "timestamp": timestamp,
+                                "total_agents": len(agents),
+                                "successes": successes,
+                                "failures": failures,
+                                "trust_delta_total": round(
+                                    sum(
+                                        trust_after.get(aid, 0.0) - trust_before.get(aid, 0.0)
+                                        for aid in agents.keys()
+                                    ),
+                                    6,
+                                ),
+                                "authority_redistribution": authority_delta,
+                                "events": events,
+                            }
+                        )
+                    bayes_tracker = getattr(self.telemetry, "bayes_tracker", None)
+                    if bayes_tracker is not None:
+                        bayes_tracker.observe_results(run_id, results)
+                except Exception as telemetry_err:  # pragma: no cover
+                    print(f"Telemetry emit failed: {telemetry_err}")
 
         if get_reflect_mode() == "integrate":
             try:
                 telemetry_state = getattr(self.telemetry, "_state_manager", None) if self.telemetry is not None else None
                 if telemetry_state is not None and hasattr(telemetry_state, "save_reflect_decision"):
-                    recent_cycles = (
-                        telemetry_state.load_cycles_by_run_id(run_id, limit=50)
-                        if hasattr(telemetry_state, "load_cycles_by_run_id")
-                        else []
-                    )
-                    recent_events = (
-                        telemetry_state.load_events_by_run_id(run_id, limit=200)
-                        if hasattr(telemetry_state, "load_events_by_run_id")
-                        else []
-                    )
-                    replay_rows = (
-                        telemetry_state.load_replay_validations(run_id, limit=1)
-                        if hasattr(telemetry_state, "load_replay_validations")
-                        else []
-                    )
-                    latest_replay = float(replay_rows[0].get("r_score", 0.0)) if replay_rows else None
-
-                    reflect_decision = run_reflect(
-                        run_id=run_id,
-                        cycle_id=cycle_id,
-                        timestamp=timestamp,
-                        trust_by_agent=trust_after,
-                        thresholds={
-                            "trust_threshold": float(self.trust_engine.trust_threshold),
-                            "suppression_threshold": float(self.trust_engine.suppression_threshold),
-                            "drift_delta": float(self.trust_engine.drift_delta),
-                        },
-                        suppression_active=bool(self.trust_engine.suppressed_agents),
-                        recent_cycles=recent_cycles,
-                        recent_events=recent_events,
-                        horizon_steps=5,
-                        theta=0.10,
-                        weights_decay=0.85,
-                        mode="integrate",
-                        latest_replay_score=latest_replay,
-                    )
-                    telemetry_state.save_reflect_decision(reflect_decision.to_dict())
-                    if get_reflect_consensus_mode() == "integrate" and hasattr(telemetry_state, "save_consensus_insight"):
-                        consensus = run_consensus_reflect(
+                    with timer.stage("reflect"):
+                        # Reflect sees the run's *newest* 50 cycles / 200 events
+                        # (oldest first). Before the per-run window this read
+                        # the first rows of the run, which froze reflect's
+                        # inputs once a run outgrew the limits.
+                        if hasattr(self.telemetry, "run_window"):
+                            recent_cycles, recent_events = self.telemetry.run_window(
+                                run_id, cycle_limit=50, event_limit=200
+                            )
+                        else:
+                            if hasattr(self.telemetry, "flush"):
+                                self.telemetry.flush(timeout=5.0)
+                            recent_cycles = (
+                                telemetry_state.load_cycles_by_run_id(run_id, limit=50, latest=True)
+                                if hasattr(telemetry_state, "load_cycles_by_run_id")
+                                else []
+                            )
+                            recent_events = (
+                                telemetry_state.load_events_by_run_id(run_id, limit=200, latest=True)
+                                if hasattr(telemetry_state, "load_events_by_run_id")
+                                else []
+                            )
+                        if hasattr(telemetry_state, "latest_replay_validation"):
+                            latest_row = telemetry_state.latest_replay_validation(run_id)
+                            replay_rows = [latest_row] if latest_row else []
+                        else:
+                            replay_rows = (
+                                telemetry_state.load_replay_validations(run_id, limit=1)
+                                if hasattr(telemetry_state, "load_replay_validations")
+                                else []
+                            )
+                        latest_replay = float(replay_rows[0].get("r_score", 0.0)) if replay_rows else None
+
+                        reflect_decision = run_reflect(
                             run_id=run_id,
                             cycle_id=cycle_id,
                             timestamp=timestamp,
@@ -291,31 +574,67 @@ class GovernanceLoop:
                             recent_events=recent_events,
                             horizon_steps=5,
                             theta=0.10,
+                            weights_decay=0.85,
+                            mode="integrate",
                             latest_replay_score=latest_replay,
                         )
-                        telemetry_state.save_consensus_insight(
-                            {
-                                "run_id": run_id,
-                                "cycle_id": cycle_id,
-                                "timestamp": timestamp,
-                                **consensus,
-                                "metadata": {"source": "governance_loop_integrate"},
-                            }
+                        telemetry_state.save_reflect_decision(reflect_decision.to_dict())
+                        if get_reflect_consensus_mode() == "integrate" and hasattr(telemetry_state, "save_consensus_insight"):
+                            consensus = run_consensus_reflect(
+                                run_id=run_id,
+                                cycle_id=cycle_id,
+                                timestamp=timestamp,
+                                trust_by_agent=trust_after,
+                                thresholds={
+                                    "trust_threshold": float(self.trust_engine.trust_threshold),
+                                    "suppression_threshold": float(self.trust_engine.suppression_threshold),
+                                    "drift_delta": float(self.trust_engine.drift_delta),
+                                },
+                                suppression_active=bool(self.trust_engine.suppressed_agents),
+                                recent_cycles=recent_cycles,
+                                recent_events=recent_events,
+                                horizon_steps=5,
+                                theta=0.10,
+                                latest_replay_score=latest_replay,
+                            )
+                            telemetry_state.save_consensus_insight(
+                                {
+                                    "run_id": run_id,
+                                    "cycle_id": cycle_id,
+                                    "timestamp": timestamp,
+                                    **consensus,
+                                    "metadata": {"source": "governance_loop_integrate"},
+                                }
+                            )
+
+                    with timer.stage("healing"):
+                        self._maybe_apply_healing(
+                            run_id=run_id,
+                            cycle_id=cycle_id,
+                            timestamp=timestamp,
+                            agents=agents,
+                            trust_after=trust_after,
+                            reflect_decision=reflect_decision.to_dict(),
+                            telemetry_state=telemetry_state,
                         )
-
-                    self._maybe_apply_healing(
-                        run_id=run_id,
-                        cycle_id=cycle_id,
-                        timestamp=timestamp,
-                        agents=agents,
-                        trust_after=trust_after,
-                        reflect_decision=reflect_decision.to_dict(),
-                        telemetry_state=telemetry_state,
-                    )
             except Exception:
                 # Reflect integration is advisory; failures must not impact cycle execution.
                 pass
 
+        if self.backlog is not None:
+            self.backlog.complete(run_id, [task.id for task in plan.sorted_tasks])
+
+        statistics = {
+            "tasks_executed": len(results),
+            "successes": successes,
+            "failures": failures,
+            "avg_latency": sum(r.latency for r in results) / len(results) if results else 0,
+        }
+        if plan.deferred_tasks:
+            statistics["tasks_deferred"] = list(plan.deferred_tasks)
+        if self.backlog is not None:
+            statistics["backlog_size"] = self.backlog.pending(run_id)
+
         return {
             "run_id": run_id,
             "cycle_id": cycle_id,
@@ -324,14 +643,66 @@ class GovernanceLoop:
             "trust_updates": trust_updates,
             "reflection": reflection,
             "mutation": mutation_result,
-            "statistics": {
-                "tasks_executed": len(results),
-                "successes": successes,
-                "failures": failures,
-                "avg_latency": sum(r.latency for r in results) / len(results) if results else 0,
-            },
+            "statistics": statistics,
         }
 
+    def _dispatch(
+        self,
+        assignments: List[Any],
+        sorted_tasks: List[Task],
+        agents: Dict[str, Agent],
+        executor: Any,
+        max_concurrency: int,
+    ) -> List[ExecutionResult]:
+        """
+        Execute assignments, optionally fanned out over a thread pool.
+
+        Results are always returned in assignment order, and every worker runs
+        inside a copy of the caller's context so request_id stays attached.
+        """
+        tasks_by_id: Dict[str, Task] = {}
+        for task in sorted_tasks:
+            tasks_by_id.setdefault(task.id, task)
+        work = [(tasks_by_id[a.task_id], agents[a.agent_id]) for a in assignments]
+
+        workers = min(max(1, int(max_concurrency)), len(work))
+        if workers <= 1:
+            return [executor.execute(task, agent) for task, agent in work]
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="syntropiq-dispatch") as pool:
+            futures = [
+                pool.submit(contextvars.copy_context().run, executor.execute, task, agent)
+                for task, agent in work
+            ]
+            return [future.result() for future in futures]
+
+    async def _dispatch_async(
+        self,
+        assignments: List[Any],
+        sorted_tasks: List[Task],
+        agents: Dict[str, Agent],
+        executor: Any,
+        max_concurrency: int,
+    ) -> List[ExecutionResult]:
+        """Asyncio counterpart of _dispatch, bounded by a semaphore."""
+        tasks_by_id: Dict[str, Task] = {}
+        for task in sorted_tasks:
+            tasks_by_id.setdefault(task.id, task)
+        work = [(tasks_by_id[a.task_id], agents[a.agent_id]) for a in assignments]
+        if not work:
+            return []
+
+        aexecute = getattr(executor, "aexecute", None)
+        semaphore = asyncio.Semaphore(min(max(1, int(max_concurrency)), len(work)))
+
+        async def run_one(task: Task, agent: Agent) -> ExecutionResult:
+            async with semaphore:
+                if aexecute is not None:
+                    return await aexecute(task, agent)
+                return await asyncio.to_thread(executor.execute, task, agent)
+
+        return list(await asyncio.gather(*(run_one(task, agent) for task, agent in work)))
+
     def _build_governance_events(
         self,
         run_id: str,
@@ -470,10 +841,11 @@ class GovernanceLoop:
         telemetry_state: Any,
     ) -> None:
         run_key = self._healing_run_key(run_id)
-        state = self._healing_state.setdefault(
-            run_key,
-            {"crisis_cycles": 0, "fs_history": [], "stable_cycles": 0},
-        )
+        state = self.run_state.get("healing", run_key) or {
+            "crisis_cycles": 0,
+            "fs_history": [],
+            "stable_cycles": 0,
+        }
 
         fs_value = float(reflect_decision.get("Fs", 0.0))
         classification = str(reflect_decision.get("classification", "unknown")).lower()
@@ -487,6 +859,7 @@ class GovernanceLoop:
         history = list(state["fs_history"])
         history.append(fs_value)
         state["fs_history"] = history[-50:]
+        self.run_state.put("healing", run_key, state)
 
         if (os.getenv("HEALING_MODE") or "off").strip().lower() != "integrate":
             return
@@ -506,11 +879,19 @@ class GovernanceLoop:
         _, candidate_id = candidate_pairs[0]
         candidate = agents[candidate_id]
 
-        posterior_rows = (
-            telemetry_state.load_bayes_posteriors(run_key, limit=1)
-            if telemetry_state is not None and hasattr(telemetry_state, "load_bayes_posteriors")
-            else []
-        )
+        bayes_tracker = getattr(self.telemetry, "bayes_tracker", None) if self.telemetry is not None else None
+        if bayes_tracker is not None and bayes_tracker.tracks(run_key):
+            # Streaming posterior, current as of the last recorded cycle.
+            posterior_rows = [bayes_tracker.posterior(run_key)]
+        elif telemetry_state is not None and hasattr(telemetry_state, "latest_bayes_posterior"):
+            latest_posterior = telemetry_state.latest_bayes_posterior(run_key)
+            posterior_rows = [latest_posterior] if latest_posterior else []
+        else:
+            posterior_rows = (
+                telemetry_state.load_bayes_posteriors(run_key, limit=1)
+                if telemetry_state is not None and hasattr(telemetry_state, "load_bayes_posteriors")
+                else []
+            )
         posterior_mean = (
             float(posterior_rows[0].get("posterior_mean", posterior_rows[0].get("mean", 0.0)))
             if posterior_rows
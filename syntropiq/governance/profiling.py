@@ -0,0 +1,151 @@
+"""
+Cycle Instrumentation - Stage Timings and Sampled Profiling
+
+StageTimer records monotonic wall time for each named stage of a governance
+cycle and forwards every measurement to an optional ``on_stage`` hook.
+CycleProfiler captures cProfile and tracemalloc data for every Nth cycle and
+is a no-op unless sampling is enabled.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+StageHook = Callable[[str, float, Dict[str, Any]], None]
+
+
+class _Stage:
+    __slots__ = ("_timer", "_name", "_started")
+
+    def __init__(self, timer: "StageTimer", name: str):
+        self._timer = timer
+        self._name = name
+        self._started = 0.0
+
+    def __enter__(self) -> None:
+        self._started = time.perf_counter()
+
+    def __exit__(self, *exc: Any) -> None:
+        self._timer.record(self._name, time.perf_counter() - self._started)
+
+
+class StageTimer:
+    """Accumulates per-stage durations (seconds) for one cycle."""
+
+    __slots__ = ("timings", "context", "_on_stage")
+
+    def __init__(self, on_stage: Optional[StageHook] = None, context: Optional[Dict[str, Any]] = None):
+        self.timings: Dict[str, float] = {}
+        self.context: Dict[str, Any] = context if context is not None else {}
+        self._on_stage = on_stage
+
+    def stage(self, name: str) -> _Stage:
+        return _Stage(self, name)
+
+    def record(self, name: str, duration: float) -> None:
+        self.timings[name] = self.timings.get(name, 0.0) + duration
+        if self._on_stage is not None:
+            try:
+                self._on_stage(name, duration, self.context)
+            except Exception:
+                # Hooks are observers; a failing hook must not fail the cycle.
+                pass
+
+
+class CycleProfile:
+    """cProfile + tracemalloc capture for one sampled cycle."""
+
+    def __init__(self, release: Callable[[], None], top: int):
+        self._release = release
+        self._top = top
+        self._profiler = cProfile.Profile()
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+        self._baseline = tracemalloc.take_snapshot()
+        self._finished = False
+
+    @contextmanager
+    def phase(self) -> Iterator[None]:
+        """Profile the calling thread for the duration of the block."""
+        self._profiler.enable()
+        try:
+            yield
+        finally:
+            self._profiler.disable()
+
+    def finish(self) -> Dict[str, Any]:
+        if self._finished:
+            return {}
+        self._finished = True
+        try:
+            current, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+            allocations = [
+                {
+                    "location": str(stat.traceback),
+                    "size_diff": stat.size_diff,
+                    "count_diff": stat.count_diff,
+                }
+                for stat in snapshot.compare_to(self._baseline, "lineno")[: self._top]
+            ]
+            if self._started_tracing:
+                tracemalloc.stop()
+            return {
+                "cpu": self._cpu_stats(),
+                "memory": {"current_bytes": current, "peak_bytes": peak, "top": allocations},
+            }
+        finally:
+            self._release()
+
+    def _cpu_stats(self) -> List[Dict[str, Any]]:
+        stats = pstats.Stats(self._profiler)
+        rows = []
+        for (filename, lineno, function), (_, calls, total, cumulative, _) in stats.stats.items():
+            rows.append(
+                {
+                    "function": f"{filename}:{lineno}({function})",
+                    "calls": calls,
+                    "total_s": total,
+                    "cumulative_s": cumulative,
+                }
+            )
+        rows.sort(key=lambda row: row["cumulative_s"], reverse=True)
+        return rows[: self._top]
+
+
+class CycleProfiler:
+    """
+    Samples every ``every``-th cycle for profiling; ``every=0`` disables it.
+
+    cProfile and tracemalloc are process-wide, so at most one cycle is
+    profiled at a time; a due cycle that overlaps a running capture is
+    skipped rather than blocked.
+    """
+
+    def __init__(self, every: int = 0, top: int = 25):
+        self.every = max(0, int(every))
+        self.top = max(1, int(top))
+        self._count = 0
+        self._count_lock = threading.Lock()
+        self._busy = threading.Lock()
+
+    def sample(self) -> Optional[CycleProfile]:
+        if not self.every:
+            return None
+        with self._count_lock:
+            self._count += 1
+            due = self._count % self.every == 0
+        if not due or not self._busy.acquire(blocking=False):
+            return None
+        try:
+            return CycleProfile(self._busy.release, self.top)
+        except Exception:
+            self._busy.release()
+            raise
@@ -0,0 +1,40 @@
+"""
+Weighted Sampling - Trust-Weighted Draws for Competitive Routing
+
+WeightedSampler precomputes cumulative weights once per candidate list, so
+each draw is a single uniform variate plus a bisect instead of rebuilding
+the weight list per task. Draws consume the random stream exactly like
+``random.choices(population, weights=weights)``, so seeded runs pick the
+same agents as before.
+"""
+
+from bisect import bisect
+from itertools import accumulate
+from typing import Any, Generic, List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+class WeightedSampler(Generic[T]):
+    """Cumulative-weights sampler; O(n) to build, O(log n) per draw."""
+
+    __slots__ = ("_population", "_cum_weights", "_total", "_hi")
+
+    def __init__(self, population: Sequence[T], weights: Sequence[float]):
+        if not population:
+            raise ValueError("population must not be empty")
+        if len(weights) != len(population):
+            raise ValueError("weights must match population length")
+        self._population: List[T] = list(population)
+        self._cum_weights = list(accumulate(weights))
+        self._total = self._cum_weights[-1] + 0.0
+        if self._total <= 0.0:
+            raise ValueError("total of weights must be greater than zero")
+        self._hi = len(self._population) - 1
+
+    def draw(self, rng: Any) -> T:
+        """
+        Draw one item. ``rng`` is anything with a ``random()`` method: the
+        ``random`` module, a ``random.Random`` or a NumPy ``Generator``.
+        """
+        return self._population[bisect(self._cum_weights, rng.random() * self._total, 0, self._hi)]
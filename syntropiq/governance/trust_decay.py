@@ -0,0 +1,92 @@
+"""
+Idle Trust Decay - Lazy, Time-Based Decay Computed on Read
+
+Agents that receive no tasks would otherwise keep their trust score
+forever. IdleTrustDecay records when each agent's trust was last updated
+and, when the score is next read, decays the part above ``floor`` with the
+configured half-life:
+
+    decayed = floor + (trust - floor) * 0.5 ** (idle_seconds / half_life)
+
+Nothing runs in the background: decay is evaluated only for agents being
+read, and callers persist a decayed value only when it differs from the
+stored (3-decimal) score. Scores at or below ``floor`` never change, so
+idle suppressed agents are not rehabilitated by decay.
+"""
+
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Optional
+
+from syntropiq.core.models import Agent
+
+
+class IdleTrustDecay:
+    """Per-agent ``last_updated`` clock plus an exponential idle-decay policy."""
+
+    def __init__(
+        self,
+        half_life_seconds: float,
+        floor: float = 0.5,
+        clock: Callable[[], float] = time.time,
+    ):
+        if half_life_seconds <= 0:
+            raise ValueError(f"half_life_seconds must be > 0, got {half_life_seconds}")
+        if not 0.0 <= floor <= 1.0:
+            raise ValueError(f"floor must be in [0, 1], got {floor}")
+        self.half_life_seconds = half_life_seconds
+        self.floor = floor
+        self.clock = clock
+        self.last_updated: Dict[str, float] = {}
+
+    def touch(self, agent_id: str, at: Optional[float] = None) -> None:
+        """Record that the agent's trust was just updated (resets its idle time)."""
+        self.last_updated[agent_id] = self.clock() if at is None else at
+
+    def seed(self, agent_id: str, updated_at: Optional[str]) -> None:
+        """
+        Start an agent's clock from its persisted last-activity timestamp
+        (``agent_activity.last_active_at``), if not already tracked.
+        """
+        if agent_id in self.last_updated:
+            return
+        at = None
+        if updated_at:
+            try:
+                at = datetime.fromisoformat(str(updated_at)).timestamp()
+            except ValueError:
+                at = None
+        self.touch(agent_id, at)
+
+    def decayed_score(self, agent_id: str, trust_score: float, now: Optional[float] = None) -> float:
+        """Trust after idle decay (rounded like learned scores); does not mutate state."""
+        last = self.last_updated.get(agent_id)
+        if last is None or trust_score <= self.floor:
+            return trust_score
+        now = self.clock() if now is None else now
+        idle = now - last
+        if idle <= 0:
+            return trust_score
+        factor = 0.5 ** (idle / self.half_life_seconds)
+        return round(self.floor + (trust_score - self.floor) * factor, 3)
+
+    def apply(self, agents: Iterable[Agent], now: Optional[float] = None) -> Dict[str, float]:
+        """
+        Apply idle decay in place to ``agents``.
+
+        Agents without a clock start one now. Returns ``{agent_id: score}``
+        for agents whose score changed, which the caller should persist;
+        their clocks restart at ``now``.
+        """
+        now = self.clock() if now is None else now
+        changed: Dict[str, float] = {}
+        for agent in agents:
+            if agent.id not in self.last_updated:
+                self.last_updated[agent.id] = now
+                continue
+            decayed = self.decayed_score(agent.id, agent.trust_score, now)
+            if decayed != agent.trust_score:
+                agent.trust_score = decayed
+                self.last_updated[agent.id] = now
+                changed[agent.id] = decayed
+        return changed
@@ -5,11 +5,16 @@ Implements governance mechanisms:
 - Circuit-breaker pattern
 - Suppression with redemption cycles
 - Preemptive drift-based decision making
+- Capability-aware routing via an inverted capability index
 """
 
 import random
-from typing import List, Dict, Optional, TYPE_CHECKING
-from syntropiq.core.models import Task, Agent, Assignment
+from typing import Any, List, Dict, Optional, Set, Tuple, TYPE_CHECKING
+from syntropiq.core.models import Task, Agent, Assignment, add_agent_observer
+from syntropiq.governance.drift_detectors import DriftDetector
+from syntropiq.governance.sampling import WeightedSampler
+from syntropiq.governance.trust_decay import IdleTrustDecay
+from syntropiq.governance.trust_index import TrustRankedIndex
 
 if TYPE_CHECKING:
     from syntropiq.persistence.state_manager import PersistentStateManager
@@ -21,8 +26,10 @@ class SyntropiqTrustEngine:
     """
 
     MAX_REDEMPTION_CYCLES = 4
+    TRUST_HISTORY_WINDOW = 10
     PROBATION_RISK_CEILING = 0.4
     PROBATION_TASK_QUOTA = 2  # Low-risk tasks per cycle for redemption
+    ROUTING_MODES = ("deterministic", "competitive", "capacity")
 
     def __init__(
         self,
@@ -30,7 +37,11 @@ class SyntropiqTrustEngine:
         suppression_threshold: Optional[float] = None,
         drift_delta: float = 0.1,
         state_manager: Optional["PersistentStateManager"] = None,
-        routing_mode: str = "deterministic"
+        routing_mode: str = "deterministic",
+        agent_capacity: int = 1,
+        rng: Optional[Any] = None,
+        drift_detector: Optional[DriftDetector] = None,
+        idle_decay: Optional[IdleTrustDecay] = None
     ):
         """
         Args:
@@ -38,7 +49,12 @@ class SyntropiqTrustEngine:
             suppression_threshold: Threshold for entering suppression.
                                    Defaults to trust_threshold.
             drift_delta: Performance drop threshold for drift detection.
-            routing_mode: "deterministic" (top-1) or "competitive" (trust-weighted)
+            routing_mode: "deterministic" (top-1), "competitive" (trust-weighted)
+                          or "capacity" (top-1 with per-agent task limits)
+            agent_capacity: Tasks each agent may take per cycle in "capacity"
+                            mode. Override per agent via ``capacity_limits``.
+            rng: Random source for competitive draws (``random.Random`` or a
+                 NumPy ``Generator``). None uses the global ``random`` module.
         """
         suppression_threshold = suppression_threshold if suppression_threshold is not None else trust_threshold
 
@@ -52,20 +68,41 @@ class SyntropiqTrustEngine:
             )
         if drift_delta <= 0.0:
             raise ValueError(f"drift_delta must be > 0, got {drift_delta}")
-        if routing_mode not in ("deterministic", "competitive"):
-            raise ValueError(f"routing_mode must be 'deterministic' or 'competitive', got {routing_mode!r}")
+        if routing_mode not in self.ROUTING_MODES:
+            raise ValueError(f"routing_mode must be one of {self.ROUTING_MODES}, got {routing_mode!r}")
+        if agent_capacity < 1:
+            raise ValueError(f"agent_capacity must be >= 1, got {agent_capacity}")
 
         self.trust_threshold = trust_threshold
         self.suppression_threshold = suppression_threshold
         self.drift_delta = drift_delta
         self.state_manager = state_manager
         self.routing_mode = routing_mode
+        self.agent_capacity = agent_capacity
+        self.rng = rng
+        self.drift_detector = drift_detector
+        self.idle_decay = idle_decay
+        self.capacity_limits: Dict[str, int] = {}
+        # Tasks left unassigned by the last call because every eligible agent was at capacity
+        self.deferred_tasks: List[str] = []
+        # When set (backlog mode), tasks no agent may take are deferred instead of raising
+        self.defer_ineligible = False
 
         self.trust_history: Dict[str, List[float]] = {}
         self.suppressed_agents: Dict[str, int] = {}
         self.probation_agents: Dict[str, int] = {}
         self.drift_warnings: Dict[str, bool] = {}
 
+        # Inverted index: capability -> ids of agents that declare it
+        self.capability_index: Dict[str, Set[str]] = {}
+        self._indexed_capabilities: Dict[str, Tuple[str, ...]] = {}
+
+        # All routed agents ordered by trust; in-place trust writes re-rank
+        # through the Agent observer hook, so assignment never re-sorts.
+        self.trust_rank = TrustRankedIndex()
+        self._ranked_agents: Dict[str, Agent] = {}
+        self._observing = False
+
     # ---------------------------------------------------------
     # PUBLIC ENTRYPOINT
     # ---------------------------------------------------------
@@ -76,8 +113,10 @@ class SyntropiqTrustEngine:
         agents: Dict[str, Agent]
     ) -> List[Assignment]:
 
+        self._apply_idle_decay(agents.values())
         self._update_trust_history(agents)
         self._detect_drift()
+        self._sync_trust_rank(agents)
 
         active_agents, probation_agents = self._filter_agents(agents)
 
@@ -93,14 +132,29 @@ class SyntropiqTrustEngine:
     # TRUST HISTORY + DRIFT
     # ---------------------------------------------------------
 
+    def _apply_idle_decay(self, agents) -> None:
+        """Lazily decay idle agents' trust; persist only scores that changed."""
+        if self.idle_decay is None:
+            return
+        decayed = self.idle_decay.apply(agents)
+        if decayed and self.state_manager:
+            self.state_manager.update_trust_scores(decayed, reason="idle_decay")
+
     def _update_trust_history(self, agents: Dict[str, Agent]) -> None:
+        detector = self.drift_detector
         for agent_id, agent in agents.items():
             history = self.trust_history.setdefault(agent_id, [])
             history.append(agent.trust_score)
-            if len(history) > 10:
-                self.trust_history[agent_id] = history[-10:]
+            if len(history) > self.TRUST_HISTORY_WINDOW:
+                self.trust_history[agent_id] = history[-self.TRUST_HISTORY_WINDOW:]
+            if detector is not None:
+                drifting = detector.observe(agent_id, agent.trust_score, self.drift_delta)
+                if drifting is not None:
+                    self.drift_warnings[agent_id] = drifting
 
     def _detect_drift(self) -> None:
+        if self.drift_detector is not None:
+            return  # updated incrementally in _update_trust_history
         for agent_id, history in self.trust_history.items():
             if len(history) >= 2:
                 delta = history[-1] - history[-2]
@@ -129,6 +183,8 @@ class SyntropiqTrustEngine:
                     if agent_id in self.probation_agents:
                         del self.probation_agents[agent_id]
                     self.drift_warnings.pop(agent_id, None)
+                    if self.drift_detector is not None:
+                        self.drift_detector.reset(agent_id)
                     agent.status = "active"
                     if self.state_manager:
                         self.state_manager.update_agent_status(agent_id, "active")
@@ -167,76 +223,268 @@ class SyntropiqTrustEngine:
         probation_agents: List[Agent]
     ) -> List[Assignment]:
 
-        assignments = []
-
-        # Rank active agents (healthy first, then drifting)
-        healthy = sorted(
-            [a for a in active_agents if not self.drift_warnings.get(a.id, False)],
-            key=lambda a: a.trust_score,
-            reverse=True
-        )
-        drifting = sorted(
-            [a for a in active_agents if self.drift_warnings.get(a.id, False)],
-            key=lambda a: a.trust_score,
-            reverse=True
-        )
-
-        ranked_active = healthy + drifting
-        ranked_probation = sorted(
+        ranked_active, ranked_probation = self._rank_by_trust(
+            active_agents,
             probation_agents,
-            key=lambda a: a.trust_score,
-            reverse=True
+            # Deterministic routing only ever takes the head of each ranking.
+            heads_only=self.routing_mode == "deterministic",
         )
 
+        restricted = self._capability_rankings(tasks, active_agents, probation_agents)
+        return self._route_tasks(tasks, ranked_active, ranked_probation, restricted)
+
+    def _route_tasks(
+        self,
+        tasks: List[Task],
+        ranked_active: List[Agent],
+        ranked_probation: List[Agent],
+        restricted: Optional[Dict[Tuple[str, ...], Tuple[List[Agent], List[Agent]]]] = None
+    ) -> List[Assignment]:
+        """
+        Route tasks over ranked candidates. ``restricted`` maps a task's
+        required capabilities to rankings of only the agents that have them
+        (see ``_capability_rankings``); unconstrained tasks use the full lists.
+        """
+        restricted = restricted or {}
+        pool_active, pool_probation = ranked_active, ranked_probation
+        assignments = []
+        self.deferred_tasks = []
+        load: Dict[str, int] = {}
+        scratch: Dict[int, Any] = {}
+
         # Redemption requires work: reserve low-risk tasks for probation agents
         # so they can earn trust back. Without this, active agents consume
         # everything and suppressed agents can never recover.
         probation_assigned = 0
 
         for task in tasks:
-            assigned = False
+            required = self.required_capabilities(task)
+            if required:
+                ranked_active, ranked_probation = restricted.get(required, ([], []))
+            else:
+                ranked_active, ranked_probation = pool_active, pool_probation
+            low_risk = task.risk <= self.PROBATION_RISK_CEILING
+            agent = None
 
             # Route low-risk tasks to probation agents for redemption
-            if (ranked_probation
-                    and task.risk <= self.PROBATION_RISK_CEILING
-                    and probation_assigned < self.PROBATION_TASK_QUOTA):
-                agent = self._select_agent(ranked_probation)
-                assignments.append(Assignment(task_id=task.id, agent_id=agent.id))
-                probation_assigned += 1
-                assigned = True
+            if ranked_probation and low_risk and probation_assigned < self.PROBATION_TASK_QUOTA:
+                agent = self._choose_agent(ranked_probation, load, scratch)
+                if agent is not None:
+                    probation_assigned += 1
 
             # Active agents handle everything else
-            elif ranked_active:
-                agent = self._select_agent(ranked_active)
-                assignments.append(Assignment(task_id=task.id, agent_id=agent.id))
-                assigned = True
+            if agent is None and ranked_active:
+                agent = self._choose_agent(ranked_active, load, scratch)
 
             # Last resort: probation for remaining low-risk
-            elif ranked_probation and task.risk <= self.PROBATION_RISK_CEILING:
-                agent = self._select_agent(ranked_probation)
-                assignments.append(Assignment(task_id=task.id, agent_id=agent.id))
-                assigned = True
+            if agent is None and ranked_probation and low_risk:
+                agent = self._choose_agent(ranked_probation, load, scratch)
 
-            if not assigned:
+            if agent is not None:
+                assignments.append(Assignment(task_id=task.id, agent_id=agent.id))
+            elif ranked_active or (ranked_probation and low_risk) or self.defer_ineligible:
+                # Capacity mode: eligible agents exist but are all full this cycle.
+                # Backlog mode: refused tasks (risk ceiling, capabilities) wait.
+                self.deferred_tasks.append(task.id)
+            elif required:
+                raise RuntimeError(
+                    f"No eligible agent for task {task.id} "
+                    f"(risk={task.risk}, capabilities={list(required)})"
+                )
+            else:
                 raise RuntimeError(
                     f"No eligible agent for task {task.id} (risk={task.risk})"
                 )
 
         return assignments
 
-    def _select_agent(self, candidates: List[Agent]) -> Agent:
+    def _choose_agent(
+        self,
+        candidates: List[Agent],
+        load: Dict[str, int],
+        scratch: Dict[int, Any]
+    ) -> Optional[Agent]:
         """
-        Select an agent from candidates based on routing mode.
+        Select an agent from ranked candidates based on routing mode.
 
         deterministic: Always pick the highest-trust agent (top-1).
         competitive: Trust-weighted probabilistic selection.
             P(agent_i) = trust_i / sum(all trust scores)
             Higher trust still dominates, but all eligible agents execute.
+            The sampler is built once per candidate list per call.
+        capacity: Greedy with capacities - the best-ranked agent with spare
+            capacity, or None when all are full. Loads only grow within a
+            cycle, so a per-list cursor skips exhausted agents and each pick
+            is amortized O(1).
+
+        ``scratch`` holds per-call state (sampler or cursor) keyed by list identity.
         """
-        if self.routing_mode == "competitive" and len(candidates) > 1:
-            weights = [max(a.trust_score, 1e-9) for a in candidates]
-            return random.choices(candidates, weights=weights, k=1)[0]
-        return candidates[0]
+        key = id(candidates)
+
+        if self.routing_mode == "competitive":
+            if len(candidates) == 1:
+                return candidates[0]
+            sampler = scratch.get(key)
+            if sampler is None:
+                sampler = scratch[key] = WeightedSampler(
+                    candidates, [max(a.trust_score, 1e-9) for a in candidates]
+                )
+            return sampler.draw(self.rng if self.rng is not None else random)
+
+        if self.routing_mode != "capacity":
+            return candidates[0]
+
+        cursor = scratch.get(key, 0)
+        while cursor < len(candidates):
+            agent = candidates[cursor]
+            used = load.get(agent.id, 0)
+            if used < self.capacity_limits.get(agent.id, self.agent_capacity):
+                load[agent.id] = used + 1
+                scratch[key] = cursor
+                return agent
+            cursor += 1
+        scratch[key] = cursor
+        return None
+
+    # ---------------------------------------------------------
+    # CAPABILITY ROUTING
+    # ---------------------------------------------------------
+
+    @staticmethod
+    def required_capabilities(task: Task) -> Tuple[str, ...]:
+        """
+        Capabilities a task requires, from ``metadata["required_capability"]``
+        (a single name or a list; all listed capabilities are required).
+        """
+        required = (task.metadata or {}).get("required_capability")
+        if not required:
+            return ()
+        if isinstance(required, str):
+            return (required,)
+        return tuple(sorted(set(required)))
+
+    def _index_capabilities(self, agents: List[Agent]) -> None:
+        """Bring ``capability_index`` up to date with the agents' declared capabilities."""
+        for agent in agents:
+            capabilities = tuple(agent.capabilities)
+            previous = self._indexed_capabilities.get(agent.id)
+            if previous == capabilities:
+                continue
+            for capability in previous or ():
+                holders = self.capability_index.get(capability)
+                if holders is not None:
+                    holders.discard(agent.id)
+                    if not holders:
+                        del self.capability_index[capability]
+            for capability in capabilities:
+                self.capability_index.setdefault(capability, set()).add(agent.id)
+            self._indexed_capabilities[agent.id] = capabilities
+
+    def capable_agent_ids(self, required: Tuple[str, ...]) -> Set[str]:
+        """Agents holding every required capability (smallest posting list first)."""
+        postings = sorted(
+            (self.capability_index.get(capability, set()) for capability in required),
+            key=len
+        )
+        if not postings:
+            return set()
+        return postings[0].intersection(*postings[1:])
+
+    def _capability_rankings(
+        self,
+        tasks: List[Task],
+        active_agents: List[Agent],
+        probation_agents: List[Agent],
+        drifting: Optional[Set[str]] = None
+    ) -> Dict[Tuple[str, ...], Tuple[List[Agent], List[Agent]]]:
+        """
+        Rank, per distinct capability requirement, only the agents that meet
+        it. Ordering matches the unrestricted rankings (healthy before
+        drifting, trust descending, then registry order), and ranking work is
+        proportional to each candidate set rather than the whole pool.
+        """
+        requirements = {self.required_capabilities(task) for task in tasks}
+        requirements.discard(())
+        if not requirements:
+            return {}
+
+        if drifting is None:
+            drifting = {agent_id for agent_id, flag in self.drift_warnings.items() if flag}
+        self._index_capabilities(active_agents)
+        self._index_capabilities(probation_agents)
+        active_pos = {agent.id: pos for pos, agent in enumerate(active_agents)}
+        probation_pos = {agent.id: pos for pos, agent in enumerate(probation_agents)}
+
+        rankings = {}
+        for required in requirements:
+            active_keys = []
+            probation_keys = []
+            for agent_id in self.capable_agent_ids(required):
+                if agent_id in active_pos:
+                    pos = active_pos[agent_id]
+                    agent = active_agents[pos]
+                    active_keys.append((agent_id in drifting, -agent.trust_score, pos))
+                elif agent_id in probation_pos:
+                    pos = probation_pos[agent_id]
+                    probation_keys.append((-probation_agents[pos].trust_score, pos))
+            active_keys.sort()
+            probation_keys.sort()
+            rankings[required] = (
+                [active_agents[key[-1]] for key in active_keys],
+                [probation_agents[key[-1]] for key in probation_keys],
+            )
+        return rankings
+
+    def _rank_by_trust(
+        self,
+        active_agents: List[Agent],
+        probation_agents: List[Agent],
+        heads_only: bool = False
+    ) -> Tuple[List[Agent], List[Agent]]:
+        """
+        Active agents (healthy first, then drifting) and probation agents in
+        trust order, read from ``trust_rank`` instead of sorting. Ties keep
+        first-seen order (registry order). With ``heads_only`` the walk stops
+        once the head of each ranking is known.
+        """
+        active_ids = {agent.id for agent in active_agents}
+        probation_ids = {agent.id for agent in probation_agents}
+
+        healthy: List[Agent] = []
+        drifting: List[Agent] = []
+        probation: List[Agent] = []
+        for agent_id in self.trust_rank:
+            if agent_id in active_ids:
+                agent = self._ranked_agents[agent_id]
+                (drifting if self.drift_warnings.get(agent_id, False) else healthy).append(agent)
+            elif agent_id in probation_ids:
+                probation.append(self._ranked_agents[agent_id])
+            else:
+                continue
+            if heads_only and healthy and (probation or not probation_ids):
+                break
+
+        if heads_only:
+            return (healthy[:1] or drifting[:1]), probation[:1]
+        return healthy + drifting, probation
+
+    def _sync_trust_rank(self, agents: Dict[str, Agent]) -> None:
+        """
+        Add agents seen for the first time (or replaced by a new object) to
+        ``trust_rank``, in pool order so ties rank like a stable sort. Agents
+        already ranked are kept current by ``_on_agent_change``.
+        """
+        if not self._observing:
+            add_agent_observer(self._on_agent_change)
+            self._observing = True
+        for agent_id, agent in agents.items():
+            if self._ranked_agents.get(agent_id) is not agent:
+                self._ranked_agents[agent_id] = agent
+                self.trust_rank.upsert(agent_id, agent.trust_score)
+
+    def _on_agent_change(self, agent: Agent, field: str) -> None:
+        if field == "trust_score" and self._ranked_agents.get(agent.id) is agent:
+            self.trust_rank.upsert(agent.id, agent.trust_score)
 
     # ---------------------------------------------------------
     # STATUS INTROSPECTION
@@ -0,0 +1,115 @@
+"""
+Trust-Ranked Index - Incrementally Maintained Agent Ordering
+
+Keeps agents ordered by trust (highest first) so routing can read the top-1
+or top-N candidates without re-sorting the pool on every request.
+
+Ordering matches ``sorted(..., key=trust, reverse=True)`` over agents in
+insertion order: ties are broken by the order agents were first added.
+
+Implemented as a bucketed sorted list: updates cost O(log n + B) and top-N
+reads O(N + log n), where B is the bucket size. All operations take an
+internal lock, so routes on the API threadpool and background syncs can
+share one index.
+"""
+
+import threading
+from bisect import bisect_left, insort
+from typing import Dict, Iterator, List, Tuple
+
+_Key = Tuple[float, int, str]  # (-trust, first-seen sequence, agent_id)
+
+
+class TrustRankedIndex:
+    """Ordered set of agent ids keyed by trust score (descending)."""
+
+    BUCKET_SIZE = 512
+
+    def __init__(self):
+        self._buckets: List[List[_Key]] = []
+        self._maxes: List[_Key] = []
+        self._keys: Dict[str, _Key] = {}
+        self._sequence: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._keys)
+
+    def __contains__(self, agent_id: str) -> bool:
+        with self._lock:
+            return agent_id in self._keys
+
+    def trust_of(self, agent_id: str) -> float:
+        with self._lock:
+            return -self._keys[agent_id][0]
+
+    def upsert(self, agent_id: str, trust_score: float) -> None:
+        """Insert ``agent_id`` or move it to its new trust position."""
+        with self._lock:
+            key = self._keys.get(agent_id)
+            if key is not None:
+                if key[0] == -trust_score:
+                    return
+                self._remove_key(key)
+            sequence = self._sequence.setdefault(agent_id, len(self._sequence))
+            key = (-float(trust_score), sequence, agent_id)
+            self._insert_key(key)
+            self._keys[agent_id] = key
+
+    def discard(self, agent_id: str) -> None:
+        with self._lock:
+            key = self._keys.pop(agent_id, None)
+            if key is not None:
+                self._remove_key(key)
+
+    def top(self, n: int = 1) -> List[str]:
+        """The ``n`` highest-trust agent ids, best first."""
+        result: List[str] = []
+        if n <= 0:
+            return result
+        with self._lock:
+            for bucket in self._buckets:
+                for key in bucket:
+                    result.append(key[2])
+                    if len(result) == n:
+                        return result
+        return result
+
+    def __iter__(self) -> Iterator[str]:
+        # Snapshot under the lock; concurrent updates do not affect iteration.
+        with self._lock:
+            ids = [key[2] for bucket in self._buckets for key in bucket]
+        return iter(ids)
+
+    # ---------------------------------------------------------
+    # BUCKETED SORTED LIST
+    # ---------------------------------------------------------
+
+    def _insert_key(self, key: _Key) -> None:
+        if not self._buckets:
+            self._buckets.append([key])
+            self._maxes.append(key)
+            return
+        pos = bisect_left(self._maxes, key)
+        if pos == len(self._maxes):
+            pos -= 1
+            self._buckets[pos].append(key)
+            self._maxes[pos] = key
+        else:
+            insort(self._buckets[pos], key)
+        if len(self._buckets[pos]) > 2 * self.BUCKET_SIZE:
+            bucket = self._buckets[pos]
+            half = len(bucket) // 2
+            self._buckets[pos:pos + 1] = [bucket[:half], bucket[half:]]
+            self._maxes[pos:pos + 1] = [bucket[half - 1], bucket[-1]]
+
+    def _remove_key(self, key: _Key) -> None:
+        pos = bisect_left(self._maxes, key)
+        bucket = self._buckets[pos]
+        del bucket[bisect_left(bucket, key)]
+        if not bucket:
+            del self._buckets[pos]
+            del self._maxes[pos]
+        else:
+            self._maxes[pos] = bucket[-1]
@@ -1,4 +1,5 @@
-from syntropiq.optimize.bayes_posterior import compute_beta_posterior, posterior_from_cycles
+from syntropiq.optimize.batch_optimizer import BatchOptimizeResult, score_lambda_batch
+from syntropiq.optimize.bayes_posterior import BayesPosteriorTracker, compute_beta_posterior, posterior_from_cycles
 from syntropiq.optimize.config import (
     get_bayes_mode,
     get_current_lambda,
@@ -16,6 +17,8 @@ __all__ = [
     "OptimizeInput",
     "OptimizeDecision",
     "optimize_tasks",
+    "score_lambda_batch",
+    "BatchOptimizeResult",
     "get_optimize_mode",
     "get_lambda_adapt_mode",
     "get_bayes_mode",
@@ -25,4 +28,5 @@ __all__ = [
     "compute_adaptive_lambda",
     "compute_beta_posterior",
     "posterior_from_cycles",
+    "BayesPosteriorTracker",
 ]
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
-from typing import Dict, Iterable
+import threading
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
 
 
 def compute_beta_posterior(successes: int, failures: int, alpha0: float = 1.0, beta0: float = 1.0) -> Dict[str, float]:
     alpha = float(alpha0) + max(0, int(successes))
     beta = float(beta0) + max(0, int(failures))
+    return beta_summary(alpha, beta)
+
+
+def beta_summary(alpha: float, beta: float) -> Dict[str, float]:
     denom = alpha + beta
 
     mean = alpha / denom if denom > 0 else 0.5
@@ -34,3 +40,184 @@ def posterior_from_cycles(cycles: Iterable[dict], alpha0: float = 1.0, beta0: fl
         successes += int(cycle.get("successes", 0))
         failures += int(cycle.get("failures", 0))
     return compute_beta_posterior(successes=successes, failures=failures, alpha0=alpha0, beta0=beta0)
+
+
+def _run_key(run_id: Any) -> str:
+    # Same run root as the telemetry ledger, so counters cover load_cycles_by_run_id.
+    run_text = str(run_id).strip() if run_id is not None else ""
+    return run_text.split(":", 1)[0] if run_text else "GLOBAL"
+
+
+class _Counts:
+    __slots__ = ("successes", "failures", "recent")
+
+    def __init__(self, window: Optional[int]):
+        self.successes = 0.0
+        self.failures = 0.0
+        self.recent: Optional[Deque[Tuple[int, int]]] = deque() if window is not None else None
+
+
+class BayesPosteriorTracker:
+    """
+    Running Beta(alpha, beta) posteriors per run (and optionally per agent).
+
+    Each recorded cycle updates its run's counters in O(1), replacing the
+    re-summing of reloaded cycles done by ``posterior_from_cycles``. Old
+    evidence is dropped either with a sliding ``window`` of cycles (the
+    default 50 matches ``posterior_from_cycles(cycles[-50:])``) or by
+    exponential ``forgetting`` (counts are multiplied by it per update).
+
+    Like the telemetry hub's run windows, only seeded keys are tracked: the
+    first ``posterior()`` call for a key seeds it from the ledger, after
+    which ``observe_*`` keeps it current (per-agent keys start empty). Keys are LRU-bounded by
+    ``max_keys``; an evicted key is simply re-seeded on its next read.
+    """
+
+    def __init__(
+        self,
+        window: Optional[int] = 50,
+        forgetting: float = 1.0,
+        alpha0: float = 1.0,
+        beta0: float = 1.0,
+        per_agent: bool = False,
+        max_keys: int = 1024,
+    ):
+        if window is not None and window < 1:
+            raise ValueError(f"window must be >= 1, got {window}")
+        if not 0.0 < forgetting <= 1.0:
+            raise ValueError(f"forgetting must be in (0, 1], got {forgetting}")
+        if window is not None and forgetting < 1.0:
+            raise ValueError("use either a sliding window or exponential forgetting, not both")
+
+        self.window = window
+        self.forgetting = forgetting
+        self.alpha0 = alpha0
+        self.beta0 = beta0
+        self.per_agent = per_agent
+        self._max_keys = max(1, int(max_keys))
+        self._counts: "OrderedDict[str, _Counts]" = OrderedDict()
+        self._snapshots: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(run_id: Any, agent_id: Optional[str] = None) -> str:
+        run_key = _run_key(run_id)
+        return f"{run_key}/{agent_id}" if agent_id is not None else run_key
+
+    def tracks(self, run_id: Any, agent_id: Optional[str] = None) -> bool:
+        with self._lock:
+            return self._key(run_id, agent_id) in self._counts
+
+    # ---------------------------------------------------------
+    # UPDATES
+    # ---------------------------------------------------------
+
+    def observe_cycle(self, cycle: Dict[str, Any]) -> None:
+        """Fold one recorded cycle into its run's counters (no-op for untracked runs)."""
+        self._observe(self._key(cycle.get("run_id")), int(cycle.get("successes", 0)), int(cycle.get("failures", 0)))
+
+    def observe_results(self, run_id: Any, results: Iterable[Any]) -> None:
+        """Fold execution results into per-agent counters (requires ``per_agent``)."""
+        if not self.per_agent:
+            return
+        by_agent: Dict[str, List[int]] = {}
+        for result in results:
+            counts = by_agent.setdefault(result.agent_id, [0, 0])
+            counts[0 if result.success else 1] += 1
+        for agent_id, (successes, failures) in by_agent.items():
+            self._observe(self._key(run_id, agent_id), successes, failures, create=True)
+
+    def _observe(self, key: str, successes: int, failures: int, create: bool = False) -> None:
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                if not create:
+                    return
+                counts = self._insert(key)
+            else:
+                self._counts.move_to_end(key)
+            self._add(counts, max(0, successes), max(0, failures))
+
+    def _add(self, counts: _Counts, successes: int, failures: int) -> None:
+        if counts.recent is not None:
+            counts.recent.append((successes, failures))
+            counts.successes += successes
+            counts.failures += failures
+            if len(counts.recent) > self.window:
+                old_successes, old_failures = counts.recent.popleft()
+                counts.successes -= old_successes
+                counts.failures -= old_failures
+        else:
+            counts.successes = counts.successes * self.forgetting + successes
+            counts.failures = counts.failures * self.forgetting + failures
+
+    def _insert(self, key: str) -> _Counts:
+        counts = _Counts(self.window)
+        self._counts[key] = counts
+        while len(self._counts) > self._max_keys:
+            evicted, _ = self._counts.popitem(last=False)
+            self._snapshots.pop(evicted, None)
+        return counts
+
+    # ---------------------------------------------------------
+    # READS
+    # ---------------------------------------------------------
+
+    def posterior(
+        self,
+        run_id: Any,
+        agent_id: Optional[str] = None,
+        seed: Optional[Callable[[], Iterable[dict]]] = None,
+    ) -> Dict[str, float]:
+        """
+        Current posterior for a run, or one agent within it. An untracked
+        key is seeded from ``seed()`` (cycles, oldest first) when given;
+        otherwise the prior is returned.
+        """
+        run_key = self._key(run_id, agent_id)
+        with self._lock:
+            counts = self._counts.get(run_key)
+            if counts is not None:
+                self._counts.move_to_end(run_key)
+                return self._summary(counts)
+
+        cycles = list(seed()) if seed is not None else None
+        with self._lock:
+            counts = self._counts.get(run_key)
+            if counts is None:
+                if cycles is None:
+                    return beta_summary(float(self.alpha0), float(self.beta0))
+                counts = self._insert(run_key)
+                history = cycles[-self.window:] if self.window is not None else cycles
+                for cycle in history:
+                    self._add(counts, max(0, int(cycle.get("successes", 0))), max(0, int(cycle.get("failures", 0))))
+            return self._summary(counts)
+
+    def _summary(self, counts: _Counts) -> Dict[str, float]:
+        return beta_summary(float(self.alpha0) + counts.successes, float(self.beta0) + counts.failures)
+
+    def snapshot(
+        self,
+        run_id: Any,
+        ledger: Any,
+        agent_id: Optional[str] = None,
+        seed: Optional[Callable[[], Iterable[dict]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Posterior as a ledger payload, saved through
+        ``ledger.save_bayes_posterior`` only when alpha/beta changed since
+        the key's last snapshot.
+        """
+        payload: Dict[str, Any] = {"run_id": str(run_id)}
+        if agent_id is not None:
+            payload["agent_id"] = agent_id
+        payload.update(self.posterior(run_id, agent_id=agent_id, seed=seed))
+        key = self._key(run_id, agent_id)
+        current = (payload["alpha"], payload["beta"])
+        with self._lock:
+            changed = self._snapshots.get(key) != current
+            if changed:
+                self._snapshots[key] = current
+        if changed and ledger is not None:
+            ledger.save_bayes_posterior(payload)
+        return payload
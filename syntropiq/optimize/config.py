@@ -4,8 +4,10 @@ import json
 import os
 
 from syntropiq.optimize.schema import LambdaVector
+from syntropiq.persistence.run_state import get_run_state_store
 
-_APPLIED_LAMBDA: dict[str, LambdaVector] = {}
+# Applied lambdas per run live in the shared bounded run-state store.
+_APPLIED_LAMBDA_NAMESPACE = "applied_lambda"
 
 
 def get_optimize_mode() -> str:
@@ -29,6 +31,20 @@ def get_bayes_mode() -> str:
     return "off"
 
 
+def get_bayes_window() -> int | None:
+    # Cycles in the sliding posterior window; 0 disables it (use forgetting).
+    window = int(os.getenv("OPTIMIZE_BAYES_WINDOW", "50"))
+    return window if window > 0 else None
+
+
+def get_bayes_forgetting() -> float:
+    return float(os.getenv("OPTIMIZE_BAYES_FORGETTING", "1.0"))
+
+
+def get_bayes_per_agent() -> bool:
+    return (os.getenv("OPTIMIZE_BAYES_PER_AGENT") or "false").strip().lower() == "true"
+
+
 def get_default_lambda_vector() -> LambdaVector:
     defaults_json = os.getenv("OPTIMIZE_LAMBDA_DEFAULTS")
 
@@ -55,17 +71,17 @@ def get_default_lambda_vector() -> LambdaVector:
 
 
 def get_current_lambda(run_id: str | None = None) -> LambdaVector:
-    if run_id and run_id in _APPLIED_LAMBDA:
-        current = _APPLIED_LAMBDA[run_id]
-        return LambdaVector(**current.as_dict()).enforce_bounds().normalize()
-    if "GLOBAL" in _APPLIED_LAMBDA:
-        current = _APPLIED_LAMBDA["GLOBAL"]
-        return LambdaVector(**current.as_dict()).enforce_bounds().normalize()
+    store = get_run_state_store()
+    current = store.get(_APPLIED_LAMBDA_NAMESPACE, run_id) if run_id else None
+    if current is None:
+        current = store.get(_APPLIED_LAMBDA_NAMESPACE, "GLOBAL")
+    if current is not None:
+        return LambdaVector(**current).enforce_bounds().normalize()
     return get_default_lambda_vector()
 
 
 def set_current_lambda(new_lambda: LambdaVector, run_id: str | None = None) -> LambdaVector:
     key = run_id or "GLOBAL"
     normalized = LambdaVector(**new_lambda.as_dict()).enforce_bounds().normalize()
-    _APPLIED_LAMBDA[key] = normalized
+    get_run_state_store().put(_APPLIED_LAMBDA_NAMESPACE, key, normalized.as_dict())
     return LambdaVector(**normalized.as_dict())
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import Dict, Tuple
 
 from syntropiq.optimize.schema import LambdaVector
+from syntropiq.persistence.run_state import get_run_state_store
 
 
 def _clamp(value: float, low: float, high: float) -> float:
@@ -17,15 +18,17 @@ class _AdaptationState:
     recovery_active: bool = False
 
 
-_STATE_BY_RUN: Dict[str, _AdaptationState] = {}
+# Per-run state lives in the shared bounded run-state store.
+_STATE_NAMESPACE = "lambda_adaptation"
 
 
 def _get_state(run_key: str) -> _AdaptationState:
-    state = _STATE_BY_RUN.get(run_key)
-    if state is None:
-        state = _AdaptationState()
-        _STATE_BY_RUN[run_key] = state
-    return state
+    payload = get_run_state_store().get(_STATE_NAMESPACE, run_key)
+    return _AdaptationState(**payload) if payload is not None else _AdaptationState()
+
+
+def _save_state(run_key: str, state: _AdaptationState) -> None:
+    get_run_state_store().put(_STATE_NAMESPACE, run_key, asdict(state))
 
 
 def compute_adaptive_lambda(base: LambdaVector, signals: dict, bounds: dict) -> Tuple[LambdaVector, Dict[str, float]]:
@@ -61,6 +64,7 @@ def compute_adaptive_lambda(base: LambdaVector, signals: dict, bounds: dict) ->
             state.recovery_active = True
         if state.stable_cycles >= 5:
             state.recovery_active = False
+        _save_state(run_key, state)
 
     proposed = {
         "l_cost": 0.0,
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Any, Dict, List
 
 from syntropiq.core.models import Task
 from syntropiq.optimize.schema import LambdaVector, OptimizeDecision, OptimizeInput
@@ -42,19 +42,35 @@ def compute_alignment_score(tasks: List[Task], scores: Dict[str, float]) -> floa
     return max(0.0, min(100.0, alignment))
 
 
-def optimize_tasks(input: OptimizeInput, lambda_vector: LambdaVector, run_id: str = "OPT_RUN") -> OptimizeDecision:
+def bounded_lambda(lambda_vector: LambdaVector) -> LambdaVector:
+    """Bounded, normalized copy of ``lambda_vector`` (the input is not modified)."""
     lam = LambdaVector(
         l_cost=lambda_vector.l_cost,
         l_time=lambda_vector.l_time,
         l_risk=lambda_vector.l_risk,
         l_trust=lambda_vector.l_trust,
     )
-    lam.enforce_bounds().normalize()
+    return lam.enforce_bounds().normalize()
+
+
+def mean_trust(trust_by_agent: Dict[str, float]) -> float:
+    if not trust_by_agent:
+        return 0.0
+    return sum(float(v) for v in trust_by_agent.values()) / len(trust_by_agent)
+
+
+def decision_context(input: OptimizeInput) -> Dict[str, Any]:
+    context = dict(input.context or {})
+    if input.request_id:
+        context.setdefault("request_id", input.request_id)
+    if input.actor:
+        context.setdefault("actor", input.actor)
+    return context
 
-    if input.trust_by_agent:
-        trust_term = sum(float(v) for v in input.trust_by_agent.values()) / len(input.trust_by_agent)
-    else:
-        trust_term = 0.0
+
+def optimize_tasks(input: OptimizeInput, lambda_vector: LambdaVector, run_id: str = "OPT_RUN") -> OptimizeDecision:
+    lam = bounded_lambda(lambda_vector)
+    trust_term = mean_trust(input.trust_by_agent)
 
     scored = []
     score_breakdown: Dict[str, Dict[str, float]] = {}
@@ -75,16 +91,10 @@ def optimize_tasks(input: OptimizeInput, lambda_vector: LambdaVector, run_id: st
 
     alignment_score = compute_alignment_score(input.tasks, flat_scores)
 
-    context = dict(input.context or {})
-    if input.request_id:
-        context.setdefault("request_id", input.request_id)
-    if input.actor:
-        context.setdefault("actor", input.actor)
-
     decision = OptimizeDecision.new(
         run_id=run_id,
         lambda_vector=lam.as_dict(),
-        V_prime=context,
+        V_prime=decision_context(input),
         alignment_score=alignment_score,
         chosen_task_ids=ordered_ids,
         score_breakdown=score_breakdown,
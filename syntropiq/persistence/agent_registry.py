@@ -5,12 +5,20 @@ Manages agent registration, trust score persistence, and lifecycle operations.
 Connects agents to the database for trust score continuity across restarts.
 """
 
-from typing import List, Dict, Optional
-from syntropiq.core.models import Agent
+import threading
+from typing import List, Dict, Optional, Tuple
+from syntropiq.core.models import Agent, add_agent_observer
 from syntropiq.core.exceptions import NoAgentsAvailable, TrustScoreInvalid
+from syntropiq.governance.trust_decay import IdleTrustDecay
+from syntropiq.governance.trust_index import TrustRankedIndex
 from syntropiq.persistence.state_manager import PersistentStateManager
 
 
+def is_routable(agent) -> bool:
+    """Routing eligibility shared by the trust index and the execute route."""
+    return getattr(agent, "status", None) != "suppressed"
+
+
 class AgentRegistry:
     """
     Manages agent lifecycle and trust score persistence.
@@ -20,24 +28,37 @@ class AgentRegistry:
     - Load trust scores from database
     - Activate/deactivate agents
     - Sync agent state with database
+    - Keep non-suppressed agents ranked by trust for routing
+
+    Agent objects are shared with the governance loop, trust engines,
+    healing and mutation, which change trust and status in place. The
+    registry observes those assignments (``add_agent_observer``) and re-ranks
+    the written agent immediately, so ``top_trusted()`` reads the index as is.
+    Call ``refresh_agent()`` only after replacing an Agent object outright.
     """
     
-    def __init__(self, state_manager: PersistentStateManager):
+    def __init__(self, state_manager: PersistentStateManager, idle_decay: Optional[IdleTrustDecay] = None):
         """
         Initialize agent registry.
         
         Args:
             state_manager: Database manager for persistence
+            idle_decay: Optional idle-decay policy applied lazily in get_agents_dict()
         """
         self.state = state_manager
         self.agents: Dict[str, Agent] = {}
+        self.trust_index = TrustRankedIndex()
+        self.idle_decay = idle_decay
+        self._index_lock = threading.RLock()
+        add_agent_observer(self._on_agent_change)
     
     def register_agent(
         self,
         agent_id: str,
         capabilities: List[str],
         initial_trust_score: float = 0.5,
-        status: str = "active"
+        status: str = "active",
+        stored: Optional[Dict[str, Tuple[float, Optional[str]]]] = None
     ) -> Agent:
         """
         Register a new agent or update existing agent.
@@ -47,6 +68,8 @@ class AgentRegistry:
             capabilities: List of capabilities (e.g., ["fraud_detection", "risk_analysis"])
             initial_trust_score: Starting trust score (0.0-1.0)
             status: Agent status ("active", "inactive", "suspended")
+            stored: Preloaded ``state.get_agent_trust_state()`` for bulk
+                registration; None looks up only this agent
             
         Returns:
             Registered Agent object
@@ -58,11 +81,13 @@ class AgentRegistry:
             raise TrustScoreInvalid(f"Trust score must be in [0.0, 1.0], got {initial_trust_score}")
         
         # Check if agent already exists in database
-        existing_scores = self.state.get_trust_scores()
+        if stored is None:
+            stored = self.state.get_agent_trust_state([agent_id])
+        existing = stored.get(agent_id)
         
-        if agent_id in existing_scores:
+        if existing is not None:
             # Agent exists - use database trust score
-            trust_score = existing_scores[agent_id]
+            trust_score = existing[0]
             print(f"🔄 Agent {agent_id} already registered (trust: {trust_score:.3f})")
         else:
             # New agent - use initial trust score
@@ -79,6 +104,9 @@ class AgentRegistry:
         )
         
         self.agents[agent_id] = agent
+        if self.idle_decay is not None:
+            self.idle_decay.seed(agent_id, existing[1] if existing is not None else None)
+        self.refresh_agent(agent_id)
         return agent
     
     def get_agent(self, agent_id: str) -> Optional[Agent]:
@@ -112,9 +140,16 @@ class AgentRegistry:
         Returns:
             Dictionary of {agent_id: Agent}
         """
-        if status:
-            return {a.id: a for a in self.list_agents(status=status)}
-        return {a.id: a for a in self.list_agents()}
+        agents = self.list_agents(status=status) if status else self.list_agents()
+        if self.idle_decay is not None:
+            self._apply_idle_decay(agents)
+        return {a.id: a for a in agents}
+
+    def _apply_idle_decay(self, agents: List[Agent]):
+        """Decay idle agents' trust on read; persist only scores that changed."""
+        decayed = self.idle_decay.apply(agents)
+        if decayed:
+            self.state.update_trust_scores(decayed, reason="idle_decay")
     
     def update_agent_status(self, agent_id: str, status: str):
         """
@@ -144,6 +179,34 @@ class AgentRegistry:
         
         print(f"🔄 Synced trust scores for {len(db_scores)} agents")
     
+    def refresh_agent(self, agent_id: str):
+        """
+        Re-rank one agent in the trust index from its current trust and status.
+
+        Agents that are not routable (suppressed, or unknown) are removed.
+        """
+        with self._index_lock:
+            agent = self.agents.get(agent_id)
+            if agent is None or not is_routable(agent):
+                self.trust_index.discard(agent_id)
+            else:
+                self.trust_index.upsert(agent_id, agent.trust_score)
+
+    def _on_agent_change(self, agent: Agent, field: str):
+        # Only this registry's own Agent objects, not copies sharing an id.
+        if self.agents.get(agent.id) is agent:
+            self.refresh_agent(agent.id)
+
+    def top_trusted(self, n: int = 1) -> List[str]:
+        """
+        Return the ``n`` highest-trust routable agent ids, best first.
+
+        Ties keep registration order, matching a stable descending sort of
+        ``self.agents``. O(n + log N): in-place writes are applied to the
+        index as they happen (see ``_on_agent_change``).
+        """
+        return self.trust_index.top(n)
+
     def load_agents_from_defaults(self, default_agents: List[Agent]):
         """
         Load agents from a default list (useful for initialization).
@@ -151,12 +214,14 @@ class AgentRegistry:
         Args:
             default_agents: List of Agent objects to register
         """
+        stored = self.state.get_agent_trust_state()
         for agent in default_agents:
             self.register_agent(
                 agent_id=agent.id,
                 capabilities=agent.capabilities,
                 initial_trust_score=agent.trust_score,
-                status=agent.status
+                status=agent.status,
+                stored=stored
             )
     
     def get_agent_statistics(self) -> Dict:
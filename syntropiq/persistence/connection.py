@@ -0,0 +1,160 @@
+"""
+SQLite Connection Pool - Shared connection layer for Syntropiq stores
+
+Both the governance state store and the telemetry ledger go through this pool:
+one dedicated writer connection serialized behind a lock, plus a bounded set
+of reader connections. With WAL enabled, readers see the last committed state
+and never wait on the writer.
+"""
+
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Union
+
+from syntropiq.core.config import DatabaseConfig
+
+
+SYNCHRONOUS_LEVELS = {"OFF", "NORMAL", "FULL", "EXTRA"}
+
+
+class SQLiteConnectionPool:
+    """
+    Thread-safe SQLite connection pool.
+
+    ``write()`` yields the single writer connection and commits when the
+    outermost block exits (rolling back on error). ``read()`` checks out one
+    of at most ``pool_size`` reader connections. In-memory databases are
+    private to one connection, so reads and writes share the writer there.
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        pool_size: int = 5,
+        enable_wal: bool = True,
+        synchronous: str = "NORMAL",
+        cache_size: int = -16000,
+        mmap_size: int = 134217728,
+        timeout: float = 30.0,
+        row_factory: Optional[Callable[..., Any]] = None,
+    ):
+        if pool_size < 1:
+            raise ValueError(f"pool_size must be >= 1, got {pool_size}")
+        synchronous = str(synchronous).upper()
+        if synchronous not in SYNCHRONOUS_LEVELS:
+            raise ValueError(
+                f"synchronous must be one of {sorted(SYNCHRONOUS_LEVELS)}, got {synchronous!r}"
+            )
+
+        self.db_path = str(db_path)
+        self.pool_size = int(pool_size)
+        self.synchronous = synchronous
+        self.cache_size = int(cache_size)
+        self.mmap_size = int(mmap_size)
+        self.timeout = float(timeout)
+        self.row_factory = row_factory
+        self.in_memory = self.db_path == ":memory:"
+        self.enable_wal = bool(enable_wal) and not self.in_memory
+
+        self._write_lock = threading.RLock()
+        self._write_depth = 0
+        self._readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._reader_slots = threading.BoundedSemaphore(self.pool_size)
+        self._closed = False
+
+        self._writer = self._connect()
+        if self.enable_wal:
+            self._writer.execute("PRAGMA journal_mode=WAL")
+
+    @classmethod
+    def from_config(
+        cls,
+        db_path: Union[str, Path],
+        config: Optional[DatabaseConfig] = None,
+        row_factory: Optional[Callable[..., Any]] = None,
+    ) -> "SQLiteConnectionPool":
+        """Build a pool for ``db_path`` using the tuning in ``DatabaseConfig``."""
+        config = config or DatabaseConfig()
+        return cls(
+            db_path,
+            pool_size=config.connection_pool_size,
+            enable_wal=config.enable_wal,
+            synchronous=config.synchronous,
+            cache_size=config.cache_size,
+            mmap_size=config.mmap_size,
+            timeout=config.busy_timeout,
+            row_factory=row_factory,
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout, check_same_thread=False)
+        if self.row_factory is not None:
+            conn.row_factory = self.row_factory
+        conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        conn.execute(f"PRAGMA cache_size={self.cache_size}")
+        conn.execute(f"PRAGMA mmap_size={self.mmap_size}")
+        return conn
+
+    @property
+    def writer(self) -> sqlite3.Connection:
+        """The dedicated writer connection (hold ``write()`` before using it)."""
+        return self._writer
+
+    @contextmanager
+    def write(self) -> Iterator[sqlite3.Connection]:
+        """Serialize access to the writer; the outermost block commits once."""
+        with self._write_lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Cannot operate on a closed connection pool.")
+            self._write_depth += 1
+            try:
+                yield self._writer
+            except BaseException:
+                self._write_depth -= 1
+                if self._write_depth == 0:
+                    self._writer.rollback()
+                raise
+            self._write_depth -= 1
+            if self._write_depth == 0:
+                self._writer.commit()
+
+    @contextmanager
+    def read(self) -> Iterator[sqlite3.Connection]:
+        """Check out a reader connection for the duration of the block."""
+        if self.in_memory:
+            with self._write_lock:
+                yield self._writer
+            return
+
+        self._reader_slots.acquire()
+        try:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Cannot operate on a closed connection pool.")
+            try:
+                conn = self._readers.get_nowait()
+            except queue.Empty:
+                conn = self._connect()
+            try:
+                yield conn
+            finally:
+                if conn.in_transaction:
+                    conn.rollback()
+                self._readers.put(conn)
+        finally:
+            self._reader_slots.release()
+
+    def close(self) -> None:
+        """Close the writer and every idle reader connection."""
+        with self._write_lock:
+            if self._closed:
+                return
+            self._closed = True
+            while True:
+                try:
+                    self._readers.get_nowait().close()
+                except queue.Empty:
+                    break
+            self._writer.close()
@@ -0,0 +1,181 @@
+"""
+Run State Store - Bounded, Persistent Per-Run State
+
+Small JSON-serializable state keyed by ``(namespace, run_key)``, used for
+per-run adaptation state (lambda adaptation counters, applied lambdas,
+healing-reflex history). Long-lived servers see an unbounded stream of
+run ids, so the in-memory cache is LRU-bounded by ``max_entries`` and
+entries idle for ``ttl_seconds`` are evicted. With a ``db_path`` every
+change is written through to SQLite and evicted or restarted entries are
+rehydrated lazily on their next access.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from syntropiq.core.config import DatabaseConfig
+from syntropiq.persistence.connection import SQLiteConnectionPool
+
+
+class RunStateStore:
+    """LRU/TTL cache of per-run JSON state with optional SQLite write-through."""
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        database_config: Optional[DatabaseConfig] = None,
+        max_entries: int = 10000,
+        ttl_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            db_path: SQLite file for write-through persistence. None keeps
+                state in memory only (evicted entries are lost).
+            database_config: Pool size, WAL and pragma tuning.
+            max_entries: Entries kept in memory across all namespaces.
+            ttl_seconds: Evict entries not accessed for this long (None = never).
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError(f"ttl_seconds must be > 0, got {ttl_seconds}")
+
+        self.max_entries = int(max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        # (namespace, run_key) -> (payload_json, last_access)
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._pool: Optional[SQLiteConnectionPool] = None
+        if db_path is not None:
+            self._pool = SQLiteConnectionPool.from_config(db_path, database_config)
+            with self._pool.write() as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS run_state (
+                        namespace TEXT NOT NULL,
+                        run_key TEXT NOT NULL,
+                        payload TEXT NOT NULL,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        PRIMARY KEY (namespace, run_key)
+                    )
+                """)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cache)
+
+    def get(self, namespace: str, run_key: str) -> Optional[Dict[str, Any]]:
+        """Return a fresh copy of the stored state, or None if there is none."""
+        key = (namespace, run_key)
+        now = self.clock()
+        with self._lock:
+            self._expire(now)
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache[key] = (entry[0], now)
+                self._cache.move_to_end(key)
+                return json.loads(entry[0])
+
+        payload = self._load(namespace, run_key)
+        if payload is None:
+            return None
+        with self._lock:
+            # Another thread may have written meanwhile; its value wins.
+            entry = self._cache.get(key)
+            if entry is not None:
+                payload = entry[0]
+            self._insert(key, payload, now)
+        return json.loads(payload)
+
+    def put(self, namespace: str, run_key: str, value: Dict[str, Any]) -> None:
+        """Store ``value`` (JSON-serializable); unchanged values are not rewritten."""
+        key = (namespace, run_key)
+        payload = json.dumps(value, sort_keys=True)
+        now = self.clock()
+        with self._lock:
+            self._expire(now)
+            entry = self._cache.get(key)
+            self._insert(key, payload, now)
+            if entry is not None and entry[0] == payload:
+                return
+            if self._pool is not None:
+                with self._pool.write() as conn:
+                    conn.execute("""
+                        INSERT INTO run_state (namespace, run_key, payload, updated_at)
+                        VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                        ON CONFLICT(namespace, run_key) DO UPDATE SET
+                            payload = excluded.payload,
+                            updated_at = excluded.updated_at
+                        WHERE payload != excluded.payload
+                    """, (namespace, run_key, payload))
+
+    def delete(self, namespace: str, run_key: str) -> None:
+        with self._lock:
+            self._cache.pop((namespace, run_key), None)
+            if self._pool is not None:
+                with self._pool.write() as conn:
+                    conn.execute(
+                        "DELETE FROM run_state WHERE namespace = ? AND run_key = ?",
+                        (namespace, run_key),
+                    )
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """Drop cached and persisted state (for one namespace, or all)."""
+        with self._lock:
+            for key in [key for key in self._cache if namespace is None or key[0] == namespace]:
+                del self._cache[key]
+            if self._pool is not None:
+                with self._pool.write() as conn:
+                    if namespace is None:
+                        conn.execute("DELETE FROM run_state")
+                    else:
+                        conn.execute("DELETE FROM run_state WHERE namespace = ?", (namespace,))
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+
+    def _load(self, namespace: str, run_key: str) -> Optional[str]:
+        if self._pool is None:
+            return None
+        with self._pool.read() as conn:
+            row = conn.execute(
+                "SELECT payload FROM run_state WHERE namespace = ? AND run_key = ?",
+                (namespace, run_key),
+            ).fetchone()
+        return row[0] if row else None
+
+    def _insert(self, key: Tuple[str, str], payload: str, now: float) -> None:
+        self._cache[key] = (payload, now)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+    def _expire(self, now: float) -> None:
+        # Access order is LRU order, so idle entries sit at the front.
+        if self.ttl_seconds is None:
+            return
+        while self._cache:
+            key, (_, last_access) = next(iter(self._cache.items()))
+            if now - last_access < self.ttl_seconds:
+                break
+            del self._cache[key]
+
+
+_DEFAULT_STORE = RunStateStore()
+
+
+def get_run_state_store() -> RunStateStore:
+    """Process-wide store used by lambda adaptation and applied lambdas."""
+    return _DEFAULT_STORE
+
+
+def set_run_state_store(store: RunStateStore) -> RunStateStore:
+    """Replace the process-wide store (e.g. with a persistent one at startup); returns the old one."""
+    global _DEFAULT_STORE
+    previous, _DEFAULT_STORE = _DEFAULT_STORE, store
+    return previous
@@ -7,10 +7,48 @@ to enable continuous operation and trust convergence over time.
 
 import sqlite3
 import json
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 
+from syntropiq.core.config import DatabaseConfig
+from syntropiq.persistence.connection import SQLiteConnectionPool
+
+
+@dataclass
+class _PendingWrites:
+    """Writes buffered by a cycle transaction, flushed in a single commit."""
+
+    trust_updates: List[Tuple[str, float, Optional[str], str]] = field(default_factory=list)
+    suppression: Dict[str, Tuple[bool, int, str]] = field(default_factory=dict)
+    agent_status: Dict[str, Tuple[str, str]] = field(default_factory=dict)
+    drift: List[Tuple[str, float, float, float]] = field(default_factory=list)
+    execution_results: List[Tuple[Any, ...]] = field(default_factory=list)
+    reflections: List[Tuple[Any, ...]] = field(default_factory=list)
+    mutations: List[Tuple[Any, ...]] = field(default_factory=list)
+    events: List[Tuple[Any, ...]] = field(default_factory=list)
+    # (run_id, task_id) -> backlog row, or None to delete; last write wins
+    backlog: Dict[Tuple[str, str], Optional[Tuple[Any, ...]]] = field(default_factory=dict)
+    # run_id -> (tick, seq), or None to delete
+    backlog_ticks: Dict[str, Optional[Tuple[int, int]]] = field(default_factory=dict)
+
+    def is_empty(self) -> bool:
+        return not (
+            self.trust_updates
+            or self.suppression
+            or self.agent_status
+            or self.drift
+            or self.execution_results
+            or self.reflections
+            or self.mutations
+            or self.events
+            or self.backlog
+            or self.backlog_ticks
+        )
+
 
 class PersistentStateManager:
     """
@@ -22,23 +60,38 @@ class PersistentStateManager:
     - Drift detection history
     - Execution results
     - Reflections from RIF
+    - Deferred task backlog
     """
 
-    def __init__(self, db_path: str = "governance_state.db"):
+    def __init__(
+        self,
+        db_path: str = "governance_state.db",
+        database_config: Optional[DatabaseConfig] = None,
+    ):
         """
         Initialize persistent state manager.
 
         Args:
             db_path: Path to SQLite database file
+            database_config: Pool size, WAL and pragma tuning (defaults to DatabaseConfig())
         """
         # Ensure directory exists
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
+        self._pool = SQLiteConnectionPool.from_config(db_path, database_config, row_factory=sqlite3.Row)
+        self._write_lock = threading.RLock()
+        # Cycle transactions are per thread (keyed by thread ident): writes
+        # from other threads never land in another thread's open buffer.
+        self._transaction_depth: Dict[int, int] = {}
+        self._pending: Dict[int, _PendingWrites] = {}
         self._initialize_schema()
 
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Dedicated writer connection; readers go through the pool."""
+        return self._pool.writer
+
     def _initialize_schema(self):
         """Create database tables if they don't exist."""
         cursor = self.conn.cursor()
@@ -52,6 +105,15 @@ class PersistentStateManager:
             )
         """)
 
+        # Last learning activity per agent (trust_scores.updated_at only moves
+        # when the score changes; this moves on every trust update)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS agent_activity (
+                agent_id TEXT PRIMARY KEY,
+                last_active_at TEXT NOT NULL
+            )
+        """)
+
         # Trust history table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS trust_history (
@@ -157,327 +219,590 @@ class PersistentStateManager:
             )
         """)
 
+        # Task backlog (deferred tasks carried across cycles)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS task_backlog (
+                run_id TEXT NOT NULL,
+                task_id TEXT NOT NULL,
+                priority REAL NOT NULL,
+                seq INTEGER NOT NULL,
+                enqueued_tick INTEGER NOT NULL,
+                payload TEXT NOT NULL,
+                PRIMARY KEY (run_id, task_id)
+            )
+        """)
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS task_backlog_ticks (
+                run_id TEXT PRIMARY KEY,
+                tick INTEGER NOT NULL,
+                seq INTEGER NOT NULL
+            )
+        """)
+
         self.conn.commit()
 
+    # ---------------------------------------------------------
+    # UNIT OF WORK
+    # ---------------------------------------------------------
+
+    def begin_cycle_transaction(self) -> None:
+        """
+        Start buffering this thread's writes. Nested calls share the
+        outermost buffer; writes from other threads are not buffered.
+        """
+        owner = threading.get_ident()
+        with self._write_lock:
+            depth = self._transaction_depth.get(owner, 0)
+            if depth == 0:
+                self._pending[owner] = _PendingWrites()
+            self._transaction_depth[owner] = depth + 1
+
+    def end_cycle_transaction(self) -> None:
+        """Close one transaction level; the outermost level flushes in one commit."""
+        owner = threading.get_ident()
+        with self._write_lock:
+            depth = self._transaction_depth.get(owner, 0)
+            if depth == 0:
+                return
+            if depth > 1:
+                self._transaction_depth[owner] = depth - 1
+                return
+            del self._transaction_depth[owner]
+            pending = self._pending.pop(owner, None)
+            if pending is not None:
+                self._flush(pending)
+
+    @contextmanager
+    def cycle_transaction(self) -> Iterator["PersistentStateManager"]:
+        """
+        Buffer every write made while the block runs and flush them with
+        executemany in a single commit on exit.
+
+        Buffered writes are flushed even if the block raises, matching the
+        per-call commits they replace.
+        """
+        self.begin_cycle_transaction()
+        try:
+            yield self
+        finally:
+            self.end_cycle_transaction()
+
+    @contextmanager
+    def _pending_writes(self) -> Iterator[_PendingWrites]:
+        with self._write_lock:
+            pending = self._pending.get(threading.get_ident())
+            if pending is not None:
+                yield pending
+                return
+            pending = _PendingWrites()
+            yield pending
+            self._flush(pending)
+
+    def _flush(self, pending: _PendingWrites) -> None:
+        if pending.is_empty():
+            return
+
+        with self._pool.write() as conn:
+            cursor = conn.cursor()
+            if pending.trust_updates:
+                self._flush_trust_updates(cursor, pending.trust_updates)
+
+            if pending.suppression:
+                # The WHERE clause skips rows whose state did not change.
+                cursor.executemany("""
+                    INSERT INTO suppression_state (agent_id, is_suppressed, redemption_cycle, suppressed_since, updated_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(agent_id) DO UPDATE SET
+                        is_suppressed = excluded.is_suppressed,
+                        redemption_cycle = excluded.redemption_cycle,
+                        suppressed_since = CASE
+                            WHEN excluded.is_suppressed = 1 AND is_suppressed = 0 THEN excluded.suppressed_since
+                            WHEN excluded.is_suppressed = 0 THEN NULL
+                            ELSE suppressed_since
+                        END,
+                        updated_at = excluded.updated_at
+                    WHERE is_suppressed != excluded.is_suppressed
+                        OR redemption_cycle IS NOT excluded.redemption_cycle
+                """, [
+                    (agent_id, is_suppressed, redemption_cycle, timestamp if is_suppressed else None, timestamp)
+                    for agent_id, (is_suppressed, redemption_cycle, timestamp) in pending.suppression.items()
+                ])
+
+            if pending.agent_status:
+                cursor.executemany("""
+                    INSERT INTO agent_status (agent_id, status, updated_at)
+                    VALUES (?, ?, ?)
+                    ON CONFLICT(agent_id) DO UPDATE SET
+                        status = excluded.status,
+                        updated_at = excluded.updated_at
+                    WHERE status != excluded.status
+                """, [
+                    (agent_id, status, timestamp)
+                    for agent_id, (status, timestamp) in pending.agent_status.items()
+                ])
+
+            if pending.drift:
+                cursor.executemany("""
+                    INSERT INTO drift_history (agent_id, trust_before, trust_after, drift_delta)
+                    VALUES (?, ?, ?, ?)
+                """, pending.drift)
+
+            if pending.execution_results:
+                cursor.executemany("""
+                    INSERT INTO execution_results (task_id, agent_id, success, latency, metadata, timestamp)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, pending.execution_results)
+
+            if pending.reflections:
+                cursor.executemany("""
+                    INSERT INTO reflections (
+                        reflection_text, constraint_score, grounded, recursive,
+                        performative_flag, contradiction
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, pending.reflections)
+
+            if pending.mutations:
+                cursor.executemany("""
+                    INSERT INTO mutation_history (
+                        cycle_id, success_rate, action,
+                        old_trust_threshold, new_trust_threshold,
+                        old_suppression_threshold, new_suppression_threshold,
+                        old_drift_delta, new_drift_delta,
+                        timestamp
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, pending.mutations)
+
+            if pending.events:
+                cursor.executemany("""
+                    INSERT INTO events (
+                        run_id,
+                        cycle_id,
+                        timestamp,
+                        event_type,
+                        agent_id,
+                        trust_before,
+                        trust_after,
+                        authority_before,
+                        authority_after,
+                        metadata
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, pending.events)
+
+            if pending.backlog:
+                cursor.executemany("""
+                    INSERT INTO task_backlog (run_id, task_id, priority, seq, enqueued_tick, payload)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(run_id, task_id) DO UPDATE SET
+                        priority = excluded.priority,
+                        seq = excluded.seq,
+                        enqueued_tick = excluded.enqueued_tick,
+                        payload = excluded.payload
+                """, [row for row in pending.backlog.values() if row is not None])
+                cursor.executemany(
+                    "DELETE FROM task_backlog WHERE run_id = ? AND task_id = ?",
+                    [key for key, row in pending.backlog.items() if row is None],
+                )
+
+            if pending.backlog_ticks:
+                cursor.executemany("""
+                    INSERT INTO task_backlog_ticks (run_id, tick, seq)
+                    VALUES (?, ?, ?)
+                    ON CONFLICT(run_id) DO UPDATE SET
+                        tick = excluded.tick,
+                        seq = excluded.seq
+                """, [(run_id, *clock) for run_id, clock in pending.backlog_ticks.items() if clock is not None])
+                cursor.executemany(
+                    "DELETE FROM task_backlog_ticks WHERE run_id = ?",
+                    [(run_id,) for run_id, clock in pending.backlog_ticks.items() if clock is None],
+                )
+
+    def _flush_trust_updates(
+        self,
+        cursor: sqlite3.Cursor,
+        trust_updates: List[Tuple[str, float, Optional[str], str]],
+    ) -> None:
+        agent_ids = list(dict.fromkeys(agent_id for agent_id, _, _, _ in trust_updates))
+        stored: Dict[str, float] = {}
+        for start in range(0, len(agent_ids), 500):
+            chunk = agent_ids[start:start + 500]
+            placeholders = ",".join("?" for _ in chunk)
+            cursor.execute(
+                f"SELECT agent_id, trust_score FROM trust_scores WHERE agent_id IN ({placeholders})",
+                chunk,
+            )
+            stored.update({row["agent_id"]: row["trust_score"] for row in cursor.fetchall()})
+
+        running = dict(stored)
+        latest: Dict[str, Tuple[float, str]] = {}
+        last_active: Dict[str, str] = {}
+        history_rows = []
+        for agent_id, new_score, reason, timestamp in trust_updates:
+            last_active[agent_id] = timestamp
+            known = agent_id in running
+            old_score = running.get(agent_id, 0.0)
+            delta = new_score - old_score
+            running[agent_id] = new_score
+            if known and abs(delta) <= 1e-12:
+                continue
+            latest[agent_id] = (new_score, timestamp)
+            history_rows.append((agent_id, new_score, delta, reason, timestamp))
+
+        cursor.executemany("""
+            INSERT INTO trust_scores (agent_id, trust_score, updated_at)
+            VALUES (?, ?, ?)
+            ON CONFLICT(agent_id) DO UPDATE SET
+                trust_score = excluded.trust_score,
+                updated_at = excluded.updated_at
+            WHERE trust_score != excluded.trust_score
+        """, [
+            (agent_id, score, timestamp)
+            for agent_id, (score, timestamp) in latest.items()
+            if agent_id not in stored or abs(stored[agent_id] - score) > 1e-12
+        ])
+        cursor.executemany("""
+            INSERT INTO trust_history (agent_id, trust_score, delta, reason, timestamp)
+            VALUES (?, ?, ?, ?, ?)
+        """, history_rows)
+        # Activity is recorded even when the score is unchanged (e.g. pinned at 1.0).
+        cursor.executemany("""
+            INSERT INTO agent_activity (agent_id, last_active_at)
+            VALUES (?, ?)
+            ON CONFLICT(agent_id) DO UPDATE SET
+                last_active_at = excluded.last_active_at
+        """, list(last_active.items()))
+
     def get_trust_scores(self) -> Dict[str, float]:
         """Get current trust scores for all agents."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT agent_id, trust_score FROM trust_scores")
+        with self._pool.read() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT agent_id, trust_score FROM trust_scores")
+
+            return {row['agent_id']: row['trust_score'] for row in cursor.fetchall()}
+
+    def get_agent_trust_state(self, agent_ids: Optional[List[str]] = None) -> Dict[str, Tuple[float, Optional[str]]]:
+        """
+        Stored trust score and last activity timestamp per agent.
 
-        return {row['agent_id']: row['trust_score'] for row in cursor.fetchall()}
+        Activity falls back to the last score change for agents without an
+        activity row (databases written before it was tracked).
+
+        Args:
+            agent_ids: Agents to look up (None = all agents)
+
+        Returns:
+            Dictionary of {agent_id: (trust_score, last_active_at)}
+        """
+        query = """
+            SELECT t.agent_id, t.trust_score, COALESCE(a.last_active_at, t.updated_at) AS last_active_at
+            FROM trust_scores t
+            LEFT JOIN agent_activity a ON a.agent_id = t.agent_id
+        """
+        with self._pool.read() as conn:
+            cursor = conn.cursor()
+            if agent_ids is None:
+                cursor.execute(query)
+                rows = cursor.fetchall()
+            else:
+                rows = []
+                for start in range(0, len(agent_ids), 500):
+                    chunk = agent_ids[start:start + 500]
+                    placeholders = ",".join("?" for _ in chunk)
+                    cursor.execute(f"{query} WHERE t.agent_id IN ({placeholders})", chunk)
+                    rows.extend(cursor.fetchall())
+
+        return {row["agent_id"]: (row["trust_score"], row["last_active_at"]) for row in rows}
 
     def update_trust_scores(self, trust_updates: Dict[str, float], reason: str = None):
         """
         Update trust scores and record history.
 
+        Only scores that actually changed produce a history row; unchanged
+        scores are not rewritten.
+
         Args:
             trust_updates: Dictionary of {agent_id: new_trust_score}
             reason: Optional reason for update (e.g., "success", "failure")
         """
-        cursor = self.conn.cursor()
         timestamp = datetime.now().isoformat()
 
-        for agent_id, new_score in trust_updates.items():
-            # Get old score for delta calculation
-            cursor.execute("SELECT trust_score FROM trust_scores WHERE agent_id = ?", (agent_id,))
-            result = cursor.fetchone()
-            old_score = result['trust_score'] if result else 0.0
-            delta = new_score - old_score
-
-            # Update or insert trust score
-            cursor.execute("""
-                INSERT INTO trust_scores (agent_id, trust_score, updated_at)
-                VALUES (?, ?, ?)
-                ON CONFLICT(agent_id) DO UPDATE SET
-                    trust_score = excluded.trust_score,
-                    updated_at = excluded.updated_at
-            """, (agent_id, new_score, timestamp))
-
-            # Record history
-            cursor.execute("""
-                INSERT INTO trust_history (agent_id, trust_score, delta, reason, timestamp)
-                VALUES (?, ?, ?, ?, ?)
-            """, (agent_id, new_score, delta, reason, timestamp))
-
-        self.conn.commit()
+        with self._pending_writes() as pending:
+            pending.trust_updates.extend(
+                (agent_id, new_score, reason, timestamp)
+                for agent_id, new_score in trust_updates.items()
+            )
 
     def get_trust_history(self, agent_id: str, limit: int = 10) -> List[Dict]:
         """Get trust score history for an agent."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT trust_score, delta, reason, timestamp
-            FROM trust_history
-            WHERE agent_id = ?
-            ORDER BY timestamp DESC
-            LIMIT ?
-        """, (agent_id, limit))
+        with self._pool.read() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT trust_score, delta, reason, timestamp
+                FROM trust_history
+                WHERE agent_id = ?
+                ORDER BY timestamp DESC
+                LIMIT ?
+            """, (agent_id, limit))
 
-        return [dict(row) for row in cursor.fetchall()]
+            return [dict(row) for row in cursor.fetchall()]
 
     def get_suppression_state(self) -> Dict[str, Dict]:
         """Get suppression state for all agents."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT agent_id, is_suppressed, redemption_cycle, suppressed_since
-            FROM suppression_state
-        """)
-
-        return {
-            row['agent_id']: {
-                'is_suppressed': bool(row['is_suppressed']),
-                'redemption_cycle': row['redemption_cycle'],
-                'suppressed_since': row['suppressed_since']
+        with self._pool.read() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT agent_id, is_suppressed, redemption_cycle, suppressed_since
+                FROM suppression_state
+            """)
+
+            return {
+                row['agent_id']: {
+                    'is_suppressed': bool(row['is_suppressed']),
+                    'redemption_cycle': row['redemption_cycle'],
+                    'suppressed_since': row['suppressed_since']
+                }
+                for row in cursor.fetchall()
             }
-            for row in cursor.fetchall()
-        }
 
     def update_suppression_state(self, agent_id: str, is_suppressed: bool, redemption_cycle: int = 0):
         """Update suppression state for an agent."""
-        cursor = self.conn.cursor()
         timestamp = datetime.now().isoformat()
 
-        cursor.execute("""
-            INSERT INTO suppression_state (agent_id, is_suppressed, redemption_cycle, suppressed_since, updated_at)
-            VALUES (?, ?, ?, ?, ?)
-            ON CONFLICT(agent_id) DO UPDATE SET
-                is_suppressed = excluded.is_suppressed,
-                redemption_cycle = excluded.redemption_cycle,
-                suppressed_since = CASE
-                    WHEN excluded.is_suppressed = 1 AND is_suppressed = 0 THEN excluded.suppressed_since
-                    WHEN excluded.is_suppressed = 0 THEN NULL
-                    ELSE suppressed_since
-                END,
-                updated_at = excluded.updated_at
-        """, (agent_id, is_suppressed, redemption_cycle, timestamp if is_suppressed else None, timestamp))
-
-        self.conn.commit()
+        with self._pending_writes() as pending:
+            pending.suppression[agent_id] = (bool(is_suppressed), redemption_cycle, timestamp)
 
     def update_agent_status(self, agent_id: str, status: str):
         """Persist agent lifecycle status."""
-        cursor = self.conn.cursor()
         timestamp = datetime.now().isoformat()
 
-        cursor.execute("""
-            INSERT INTO agent_status (agent_id, status, updated_at)
-            VALUES (?, ?, ?)
-            ON CONFLICT(agent_id) DO UPDATE SET
-                status = excluded.status,
-                updated_at = excluded.updated_at
-        """, (agent_id, status, timestamp))
-
-        self.conn.commit()
+        with self._pending_writes() as pending:
+            pending.agent_status[agent_id] = (status, timestamp)
 
     def record_drift(self, agent_id: str, trust_before: float, trust_after: float):
         """Record drift detection event."""
-        cursor = self.conn.cursor()
         drift_delta = trust_after - trust_before
 
-        cursor.execute("""
-            INSERT INTO drift_history (agent_id, trust_before, trust_after, drift_delta)
-            VALUES (?, ?, ?, ?)
-        """, (agent_id, trust_before, trust_after, drift_delta))
-
-        self.conn.commit()
+        with self._pending_writes() as pending:
+            pending.drift.append((agent_id, trust_before, trust_after, drift_delta))
 
     def record_execution_results(self, results: List):
         """Record execution results."""
-        cursor = self.conn.cursor()
         timestamp = datetime.now().isoformat()
 
-        for result in results:
-            metadata_json = json.dumps(result.metadata) if hasattr(result, 'metadata') else None
-
-            cursor.execute("""
-                INSERT INTO execution_results (task_id, agent_id, success, latency, metadata, timestamp)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (result.task_id, result.agent_id, result.success, result.latency, metadata_json, timestamp))
-
-        self.conn.commit()
+        with self._pending_writes() as pending:
+            for result in results:
+                metadata_json = json.dumps(result.metadata) if hasattr(result, 'metadata') else None
+                pending.execution_results.append(
+                    (result.task_id, result.agent_id, result.success, result.latency, metadata_json, timestamp)
+                )
 
     def record_reflection(self, reflection_text: str, result: Dict):
         """Record RIF reflection."""
-        cursor = self.conn.cursor()
-
-        cursor.execute("""
-            INSERT INTO reflections (
-                reflection_text, constraint_score, grounded, recursive,
-                performative_flag, contradiction
-            )
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (
-            reflection_text,
-            result.get('constraint_score', 0),
-            result.get('grounded', False),
-            result.get('recursive', False),
-            result.get('performative_flag', False),
-            result.get('contradiction', False)
-        ))
-
-        self.conn.commit()
+        with self._pending_writes() as pending:
+            pending.reflections.append((
+                reflection_text,
+                result.get('constraint_score', 0),
+                result.get('grounded', False),
+                result.get('recursive', False),
+                result.get('performative_flag', False),
+                result.get('contradiction', False)
+            ))
 
     def get_recent_reflections(self, limit: int = 10) -> List[Dict]:
         """Get recent reflections."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT reflection_text, constraint_score, timestamp
-            FROM reflections
-            ORDER BY timestamp DESC
-            LIMIT ?
-        """, (limit,))
+        with self._pool.read() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT reflection_text, constraint_score, timestamp
+                FROM reflections
+                ORDER BY timestamp DESC
+                LIMIT ?
+            """, (limit,))
 
-        return [dict(row) for row in cursor.fetchall()]
+            return [dict(row) for row in cursor.fetchall()]
 
     def record_mutation_event(self, mutation_record: Dict):
         """Persist a mutation engine event."""
-        cursor = self.conn.cursor()
         timestamp = datetime.now().isoformat()
 
         trust = mutation_record["trust_threshold"]
         suppression = mutation_record["suppression_threshold"]
         drift = mutation_record["drift_delta"]
 
-        cursor.execute("""
-            INSERT INTO mutation_history (
-                cycle_id, success_rate, action,
-                old_trust_threshold, new_trust_threshold,
-                old_suppression_threshold, new_suppression_threshold,
-                old_drift_delta, new_drift_delta,
+        with self._pending_writes() as pending:
+            pending.mutations.append((
+                mutation_record["cycle_id"],
+                mutation_record["success_rate"],
+                mutation_record["action"],
+                trust["old"], trust["new"],
+                suppression["old"], suppression["new"],
+                drift["old"], drift["new"],
                 timestamp
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            mutation_record["cycle_id"],
-            mutation_record["success_rate"],
-            mutation_record["action"],
-            trust["old"], trust["new"],
-            suppression["old"], suppression["new"],
-            drift["old"], drift["new"],
-            timestamp
-        ))
-
-        self.conn.commit()
+            ))
 
     def get_mutation_history(self, limit: int = 10) -> List[Dict]:
         """Get recent mutation history in chronological order."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT
-                cycle_id, success_rate, action,
-                old_trust_threshold, new_trust_threshold,
-                old_suppression_threshold, new_suppression_threshold,
-                old_drift_delta, new_drift_delta,
-                timestamp
-            FROM mutation_history
-            ORDER BY id DESC
-            LIMIT ?
-        """, (limit,))
-
-        rows = cursor.fetchall()
-        history = []
-        for row in reversed(rows):
-            history.append({
-                "cycle_id": row["cycle_id"],
-                "success_rate": row["success_rate"],
-                "action": row["action"],
-                "trust_threshold": {
-                    "old": row["old_trust_threshold"],
-                    "new": row["new_trust_threshold"]
-                },
-                "suppression_threshold": {
-                    "old": row["old_suppression_threshold"],
-                    "new": row["new_suppression_threshold"]
-                },
-                "drift_delta": {
-                    "old": row["old_drift_delta"],
-                    "new": row["new_drift_delta"]
-                },
-                "timestamp": row["timestamp"]
-            })
-        return history
+        with self._pool.read() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT
+                    cycle_id, success_rate, action,
+                    old_trust_threshold, new_trust_threshold,
+                    old_suppression_threshold, new_suppression_threshold,
+                    old_drift_delta, new_drift_delta,
+                    timestamp
+                FROM mutation_history
+                ORDER BY id DESC
+                LIMIT ?
+            """, (limit,))
+
+            rows = cursor.fetchall()
+            history = []
+            for row in reversed(rows):
+                history.append({
+                    "cycle_id": row["cycle_id"],
+                    "success_rate": row["success_rate"],
+                    "action": row["action"],
+                    "trust_threshold": {
+                        "old": row["old_trust_threshold"],
+                        "new": row["new_trust_threshold"]
+                    },
+                    "suppression_threshold": {
+                        "old": row["old_suppression_threshold"],
+                        "new": row["new_suppression_threshold"]
+                    },
+                    "drift_delta": {
+                        "old": row["old_drift_delta"],
+                        "new": row["new_drift_delta"]
+                    },
+                    "timestamp": row["timestamp"]
+                })
+            return history
 
     def get_latest_mutation_thresholds(self) -> Optional[Dict[str, float]]:
         """Get the latest persisted mutation thresholds."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT
-                new_trust_threshold,
-                new_suppression_threshold,
-                new_drift_delta
-            FROM mutation_history
-            ORDER BY id DESC
-            LIMIT 1
-        """)
-        row = cursor.fetchone()
-        if not row:
-            return None
-
-        return {
-            "trust_threshold": row["new_trust_threshold"],
-            "suppression_threshold": row["new_suppression_threshold"],
-            "drift_delta": row["new_drift_delta"]
-        }
+        with self._pool.read() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT
+                    new_trust_threshold,
+                    new_suppression_threshold,
+                    new_drift_delta
+                FROM mutation_history
+                ORDER BY id DESC
+                LIMIT 1
+            """)
+            row = cursor.fetchone()
+            if not row:
+                return None
+
+            return {
+                "trust_threshold": row["new_trust_threshold"],
+                "suppression_threshold": row["new_suppression_threshold"],
+                "drift_delta": row["new_drift_delta"]
+            }
 
     def get_statistics(self) -> Dict:
         """Get governance statistics."""
-        cursor = self.conn.cursor()
-
-        # Total executions
-        cursor.execute("SELECT COUNT(*) as total FROM execution_results")
-        total_executions = cursor.fetchone()['total']
-
-        # Success rate
-        cursor.execute("SELECT AVG(CAST(success AS FLOAT)) as success_rate FROM execution_results")
-        success_rate = cursor.fetchone()['success_rate'] or 0.0
-
-        # Currently suppressed agents
-        cursor.execute("SELECT COUNT(*) as suppressed FROM suppression_state WHERE is_suppressed = 1")
-        suppressed_count = cursor.fetchone()['suppressed']
-
-        # Total reflections
-        cursor.execute("SELECT COUNT(*) as total FROM reflections WHERE constraint_score >= 3")
-        valid_reflections = cursor.fetchone()['total']
-
-        return {
-            'total_executions': total_executions,
-            'success_rate': round(success_rate, 3),
-            'suppressed_agents': suppressed_count,
-            'valid_reflections': valid_reflections
-        }
+        with self._pool.read() as conn:
+            cursor = conn.cursor()
+
+            # Total executions
+            cursor.execute("SELECT COUNT(*) as total FROM execution_results")
+            total_executions = cursor.fetchone()['total']
+
+            # Success rate
+            cursor.execute("SELECT AVG(CAST(success AS FLOAT)) as success_rate FROM execution_results")
+            success_rate = cursor.fetchone()['success_rate'] or 0.0
+
+            # Currently suppressed agents
+            cursor.execute("SELECT COUNT(*) as suppressed FROM suppression_state WHERE is_suppressed = 1")
+            suppressed_count = cursor.fetchone()['suppressed']
+
+            # Total reflections
+            cursor.execute("SELECT COUNT(*) as total FROM reflections WHERE constraint_score >= 3")
+            valid_reflections = cursor.fetchone()['total']
+
+            return {
+                'total_executions': total_executions,
+                'success_rate': round(success_rate, 3),
+                'suppressed_agents': suppressed_count,
+                'valid_reflections': valid_reflections
+            }
 
     def save_event(self, event: dict):
         """
         Persist a governance event to SQLite.
         """
-        cursor = self.conn.cursor()
+        with self._pending_writes() as pending:
+            pending.events.append((
+                event.get("run_id"),
+                event.get("cycle_id"),
+                event.get("timestamp"),
+                event.get("type"),
+                event.get("agent_id"),
+                event.get("trust_before", 0.0),
+                event.get("trust_after", 0.0),
+                event.get("authority_before", 0.0),
+                event.get("authority_after", 0.0),
+                json.dumps(event.get("metadata", {})),
+            ))
+
+    # ---------------------------------------------------------
+    # TASK BACKLOG
+    # ---------------------------------------------------------
+
+    def save_backlog_entries(self, run_id: str, entries: List[Tuple[str, float, int, int, str]]):
+        """
+        Upsert backlog entries for a run.
 
-        cursor.execute("""
-            INSERT INTO events (
-                run_id,
-                cycle_id,
-                timestamp,
-                event_type,
-                agent_id,
-                trust_before,
-                trust_after,
-                authority_before,
-                authority_after,
-                metadata
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            event.get("run_id"),
-            event.get("cycle_id"),
-            event.get("timestamp"),
-            event.get("type"),
-            event.get("agent_id"),
-            event.get("trust_before", 0.0),
-            event.get("trust_after", 0.0),
-            event.get("authority_before", 0.0),
-            event.get("authority_after", 0.0),
-            json.dumps(event.get("metadata", {})),
-        ))
+        Args:
+            entries: (task_id, priority, seq, enqueued_tick, payload_json) tuples
+        """
+        with self._pending_writes() as pending:
+            for task_id, priority, seq, tick, payload in entries:
+                pending.backlog[(run_id, task_id)] = (run_id, task_id, priority, seq, tick, payload)
+
+    def delete_backlog_entries(self, run_id: str, task_ids: List[str]):
+        """Remove completed tasks from a run's backlog."""
+        with self._pending_writes() as pending:
+            for task_id in task_ids:
+                pending.backlog[(run_id, task_id)] = None
+
+    def save_backlog_tick(self, run_id: str, tick: int, seq: int):
+        """Persist a run's backlog clock (cycles drained, next sequence number)."""
+        with self._pending_writes() as pending:
+            pending.backlog_ticks[run_id] = (tick, seq)
+
+    def delete_backlog_tick(self, run_id: str):
+        """Drop a run's backlog clock once it has no persisted entries."""
+        with self._pending_writes() as pending:
+            pending.backlog_ticks[run_id] = None
+
+    def load_backlog(self, run_id: str) -> Tuple[int, int, List[Dict]]:
+        """Load a run's backlog clock and entries: (tick, seq, rows)."""
+        with self._pool.read() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT tick, seq FROM task_backlog_ticks WHERE run_id = ?", (run_id,))
+            clock = cursor.fetchone()
+            cursor.execute("""
+                SELECT task_id, priority, seq, enqueued_tick, payload
+                FROM task_backlog
+                WHERE run_id = ?
+            """, (run_id,))
+            rows = [dict(row) for row in cursor.fetchall()]
 
-        self.conn.commit()
+        tick, seq = (clock["tick"], clock["seq"]) if clock else (0, 0)
+        return tick, seq, rows
 
     def close(self):
-        """Close database connection."""
-        self.conn.close()
+        """Close database connection, flushing every open cycle transaction."""
+        with self._write_lock:
+            open_transactions = list(self._pending.values())
+            self._pending.clear()
+            self._transaction_depth.clear()
+            for pending in open_transactions:
+                self._flush(pending)
+            self._pool.close()
@@ -1,6 +1,6 @@
 from syntropiq.reflect.config import get_reflect_consensus_mode, get_reflect_mode
 from syntropiq.reflect.consensus import PerspectiveProfile, run_consensus_reflect
-from syntropiq.reflect.engine import run_reflect
+from syntropiq.reflect.engine import ReflectInputs, evaluate_reflect, prepare_reflect, run_reflect
 from syntropiq.reflect.schema import (
     ConstraintPenalty,
     ConstraintSpec,
@@ -12,6 +12,9 @@ __all__ = [
     "get_reflect_mode",
     "get_reflect_consensus_mode",
     "run_reflect",
+    "prepare_reflect",
+    "evaluate_reflect",
+    "ReflectInputs",
     "run_consensus_reflect",
     "PerspectiveProfile",
     "ConstraintSpec",
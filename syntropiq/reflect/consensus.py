@@ -5,7 +5,7 @@ from statistics import median
 from typing import Any, Dict, List, Optional
 
 from syntropiq.reflect.constraint_kernel import default_constraints
-from syntropiq.reflect.engine import run_reflect
+from syntropiq.reflect.engine import evaluate_reflect, prepare_reflect
 
 
 @dataclass
@@ -58,6 +58,19 @@ def run_consensus_reflect(
     profile_set = profiles or default_perspectives()
     base_specs = default_constraints()
 
+    # Projection, failure rate, instability and constraint values are the
+    # same for every perspective; only weights, theta and constraint weights
+    # differ, so each profile is scored against one shared preparation.
+    inputs = prepare_reflect(
+        trust_by_agent=trust_by_agent,
+        thresholds=thresholds,
+        suppression_active=suppression_active,
+        recent_cycles=recent_cycles,
+        recent_events=recent_events,
+        horizon_steps=horizon_steps,
+        latest_replay_score=latest_replay_score,
+    )
+
     per_profile = []
     fs_values = []
 
@@ -74,22 +87,16 @@ def run_consensus_reflect(
             )
             specs.append(cloned)
 
-        decision = run_reflect(
+        decision = evaluate_reflect(
+            inputs,
             run_id=run_id,
             cycle_id=cycle_id,
             timestamp=timestamp,
-            trust_by_agent=trust_by_agent,
-            thresholds=thresholds,
-            suppression_active=suppression_active,
-            recent_cycles=recent_cycles,
-            recent_events=recent_events,
             actor=actor,
             request_id=request_id,
-            horizon_steps=horizon_steps,
             theta=profile.theta_override if profile.theta_override is not None else theta,
             weights_decay=profile.weights_decay,
             mode="score",
-            latest_replay_score=latest_replay_score,
             constraint_specs=specs,
         )
         fs_values.append(float(decision.Fs))
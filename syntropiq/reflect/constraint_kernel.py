@@ -37,12 +37,26 @@ def compute_constraint_penalties(
     observed_drift: float = 0.0,
     specs: Optional[List[ConstraintSpec]] = None,
 ) -> Tuple[List[ConstraintPenalty], float]:
-    constraints = specs or default_constraints()
+    values = compute_constraint_values(
+        trust_by_agent=trust_by_agent,
+        suppression_count=suppression_count,
+        instability=instability,
+        latest_replay_score=latest_replay_score,
+        observed_drift=observed_drift,
+    )
+    return penalties_from_values(values, thresholds, latest_replay_score, specs)
 
-    trust_threshold = float(thresholds.get("trust_threshold", 0.7))
-    min_trust = min([float(v) for v in trust_by_agent.values()]) if trust_by_agent else 0.0
 
-    values = {
+def compute_constraint_values(
+    trust_by_agent: Dict[str, float],
+    suppression_count: int,
+    instability: float = 0.0,
+    latest_replay_score: Optional[float] = None,
+    observed_drift: float = 0.0,
+) -> Dict[str, float]:
+    """Observed value per constraint name; independent of constraint weights."""
+    min_trust = min([float(v) for v in trust_by_agent.values()]) if trust_by_agent else 0.0
+    return {
         "trust_floor": min_trust,
         "suppression_rate": float(suppression_count),
         "drift_limit": float(observed_drift),
@@ -50,6 +64,16 @@ def compute_constraint_penalties(
         "reproducibility": float(latest_replay_score) if latest_replay_score is not None else 1.0,
     }
 
+
+def penalties_from_values(
+    values: Dict[str, float],
+    thresholds: Dict[str, float],
+    latest_replay_score: Optional[float] = None,
+    specs: Optional[List[ConstraintSpec]] = None,
+) -> Tuple[List[ConstraintPenalty], float]:
+    constraints = specs or default_constraints()
+    trust_threshold = float(thresholds.get("trust_threshold", 0.7))
+
     penalties: List[ConstraintPenalty] = []
     total = 0.0
 
@@ -1,12 +1,23 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
-from syntropiq.reflect.constraint_kernel import compute_constraint_penalties
-from syntropiq.reflect.foresight import estimate_expected_delta, project_horizon
-from syntropiq.reflect.fs_score import compute_fs_from_projections, compute_weights
-from syntropiq.reflect.schema import ConstraintSpec, ReflectDecision
+from syntropiq.reflect.constraint_kernel import compute_constraint_values, penalties_from_values
+from syntropiq.reflect.foresight import (
+    FAST_FORESIGHT_MIN_AGENTS,
+    estimate_expected_delta,
+    project_horizon,
+    project_horizon_averages,
+)
+from syntropiq.reflect.fs_score import (
+    compute_foresight_terms,
+    compute_foresight_terms_from_averages,
+    compute_weights,
+    weigh_foresight,
+)
+from syntropiq.reflect.schema import ConstraintSpec, ForesightStep, ReflectDecision
 
 
 def _utc_now() -> str:
@@ -56,6 +67,85 @@ def _infer_instability(recent_events: Optional[List[Dict[str, Any]]], thresholds
     return abs(trust_after - trust_before)
 
 
+@dataclass
+class ReflectInputs:
+    """
+    Everything ``run_reflect`` derives from the cycle state alone.
+
+    Horizon projection, failure rate, instability and constraint values do
+    not depend on horizon weights, theta or constraint weights, so they are
+    computed once and shared when several perspectives score the same cycle.
+    """
+
+    horizon_steps: int
+    thresholds: Dict[str, float]
+    expected_delta: float
+    foresight_terms: List[ForesightStep]
+    constraint_values: Dict[str, float]
+    latest_replay_score: Optional[float]
+
+
+def prepare_reflect(
+    trust_by_agent: Dict[str, float],
+    thresholds: Dict[str, float],
+    suppression_active: bool,
+    recent_cycles: Optional[List[Dict[str, Any]]] = None,
+    recent_events: Optional[List[Dict[str, Any]]] = None,
+    horizon_steps: int = 5,
+    latest_replay_score: Optional[float] = None,
+) -> ReflectInputs:
+    horizon_steps = max(1, int(horizon_steps))
+
+    expected_delta = estimate_expected_delta(recent_cycles or [], agent_count=max(1, len(trust_by_agent)))
+    failure_rate = _infer_failure_rate(recent_cycles)
+    if len(trust_by_agent) >= FAST_FORESIGHT_MIN_AGENTS:
+        averages = project_horizon_averages(
+            trust_by_agent=trust_by_agent,
+            horizon_steps=horizon_steps,
+            expected_delta=expected_delta,
+            suppression_active=suppression_active,
+        )
+        foresight_terms = compute_foresight_terms_from_averages(
+            averages=averages,
+            thresholds=thresholds,
+            suppression_active=suppression_active,
+            failure_rate=failure_rate,
+        )
+    else:
+        projections = project_horizon(
+            trust_by_agent=trust_by_agent,
+            horizon_steps=horizon_steps,
+            expected_delta=expected_delta,
+            suppression_active=suppression_active,
+        )
+        foresight_terms = compute_foresight_terms(
+            projections=projections,
+            thresholds=thresholds,
+            suppression_active=suppression_active,
+            failure_rate=failure_rate,
+        )
+
+    suppression_count = 1 if suppression_active else 0
+    instability = _infer_instability(recent_events, thresholds)
+    observed_drift = _infer_observed_drift(recent_cycles, agent_count=max(1, len(trust_by_agent)))
+    constraint_values = compute_constraint_values(
+        trust_by_agent=trust_by_agent,
+        suppression_count=suppression_count,
+        instability=instability,
+        latest_replay_score=latest_replay_score,
+        observed_drift=observed_drift,
+    )
+
+    return ReflectInputs(
+        horizon_steps=horizon_steps,
+        thresholds=thresholds,
+        expected_delta=expected_delta,
+        foresight_terms=foresight_terms,
+        constraint_values=constraint_values,
+        latest_replay_score=latest_replay_score,
+    )
+
+
 def run_reflect(
     run_id: str,
     cycle_id: str,
@@ -74,37 +164,51 @@ def run_reflect(
     latest_replay_score: Optional[float] = None,
     constraint_specs: Optional[List[ConstraintSpec]] = None,
 ) -> ReflectDecision:
-    horizon_steps = max(1, int(horizon_steps))
-    theta = float(theta)
-    weights = compute_weights(horizon_steps, decay=float(weights_decay))
-
-    expected_delta = estimate_expected_delta(recent_cycles or [], agent_count=max(1, len(trust_by_agent)))
-    projections = project_horizon(
+    inputs = prepare_reflect(
         trust_by_agent=trust_by_agent,
-        horizon_steps=horizon_steps,
-        expected_delta=expected_delta,
-        suppression_active=suppression_active,
-    )
-
-    failure_rate = _infer_failure_rate(recent_cycles)
-    Fs_raw, foresight_steps = compute_fs_from_projections(
-        projections=projections,
-        weights=weights,
         thresholds=thresholds,
         suppression_active=suppression_active,
-        failure_rate=failure_rate,
+        recent_cycles=recent_cycles,
+        recent_events=recent_events,
+        horizon_steps=horizon_steps,
+        latest_replay_score=latest_replay_score,
+    )
+    return evaluate_reflect(
+        inputs,
+        run_id=run_id,
+        cycle_id=cycle_id,
+        timestamp=timestamp,
+        actor=actor,
+        request_id=request_id,
+        theta=theta,
+        weights_decay=weights_decay,
+        mode=mode,
+        constraint_specs=constraint_specs,
     )
 
-    suppression_count = 1 if suppression_active else 0
-    instability = _infer_instability(recent_events, thresholds)
-    observed_drift = _infer_observed_drift(recent_cycles, agent_count=max(1, len(trust_by_agent)))
-    penalties, total_penalty = compute_constraint_penalties(
-        trust_by_agent=trust_by_agent,
-        thresholds=thresholds,
-        suppression_count=suppression_count,
-        instability=instability,
-        latest_replay_score=latest_replay_score,
-        observed_drift=observed_drift,
+
+def evaluate_reflect(
+    inputs: ReflectInputs,
+    run_id: str,
+    cycle_id: str,
+    timestamp: Optional[str],
+    actor: Optional[Dict[str, Any]] = None,
+    request_id: Optional[str] = None,
+    theta: float = 0.10,
+    weights_decay: float = 0.85,
+    mode: str = "score",
+    constraint_specs: Optional[List[ConstraintSpec]] = None,
+) -> ReflectDecision:
+    """Score prepared inputs under one set of weights, theta and constraints."""
+    horizon_steps = inputs.horizon_steps
+    theta = float(theta)
+    weights = compute_weights(horizon_steps, decay=float(weights_decay))
+    Fs_raw, foresight_steps = weigh_foresight(inputs.foresight_terms, weights)
+
+    penalties, total_penalty = penalties_from_values(
+        inputs.constraint_values,
+        inputs.thresholds,
+        latest_replay_score=inputs.latest_replay_score,
         specs=constraint_specs,
     )
 
@@ -137,7 +241,7 @@ def run_reflect(
         "actor": actor,
         "total_penalty": total_penalty,
         "Fs_raw": Fs_raw,
-        "expected_delta": expected_delta,
+        "expected_delta": inputs.expected_delta,
     }
 
     decision = ReflectDecision.new(
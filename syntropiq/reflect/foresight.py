@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
 from typing import Dict, List
 
+# Fleets at least this large project average trust in closed form.
+FAST_FORESIGHT_MIN_AGENTS = 1024
+
 
 def _clamp(value: float, low: float, high: float) -> float:
     return max(low, min(high, value))
@@ -43,3 +48,49 @@ def project_horizon(
         projections.append(dict(current))
 
     return projections
+
+
+def project_horizon_averages(
+    trust_by_agent: Dict[str, float],
+    horizon_steps: int,
+    expected_delta: float,
+    suppression_active: bool,
+) -> List[float]:
+    """
+    Average trust per horizon step, as ``project_horizon`` would yield,
+    without materialising per-step dicts.
+
+    After the first clamped step every value lies in [0, 1] and keeps moving
+    by the same ``step_delta``, so step k is ``clamp(x1 + (k - 1) * step_delta)``.
+    With ``x1`` sorted and prefix-summed, the clamped agents at each step
+    are a prefix or suffix found by bisection: O(agents log agents + horizon).
+    Matches the per-step dict averages to floating point rounding.
+    """
+    steps = max(0, horizon_steps)
+    n = len(trust_by_agent)
+    if n == 0:
+        return [0.0] * steps
+
+    suppression_adjustment = -0.01 if suppression_active else 0.0
+    step_delta = expected_delta + suppression_adjustment
+
+    first = sorted(_clamp(float(v) + step_delta, 0.0, 1.0) for v in trust_by_agent.values())
+    prefix = [0.0, *accumulate(first)]
+    total = prefix[-1]
+
+    averages: List[float] = []
+    for k in range(steps):
+        offset = k * step_delta
+        if offset > 0:
+            # Agents at or above 1 - offset are clamped to 1.
+            j = bisect_left(first, 1.0 - offset)
+            step_total = prefix[j] + j * offset + (n - j)
+        elif offset < 0:
+            # Agents at or below -offset are clamped to 0.
+            j = bisect_right(first, -offset)
+            step_total = (total - prefix[j]) + (n - j) * offset
+        else:
+            step_total = total
+        averages.append(step_total / n)
+
+    return averages
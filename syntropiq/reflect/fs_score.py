@@ -25,37 +25,51 @@ def compute_fs_from_projections(
     suppression_active: bool,
     failure_rate: float = 0.0,
 ) -> Tuple[float, List[ForesightStep]]:
-    if not projections:
-        return 0.0, []
+    terms = compute_foresight_terms(projections, thresholds, suppression_active, failure_rate)
+    return weigh_foresight(terms, weights)
+
+
+def compute_foresight_terms(
+    projections: List[Dict[str, float]],
+    thresholds: Dict[str, float],
+    suppression_active: bool,
+    failure_rate: float = 0.0,
+) -> List[ForesightStep]:
+    """Weight-independent A/D terms per horizon step (``weighted`` left at 0.0)."""
+    averages = []
+    for trust_vector in projections:
+        if trust_vector:
+            averages.append(sum(trust_vector.values()) / len(trust_vector))
+        else:
+            averages.append(0.0)
+    return compute_foresight_terms_from_averages(averages, thresholds, suppression_active, failure_rate)
 
+
+def compute_foresight_terms_from_averages(
+    averages: List[float],
+    thresholds: Dict[str, float],
+    suppression_active: bool,
+    failure_rate: float = 0.0,
+) -> List[ForesightStep]:
+    """``compute_foresight_terms`` from per-step average trust (e.g. ``project_horizon_averages``)."""
     drift_proxy = _clamp(float(thresholds.get("drift_delta", 0.1)) / 0.2, 0.0, 1.0)
     risk_proxy = max(drift_proxy, _clamp(float(failure_rate), 0.0, 1.0))
 
     steps: List[ForesightStep] = []
     prev_avg = None
-    fs_total = 0.0
-
-    for idx, trust_vector in enumerate(projections):
-        if trust_vector:
-            avg_trust = sum(trust_vector.values()) / len(trust_vector)
-        else:
-            avg_trust = 0.0
 
+    for idx, avg_trust in enumerate(averages):
         A = _clamp(avg_trust - risk_proxy, 0.0, 1.0)
         delta = abs(avg_trust - prev_avg) if prev_avg is not None else 0.0
         suppression_indicator = 0.2 if suppression_active else 0.0
         D = _clamp(delta + suppression_indicator, 0.0, 1.0)
 
-        w = float(weights.get(str(idx), 0.0))
-        weighted = w * (A - D)
-        fs_total += weighted
-
         steps.append(
             ForesightStep(
                 horizon_index=idx,
                 A=A,
                 D=D,
-                weighted=weighted,
+                weighted=0.0,
                 notes={
                     "avg_trust": avg_trust,
                     "risk_proxy": risk_proxy,
@@ -66,5 +80,33 @@ def compute_fs_from_projections(
 
         prev_avg = avg_trust
 
+    return steps
+
+
+def weigh_foresight(
+    terms: List[ForesightStep],
+    weights: Dict[str, float],
+) -> Tuple[float, List[ForesightStep]]:
+    """Apply horizon weights to precomputed terms; ``terms`` is not modified."""
+    if not terms:
+        return 0.0, []
+
+    steps: List[ForesightStep] = []
+    fs_total = 0.0
+
+    for term in terms:
+        w = float(weights.get(str(term.horizon_index), 0.0))
+        weighted = w * (term.A - term.D)
+        fs_total += weighted
+        steps.append(
+            ForesightStep(
+                horizon_index=term.horizon_index,
+                A=term.A,
+                D=term.D,
+                weighted=weighted,
+                notes=dict(term.notes),
+            )
+        )
+
     Fs = _clamp(fs_total, -1.0, 1.0)
     return Fs, steps
@@ -0,0 +1,99 @@
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from syntropiq.core.models import Agent, Task
+from syntropiq.governance.array_trust_engine import ArrayTrustEngine
+from syntropiq.governance.loop import GovernanceLoop
+from syntropiq.governance.trust_engine import SyntropiqTrustEngine
+from syntropiq.persistence.state_manager import PersistentStateManager
+
+
+def _fleet(rng: random.Random, size: int):
+    return {
+        f"agent_{i:03d}": Agent(
+            id=f"agent_{i:03d}",
+            trust_score=round(rng.uniform(0.6, 1.0), 2),
+            capabilities=["x"],
+            status="active",
+        )
+        for i in range(size)
+    }
+
+
+def _clone(agents):
+    return {aid: agent.model_copy() for aid, agent in agents.items()}
+
+
+def _assign(engine, tasks, agents, seed):
+    random.seed(seed)
+    try:
+        return [(a.task_id, a.agent_id) for a in engine.assign_agents(tasks, agents)]
+    except RuntimeError as exc:
+        return str(exc)
+
+
+@pytest.mark.parametrize("routing_mode", ["deterministic", "competitive", "capacity"])
+def test_array_engine_matches_reference(routing_mode):
+    rng = random.Random(7)
+    reference = SyntropiqTrustEngine(trust_threshold=0.7, suppression_threshold=0.75, routing_mode=routing_mode)
+    vectorized = ArrayTrustEngine(trust_threshold=0.7, suppression_threshold=0.75, routing_mode=routing_mode)
+    ref_agents = _fleet(rng, 40)
+    vec_agents = _clone(ref_agents)
+
+    for cycle in range(60):
+        tasks = [Task(id=f"c{cycle}t{i}", impact=0.5, urgency=0.5, risk=rng.choice([0.1, 0.3, 0.6, 0.9])) for i in range(8)]
+        assert _assign(vectorized, tasks, vec_agents, cycle) == _assign(reference, tasks, ref_agents, cycle)
+        assert vectorized.suppressed_agents == reference.suppressed_agents
+        assert vectorized.probation_agents == reference.probation_agents
+        assert vectorized.drift_warnings == reference.drift_warnings
+        assert vectorized.trust_history == reference.trust_history
+        assert vectorized.deferred_tasks == reference.deferred_tasks
+        assert {a: x.status for a, x in vec_agents.items()} == {a: x.status for a, x in ref_agents.items()}
+
+        for aid in list(ref_agents):
+            step = rng.choice([-0.2, -0.05, 0.0, 0.02, 0.05, 0.1])
+            score = round(min(1.0, max(0.0, ref_agents[aid].trust_score + step)), 2)
+            ref_agents[aid].trust_score = score
+            vec_agents[aid].trust_score = score
+        if cycle % 9 == 4:
+            joined = Agent(id=f"late_{cycle}", trust_score=0.9, capabilities=["x"], status="active")
+            ref_agents[joined.id] = joined
+            vec_agents[joined.id] = joined.model_copy()
+        if cycle % 11 == 5 and reference.suppressed_agents:
+            healed = sorted(reference.suppressed_agents)[0]
+            for engine in (reference, vectorized):
+                engine.suppressed_agents.pop(healed, None)
+                engine.probation_agents.pop(healed, None)
+        if cycle % 13 == 6:
+            reference.drift_delta = vectorized.drift_delta = rng.choice([0.05, 0.1, 0.15])
+
+
+def test_array_engine_status_and_growth():
+    engine = ArrayTrustEngine()
+    engine.INITIAL_CAPACITY = 4
+    engine._allocate(4)
+    agents = {f"a{i}": Agent(id=f"a{i}", trust_score=0.9, capabilities=["x"], status="active") for i in range(10)}
+    for _ in range(12):
+        engine.assign_agents([Task(id="t", impact=0.5, urgency=0.5, risk=0.5)], agents)
+
+    assert engine.get_agent_status("a7")["trust_history"] == [0.9] * 10
+    assert engine.get_agent_status("missing") == {
+        "trust_history": [],
+        "is_suppressed": False,
+        "suppression_cycles": 0,
+        "is_drifting": False,
+    }
+
+
+def test_loop_selects_array_backend(tmp_path):
+    state = PersistentStateManager(db_path=str(tmp_path / "array.db"))
+    try:
+        loop = GovernanceLoop(state_manager=state, engine_backend="array")
+        assert isinstance(loop.trust_engine, ArrayTrustEngine)
+        with pytest.raises(ValueError, match="engine_backend"):
+            GovernanceLoop(state_manager=state, engine_backend="gpu")
+    finally:
+        state.close()
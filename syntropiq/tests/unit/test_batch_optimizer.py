@@ -0,0 +1,59 @@
+import random
+
+import pytest
+
+from syntropiq.core.models import Task
+from syntropiq.optimize import batch_optimizer
+from syntropiq.optimize.batch_optimizer import score_lambda_batch
+from syntropiq.optimize.lambda_optimizer import optimize_tasks
+from syntropiq.optimize.schema import LambdaVector, OptimizeInput
+
+
+def _input(n=200, seed=5):
+    rng = random.Random(seed)
+    grid = [0.0, 0.5, 1.0]
+    tasks = [
+        # Coarse values and repeated ids exercise tie-breaking and id lookups.
+        Task(id=f"t{rng.randrange(n - 20)}", impact=rng.choice(grid), urgency=rng.choice(grid), risk=rng.random())
+        for _ in range(n)
+    ]
+    return OptimizeInput(tasks=tasks, trust_by_agent={"a": 0.9, "b": 0.6}, request_id="req-1")
+
+
+LAMBDAS = [
+    LambdaVector(l_cost=0.25, l_time=0.25, l_risk=0.25, l_trust=0.25),
+    LambdaVector(l_cost=2.0, l_time=0.1, l_risk=0.5, l_trust=0.9),
+    LambdaVector(l_cost=0.0, l_time=0.0, l_risk=0.0, l_trust=0.0),
+    LambdaVector(l_cost=0.1, l_time=0.7, l_risk=0.2, l_trust=0.0),
+]
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_batch_matches_optimize_tasks_per_candidate(monkeypatch, use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(batch_optimizer, "np", None)
+    optimize_input = _input()
+
+    batch = score_lambda_batch(optimize_input, LAMBDAS, run_id="WHAT_IF")
+
+    for k, lam in enumerate(LAMBDAS):
+        expected = optimize_tasks(optimize_input, lam, run_id="WHAT_IF")
+        decision = batch.decision(k)
+        assert decision.chosen_task_ids == expected.chosen_task_ids
+        assert decision.score_breakdown == expected.score_breakdown
+        assert decision.lambda_vector == expected.lambda_vector
+        assert decision.V_prime == expected.V_prime
+        assert decision.alignment_score == pytest.approx(expected.alignment_score, abs=1e-9)
+
+    assert batch.alignment_scores[batch.best_index()] == max(batch.alignment_scores)
+
+
+def test_batch_rejects_empty_candidates_and_handles_no_tasks():
+    with pytest.raises(ValueError):
+        score_lambda_batch(_input(), [])
+
+    empty = score_lambda_batch(OptimizeInput(tasks=[], trust_by_agent={}), LAMBDAS[:1])
+    assert empty.ranking(0) == []
+    assert empty.alignment_scores == [0.0]
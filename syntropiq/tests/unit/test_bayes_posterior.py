@@ -1,6 +1,12 @@
 import pytest
 
-from syntropiq.optimize.bayes_posterior import compute_beta_posterior, posterior_from_cycles
+from syntropiq.api.telemetry import GovernanceTelemetryHub
+from syntropiq.core.models import ExecutionResult
+from syntropiq.optimize.bayes_posterior import (
+    BayesPosteriorTracker,
+    compute_beta_posterior,
+    posterior_from_cycles,
+)
 
 
 def test_beta_posterior_deterministic_values():
@@ -20,3 +26,73 @@ def test_posterior_from_cycles_counts_success_failure():
     out = posterior_from_cycles(cycles)
     assert out["alpha"] == pytest.approx(1 + 4)
     assert out["beta"] == pytest.approx(1 + 3)
+
+
+def _cycle(run_id, successes, failures):
+    return {
+        "run_id": run_id,
+        "cycle_id": f"{run_id}:c",
+        "timestamp": "2026-01-01T00:00:00+00:00",
+        "total_agents": 1,
+        "successes": successes,
+        "failures": failures,
+        "trust_delta_total": 0.0,
+    }
+
+
+def test_tracker_window_matches_posterior_from_cycles():
+    cycles = [_cycle("RUN:1", i % 4, (i * 7) % 3) for i in range(80)]
+    tracker = BayesPosteriorTracker(window=50)
+
+    assert tracker.posterior("RUN", seed=lambda: cycles[:30]) == posterior_from_cycles(cycles[:30])
+    for cycle in cycles[30:]:
+        tracker.observe_cycle(cycle)
+    tracker.observe_cycle(_cycle("UNSEEDED", 5, 0))
+
+    assert tracker.posterior("RUN") == posterior_from_cycles(cycles[-50:])
+    assert not tracker.tracks("UNSEEDED")
+    assert tracker.posterior("UNSEEDED") == compute_beta_posterior(0, 0)
+
+
+def test_tracker_exponential_forgetting():
+    tracker = BayesPosteriorTracker(window=None, forgetting=0.5)
+    tracker.posterior("RUN", seed=list)
+    tracker.observe_cycle(_cycle("RUN", 4, 0))
+    tracker.observe_cycle(_cycle("RUN", 0, 2))
+
+    out = tracker.posterior("RUN")
+    assert out["alpha"] == pytest.approx(1 + 2)
+    assert out["beta"] == pytest.approx(1 + 2)
+
+    with pytest.raises(ValueError):
+        BayesPosteriorTracker(window=10, forgetting=0.9)
+
+
+def test_tracker_snapshots_only_on_change_and_tracks_agents():
+    class Ledger:
+        def __init__(self):
+            self.rows = []
+
+        def save_bayes_posterior(self, record):
+            self.rows.append(record)
+
+    ledger = Ledger()
+    tracker = BayesPosteriorTracker(per_agent=True)
+    tracker.snapshot("RUN", ledger, seed=list)
+    tracker.snapshot("RUN", ledger)
+    assert len(ledger.rows) == 1
+
+    hub = GovernanceTelemetryHub(bayes_tracker=tracker)
+    hub.record_cycle(_cycle("RUN:2", 3, 1))
+    payload = tracker.snapshot("RUN", ledger)
+    assert len(ledger.rows) == 2
+    assert (payload["alpha"], payload["beta"]) == (4.0, 2.0)
+
+    results = [
+        ExecutionResult(task_id="t1", agent_id="a", success=True, latency=0.0, metadata={}),
+        ExecutionResult(task_id="t2", agent_id="a", success=False, latency=0.0, metadata={}),
+        ExecutionResult(task_id="t3", agent_id="b", success=True, latency=0.0, metadata={}),
+    ]
+    tracker.observe_results("RUN:2", results)
+    assert tracker.posterior("RUN", agent_id="a")["alpha"] == 2.0
+    assert tracker.snapshot("RUN", ledger, agent_id="b")["agent_id"] == "b"
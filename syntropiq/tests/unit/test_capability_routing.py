@@ -0,0 +1,105 @@
+import random
+
+import pytest
+
+from syntropiq.core.models import Agent, Task
+from syntropiq.governance.trust_engine import SyntropiqTrustEngine
+
+
+def _fleet():
+    return {
+        "fraud_a": Agent(id="fraud_a", trust_score=0.80, capabilities=["fraud"], status="active"),
+        "lend_a": Agent(id="lend_a", trust_score=0.95, capabilities=["lending"], status="active"),
+        "fraud_b": Agent(id="fraud_b", trust_score=0.90, capabilities=["fraud", "lending"], status="active"),
+        "readmit": Agent(id="readmit", trust_score=0.99, capabilities=["readmission"], status="active"),
+    }
+
+
+def _task(task_id, required=None, risk=0.6):
+    metadata = {"required_capability": required} if required is not None else {}
+    return Task(id=task_id, impact=0.5, urgency=0.5, risk=risk, metadata=metadata)
+
+
+def test_tasks_route_only_to_capable_agents():
+    engine = SyntropiqTrustEngine(trust_threshold=0.7)
+    agents = _fleet()
+
+    assignments = engine.assign_agents(
+        [
+            _task("any"),
+            _task("fraud", "fraud"),
+            _task("lending", ["lending"]),
+            _task("both", ["fraud", "lending"]),
+        ],
+        agents,
+    )
+    assert {a.task_id: a.agent_id for a in assignments} == {
+        "any": "readmit",
+        "fraud": "fraud_b",
+        "lending": "lend_a",
+        "both": "fraud_b",
+    }
+    assert engine.capable_agent_ids(("fraud", "lending")) == {"fraud_b"}
+
+    with pytest.raises(RuntimeError, match="capabilities"):
+        engine.assign_agents([_task("scan", "imaging")], agents)
+
+
+def test_capability_index_follows_agent_changes():
+    engine = SyntropiqTrustEngine(trust_threshold=0.7)
+    agents = _fleet()
+    engine.assign_agents([_task("t", "fraud")], agents)
+
+    agents["fraud_b"].capabilities = ["lending"]
+    assignment = engine.assign_agents([_task("t", "fraud")], agents)
+    assert assignment[0].agent_id == "fraud_a"
+    assert "fraud_b" not in engine.capability_index["fraud"]
+
+
+def test_competitive_mode_samples_within_capable_set():
+    engine = SyntropiqTrustEngine(trust_threshold=0.7, routing_mode="competitive")
+    agents = _fleet()
+    random.seed(0)
+    chosen = {
+        engine.assign_agents([_task(f"t{i}", "fraud")], agents)[0].agent_id
+        for i in range(50)
+    }
+    assert chosen == {"fraud_a", "fraud_b"}
+
+
+@pytest.mark.parametrize("routing_mode", ["deterministic", "competitive"])
+def test_array_engine_matches_capability_routing(routing_mode):
+    pytest.importorskip("numpy")
+    from syntropiq.governance.array_trust_engine import ArrayTrustEngine
+
+    rng = random.Random(11)
+    capabilities = ["fraud", "lending", "readmission"]
+    agents = {
+        f"a{i}": Agent(
+            id=f"a{i}",
+            trust_score=round(rng.uniform(0.6, 1.0), 2),
+            capabilities=rng.sample(capabilities, rng.randint(1, 2)),
+            status="active",
+        )
+        for i in range(30)
+    }
+    clones = {aid: agent.model_copy() for aid, agent in agents.items()}
+    reference = SyntropiqTrustEngine(trust_threshold=0.7, suppression_threshold=0.75, routing_mode=routing_mode)
+    vectorized = ArrayTrustEngine(trust_threshold=0.7, suppression_threshold=0.75, routing_mode=routing_mode)
+
+    for cycle in range(20):
+        tasks = [
+            _task(f"c{cycle}t{i}", rng.choice([None, "fraud", "lending", ["fraud", "readmission"]]), rng.choice([0.2, 0.6]))
+            for i in range(6)
+        ]
+        results = []
+        for engine, fleet in ((reference, agents), (vectorized, clones)):
+            random.seed(cycle)
+            try:
+                results.append([(a.task_id, a.agent_id) for a in engine.assign_agents(tasks, fleet)])
+            except RuntimeError as exc:
+                results.append(str(exc))
+        assert results[0] == results[1]
+        for aid in agents:
+            score = round(min(1.0, max(0.0, agents[aid].trust_score + rng.choice([-0.1, 0.0, 0.05]))), 2)
+            agents[aid].trust_score = clones[aid].trust_score = score
@@ -0,0 +1,66 @@
+from collections import Counter
+
+import pytest
+
+from syntropiq.core.models import Agent, Task
+from syntropiq.execution.deterministic_executor import DeterministicExecutor
+from syntropiq.governance.loop import GovernanceLoop
+from syntropiq.governance.trust_engine import SyntropiqTrustEngine
+from syntropiq.persistence.state_manager import PersistentStateManager
+
+
+def _agents():
+    return {
+        "a": Agent(id="a", trust_score=0.95, capabilities=["x"], status="active"),
+        "b": Agent(id="b", trust_score=0.90, capabilities=["x"], status="active"),
+        "c": Agent(id="c", trust_score=0.85, capabilities=["x"], status="active"),
+    }
+
+
+def _tasks(count, risk=0.6):
+    return [Task(id=f"t{i}", impact=0.5, urgency=0.5, risk=risk) for i in range(count)]
+
+
+def test_capacity_mode_spreads_load_by_trust():
+    engine = SyntropiqTrustEngine(trust_threshold=0.7, routing_mode="capacity", agent_capacity=2)
+    engine.capacity_limits["a"] = 3
+
+    assignments = engine.assign_agents(_tasks(6), _agents())
+    assert [a.agent_id for a in assignments] == ["a", "a", "a", "b", "b", "c"]
+    assert engine.deferred_tasks == []
+
+    assignments = engine.assign_agents(_tasks(9), _agents())
+    assert Counter(a.agent_id for a in assignments) == {"a": 3, "b": 2, "c": 2}
+    assert engine.deferred_tasks == ["t7", "t8"]
+
+
+def test_capacity_mode_keeps_probation_quota():
+    engine = SyntropiqTrustEngine(trust_threshold=0.7, suppression_threshold=0.75, routing_mode="capacity", agent_capacity=5)
+    agents = _agents()
+    agents["c"].trust_score = 0.72
+    engine.assign_agents(_tasks(1), agents)  # c enters suppression / probation
+    assert "c" in engine.probation_agents
+
+    assignments = engine.assign_agents(_tasks(4, risk=0.2) + [Task(id="risky", impact=0.5, urgency=0.5, risk=0.9)], agents)
+    by_task = {a.task_id: a.agent_id for a in assignments}
+    assert [by_task[f"t{i}"] for i in range(4)] == ["c", "c", "a", "a"]
+    assert by_task["risky"] == "a"
+
+
+def test_invalid_capacity_rejected():
+    with pytest.raises(ValueError, match="agent_capacity"):
+        SyntropiqTrustEngine(routing_mode="capacity", agent_capacity=0)
+    with pytest.raises(ValueError, match="routing_mode"):
+        SyntropiqTrustEngine(routing_mode="round_robin")
+
+
+def test_loop_reports_deferred_tasks(tmp_path):
+    state = PersistentStateManager(db_path=str(tmp_path / "capacity.db"))
+    try:
+        loop = GovernanceLoop(state_manager=state, routing_mode="capacity", agent_capacity=1)
+        result = loop.execute_cycle(_tasks(5, risk=0.5), _agents(), DeterministicExecutor(), run_id="CAP")
+        assert result["statistics"]["tasks_executed"] == 3
+        assert len(result["statistics"]["tasks_deferred"]) == 2
+        assert len({r.agent_id for r in result["results"]}) == 3
+    finally:
+        state.close()
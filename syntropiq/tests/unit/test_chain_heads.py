@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import sqlite3
+
+from syntropiq.api.state_manager import PersistentStateManager
+
+
+def _event(run_id: str, n: int):
+    return {
+        "run_id": run_id,
+        "cycle_id": f"{run_id}:{n}",
+        "timestamp": f"2026-03-01T10:00:{n:02d}Z",
+        "type": "trust_update",
+        "agent_id": "agent_a",
+        "metadata": {"n": n},
+    }
+
+
+def _chain_rows(db_path, table: str, chain_id: str, order: str = "id ASC"):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(
+            f"SELECT id, prev_hash, hash FROM {table} WHERE chain_id=? ORDER BY {order}",
+            (chain_id,),
+        ).fetchall()
+
+
+def test_event_ingest_does_not_rescan_chain(monkeypatch, tmp_path):
+    monkeypatch.setenv("AUDIT_CHAIN_MODE", "log")
+    db_path = tmp_path / "telemetry.db"
+    manager = PersistentStateManager(db_path=db_path)
+    manager.save_event(_event("RUN_H", 0))
+
+    statements = []
+    manager._pool.writer.set_trace_callback(statements.append)
+    for n in range(1, 20):
+        manager.save_event(_event("RUN_H", n))
+    manager._pool.writer.set_trace_callback(None)
+
+    assert not [sql for sql in statements if "COUNT(" in sql or "ORDER BY" in sql]
+    rows = _chain_rows(db_path, "events", "telemetry:RUN_H")
+    assert [row[0] for row in rows] == [f"telemetry:RUN_H:{n:012d}" for n in range(1, 21)]
+    assert manager.verify_events_chain(chain_id="RUN_H")["ok"] is True
+    manager.close()
+
+
+def test_chain_heads_stay_consistent_across_writers(monkeypatch, tmp_path):
+    monkeypatch.setenv("AUDIT_CHAIN_MODE", "log")
+    db_path = tmp_path / "telemetry.db"
+    first = PersistentStateManager(db_path=db_path)
+    second = PersistentStateManager(db_path=db_path)
+
+    for n in range(6):
+        writer = first if n % 2 == 0 else second
+        writer.save_event(_event("RUN_X", n))
+        writer.save_lambda_history({"run_id": "RUN_X", "timestamp": f"2026-03-01T10:00:{n:02d}Z", "n": n})
+
+    rows = _chain_rows(db_path, "events", "telemetry:RUN_X")
+    assert len(rows) == 6
+    assert first.verify_events_chain(chain_id="RUN_X")["ok"] is True
+    assert second.verify_lambda_chain(run_id="RUN_X")["ok"] is True
+    first.close()
+    second.close()
+
+
+def test_head_seeded_from_existing_rows(monkeypatch, tmp_path):
+    monkeypatch.setenv("AUDIT_CHAIN_MODE", "log")
+    db_path = tmp_path / "telemetry.db"
+    manager = PersistentStateManager(db_path=db_path)
+    for n in range(3):
+        manager.save_event(_event("RUN_S", n))
+    manager.close()
+
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DELETE FROM chain_heads")
+        conn.commit()
+
+    reopened = PersistentStateManager(db_path=db_path)
+    reopened.save_event(_event("RUN_S", 3))
+    rows = _chain_rows(db_path, "events", "telemetry:RUN_S")
+    assert rows[-1][0] == "telemetry:RUN_S:000000000004"
+    assert rows[-1][1] == rows[-2][2]
+    assert reopened.verify_events_chain(chain_id="RUN_S")["ok"] is True
+    reopened.close()
+
+
+def test_replacing_tip_with_older_record_reseeds_head(monkeypatch, tmp_path):
+    monkeypatch.setenv("AUDIT_CHAIN_MODE", "log")
+    db_path = tmp_path / "telemetry.db"
+    manager = PersistentStateManager(db_path=db_path)
+    manager.save_lambda_history({"id": "a", "run_id": "RUN_R", "timestamp": "2026-03-01T10:00:00Z"})
+    manager.save_lambda_history({"id": "b", "run_id": "RUN_R", "timestamp": "2026-03-01T10:00:05Z"})
+    manager.save_lambda_history({"id": "b", "run_id": "RUN_R", "timestamp": "2026-02-01T10:00:00Z"})
+    saved = manager.save_lambda_history({"id": "c", "run_id": "RUN_R", "timestamp": "2026-03-01T10:00:09Z"})
+
+    with sqlite3.connect(db_path) as conn:
+        tip_hash = conn.execute("SELECT hash FROM lambda_history WHERE id='a'").fetchone()[0]
+        prev_hash = conn.execute("SELECT prev_hash FROM lambda_history WHERE id=?", (saved["id"],)).fetchone()[0]
+    assert prev_hash == tip_hash
+    manager.close()
+
+
+def test_save_events_matches_single_saves(monkeypatch, tmp_path):
+    monkeypatch.setenv("AUDIT_CHAIN_MODE", "log")
+    single = PersistentStateManager(db_path=tmp_path / "single.db")
+    batched = PersistentStateManager(db_path=tmp_path / "batched.db")
+    events = [_event("RUN_B", n) for n in range(5)] + [_event("RUN_C", n) for n in range(3)]
+    events.insert(2, _event("RUN_C", 9))
+
+    for event in events[:3]:
+        single.save_event(event)
+        batched.save_event(event)
+    for event in events[3:]:
+        single.save_event(event)
+    batched.save_events(events[3:])
+
+    for chain_id in ("telemetry:RUN_B", "telemetry:RUN_C"):
+        assert _chain_rows(tmp_path / "batched.db", "events", chain_id) == _chain_rows(
+            tmp_path / "single.db", "events", chain_id
+        )
+    assert batched.verify_events_chain(chain_id="RUN_B")["ok"] is True
+    single.close()
+    batched.close()
+
+
+def test_save_events_with_existing_id_falls_back_to_row_path(monkeypatch, tmp_path):
+    monkeypatch.setenv("AUDIT_CHAIN_MODE", "log")
+    db_path = tmp_path / "telemetry.db"
+    manager = PersistentStateManager(db_path=db_path)
+    manager.save_events([_event("RUN_D", 0), _event("RUN_D", 1)])
+    replacement = dict(_event("RUN_D", 1), id="telemetry:RUN_D:000000000002")
+    manager.save_events([replacement, _event("RUN_D", 2)])
+
+    rows = _chain_rows(db_path, "events", "telemetry:RUN_D")
+    assert [row[0] for row in rows] == [f"telemetry:RUN_D:{n:012d}" for n in (1, 2, 3)]
+    assert rows[2][1] == rows[1][2]
+    manager.close()
@@ -0,0 +1,87 @@
+import threading
+import time
+
+import pytest
+
+from syntropiq.core.context import get_request_id, request_id_var
+from syntropiq.core.models import Agent, ExecutionResult, Task
+from syntropiq.execution.deterministic_executor import DeterministicExecutor
+from syntropiq.governance.loop import GovernanceLoop
+from syntropiq.persistence.state_manager import PersistentStateManager
+
+
+class SlowRecordingExecutor(DeterministicExecutor):
+    """Deterministic executor that sleeps and records the request_id seen by workers."""
+
+    def __init__(self, delay: float = 0.05):
+        super().__init__(decision_threshold=0.0, fixed_latency=delay)
+        self.delay = delay
+        self.request_ids = []
+        self.threads = set()
+        self._lock = threading.Lock()
+
+    def execute(self, task: Task, agent: Agent) -> ExecutionResult:
+        time.sleep(self.delay)
+        with self._lock:
+            self.request_ids.append(get_request_id())
+            self.threads.add(threading.get_ident())
+        return super().execute(task, agent)
+
+
+def _agents():
+    return {
+        "a": Agent(id="a", trust_score=0.90, capabilities=["x"], status="active"),
+        "b": Agent(id="b", trust_score=0.85, capabilities=["x"], status="active"),
+    }
+
+
+def _tasks(n: int = 8):
+    return [
+        Task(id=f"t{i}", impact=0.9 - i * 0.05, urgency=0.5, risk=0.1 + i * 0.1)
+        for i in range(n)
+    ]
+
+
+def _run(tmp_path, name: str, max_concurrency: int, executor):
+    state = PersistentStateManager(db_path=str(tmp_path / f"{name}.db"))
+    try:
+        loop = GovernanceLoop(state_manager=state, max_concurrency=max_concurrency)
+        return loop.execute_cycle(_tasks(), _agents(), executor, run_id="DISPATCH")
+    finally:
+        state.close()
+
+
+def test_concurrent_dispatch_matches_sequential(tmp_path):
+    sequential = _run(tmp_path, "seq", 1, SlowRecordingExecutor(delay=0.0))
+    concurrent = _run(tmp_path, "par", 4, SlowRecordingExecutor(delay=0.0))
+
+    assert [(r.task_id, r.agent_id, r.success) for r in concurrent["results"]] == [
+        (r.task_id, r.agent_id, r.success) for r in sequential["results"]
+    ]
+    assert concurrent["trust_updates"] == sequential["trust_updates"]
+    assert concurrent["mutation"] == sequential["mutation"]
+
+
+def test_concurrent_dispatch_overlaps_and_propagates_request_id(tmp_path):
+    executor = SlowRecordingExecutor(delay=0.05)
+    token = request_id_var.set("req-dispatch")
+    try:
+        started = time.perf_counter()
+        result = _run(tmp_path, "overlap", 8, executor)
+        elapsed = time.perf_counter() - started
+    finally:
+        request_id_var.reset(token)
+
+    assert len(result["results"]) == 8
+    assert elapsed < 8 * 0.05
+    assert len(executor.threads) > 1
+    assert executor.request_ids == ["req-dispatch"] * 8
+
+
+def test_max_concurrency_validated(tmp_path):
+    state = PersistentStateManager(db_path=str(tmp_path / "invalid.db"))
+    try:
+        with pytest.raises(ValueError, match="max_concurrency"):
+            GovernanceLoop(state_manager=state, max_concurrency=0)
+    finally:
+        state.close()
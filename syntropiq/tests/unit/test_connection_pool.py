@@ -0,0 +1,104 @@
+import threading
+
+import pytest
+
+from syntropiq.core.config import DatabaseConfig
+from syntropiq.persistence.connection import SQLiteConnectionPool
+
+
+def _pool(tmp_path, **kwargs):
+    pool = SQLiteConnectionPool(tmp_path / "pool.db", **kwargs)
+    with pool.write() as conn:
+        conn.execute("CREATE TABLE IF NOT EXISTS kv (k TEXT PRIMARY KEY, v INTEGER)")
+    return pool
+
+
+def test_pool_applies_wal_and_pragmas(tmp_path):
+    config = DatabaseConfig(synchronous="full", cache_size=-4000, mmap_size=0)
+    pool = SQLiteConnectionPool.from_config(tmp_path / "pragmas.db", config)
+    try:
+        with pool.read() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2
+            assert conn.execute("PRAGMA cache_size").fetchone()[0] == -4000
+            assert conn.execute("PRAGMA mmap_size").fetchone()[0] == 0
+    finally:
+        pool.close()
+
+
+def test_reader_not_blocked_by_open_write(tmp_path):
+    pool = _pool(tmp_path)
+    try:
+        with pool.write() as conn:
+            conn.execute("INSERT INTO kv VALUES ('a', 1)")
+
+        seen = []
+        with pool.write() as conn:
+            conn.execute("UPDATE kv SET v = 2 WHERE k = 'a'")
+
+            def reader():
+                with pool.read() as rconn:
+                    seen.append(rconn.execute("SELECT v FROM kv WHERE k = 'a'").fetchone()[0])
+
+            thread = threading.Thread(target=reader)
+            thread.start()
+            thread.join(timeout=5)
+            assert not thread.is_alive()
+
+        assert seen == [1]
+        with pool.read() as conn:
+            assert conn.execute("SELECT v FROM kv WHERE k = 'a'").fetchone()[0] == 2
+    finally:
+        pool.close()
+
+
+def test_concurrent_writers_are_serialized(tmp_path):
+    pool = _pool(tmp_path, pool_size=2)
+    try:
+        def writer(i):
+            for j in range(20):
+                with pool.write() as conn:
+                    conn.execute("INSERT INTO kv VALUES (?, ?)", (f"{i}:{j}", j))
+
+        threads = [threading.Thread(target=writer, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with pool.read() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM kv").fetchone()[0] == 80
+    finally:
+        pool.close()
+
+
+def test_failed_write_rolls_back(tmp_path):
+    pool = _pool(tmp_path)
+    try:
+        with pytest.raises(RuntimeError):
+            with pool.write() as conn:
+                conn.execute("INSERT INTO kv VALUES ('x', 1)")
+                raise RuntimeError("boom")
+        with pool.read() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM kv").fetchone()[0] == 0
+    finally:
+        pool.close()
+
+
+def test_in_memory_pool_shares_writer():
+    pool = SQLiteConnectionPool(":memory:")
+    try:
+        with pool.write() as conn:
+            conn.execute("CREATE TABLE kv (k TEXT)")
+            conn.execute("INSERT INTO kv VALUES ('a')")
+        with pool.read() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM kv").fetchone()[0] == 1
+    finally:
+        pool.close()
+
+
+def test_invalid_settings_rejected(tmp_path):
+    with pytest.raises(ValueError, match="synchronous"):
+        SQLiteConnectionPool(tmp_path / "bad.db", synchronous="sometimes")
+    with pytest.raises(ValueError, match="pool_size"):
+        SQLiteConnectionPool(tmp_path / "bad.db", pool_size=0)
@@ -0,0 +1,80 @@
+import asyncio
+import time
+
+from syntropiq.core.models import Agent, ExecutionResult, Task
+from syntropiq.execution.deterministic_executor import DeterministicExecutor
+from syntropiq.governance.loop import GovernanceLoop
+from syntropiq.persistence.state_manager import PersistentStateManager
+
+
+class SlowExecutor(DeterministicExecutor):
+    def execute(self, task: Task, agent: Agent) -> ExecutionResult:
+        time.sleep(0.02)
+        return super().execute(task, agent)
+
+
+def _agents():
+    return {
+        "a": Agent(id="a", trust_score=0.90, capabilities=["x"], status="active"),
+        "b": Agent(id="b", trust_score=0.80, capabilities=["x"], status="active"),
+    }
+
+
+def _tasks():
+    return [Task(id=f"t{i}", impact=0.8, urgency=0.5, risk=0.2 + i * 0.2) for i in range(3)]
+
+
+def test_stage_timings_and_hook(tmp_path):
+    state = PersistentStateManager(db_path=str(tmp_path / "timings.db"))
+    calls = []
+    loop = GovernanceLoop(state_manager=state, on_stage=lambda name, duration, ctx: calls.append((name, duration, dict(ctx))))
+    try:
+        result = loop.execute_cycle(_tasks(), _agents(), SlowExecutor(), run_id="TIME")
+        timings = result["statistics"]["stage_timings"]
+
+        expected = {"prioritize", "assign", "dispatch", "learning", "mutation", "reflection", "persistence", "telemetry", "commit", "total"}
+        assert expected <= set(timings)
+        assert timings["dispatch"] >= 0.06
+        assert timings["total"] >= sum(v for k, v in timings.items() if k != "total") - 1e-6
+        assert "profile" not in result["statistics"]
+
+        hooked = {name for name, _, _ in calls}
+        assert hooked == set(timings)
+        assert all(ctx == {"run_id": "TIME", "cycle_id": "TIME:1"} for _, _, ctx in calls)
+    finally:
+        state.close()
+
+
+def test_failing_hook_does_not_fail_cycle(tmp_path):
+    state = PersistentStateManager(db_path=str(tmp_path / "hook.db"))
+
+    def broken(name, duration, context):
+        raise RuntimeError("observer bug")
+
+    try:
+        result = GovernanceLoop(state_manager=state, on_stage=broken).execute_cycle(
+            _tasks(), _agents(), DeterministicExecutor(), run_id="HOOK"
+        )
+        assert result["statistics"]["tasks_executed"] == 3
+    finally:
+        state.close()
+
+
+def test_sampled_cycles_capture_profile(tmp_path):
+    state = PersistentStateManager(db_path=str(tmp_path / "profile.db"))
+    loop = GovernanceLoop(state_manager=state, profile_every=2)
+    try:
+        first = loop.execute_cycle(_tasks(), _agents(), DeterministicExecutor(), run_id="PROF")
+        second = loop.execute_cycle(_tasks(), _agents(), DeterministicExecutor(), run_id="PROF")
+        third = asyncio.run(loop.execute_cycle_async(_tasks(), _agents(), DeterministicExecutor(), run_id="PROF"))
+        fourth = asyncio.run(loop.execute_cycle_async(_tasks(), _agents(), DeterministicExecutor(), run_id="PROF"))
+
+        assert "profile" not in first["statistics"]
+        assert "profile" not in third["statistics"]
+        assert "stage_timings" in third["statistics"]
+        for sampled in (second, fourth):
+            profile = sampled["statistics"]["profile"]
+            assert any("_complete_cycle" in row["function"] for row in profile["cpu"])
+            assert profile["memory"]["peak_bytes"] > 0
+    finally:
+        state.close()
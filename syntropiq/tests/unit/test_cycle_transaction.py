@@ -0,0 +1,104 @@
+import threading
+
+from syntropiq.core.models import Agent, Task
+from syntropiq.execution.deterministic_executor import DeterministicExecutor
+from syntropiq.governance.loop import GovernanceLoop
+from syntropiq.persistence.state_manager import PersistentStateManager
+
+
+class CommitCounter:
+    """Counts COMMIT statements issued on the state manager's writer connection."""
+
+    def __init__(self, state: PersistentStateManager):
+        self.commits = 0
+        state.conn.set_trace_callback(self._trace)
+
+    def _trace(self, statement: str):
+        if statement.strip().upper() == "COMMIT":
+            self.commits += 1
+
+
+def _history_count(state: PersistentStateManager, agent_id: str) -> int:
+    row = state.conn.execute(
+        "SELECT COUNT(*) AS n FROM trust_history WHERE agent_id = ?", (agent_id,)
+    ).fetchone()
+    return row["n"]
+
+
+def test_cycle_transaction_flushes_once(tmp_path):
+    state = PersistentStateManager(db_path=str(tmp_path / "tx.db"))
+    counting = CommitCounter(state)
+    try:
+        with state.cycle_transaction():
+            state.update_trust_scores({"a": 0.8, "b": 0.7}, reason="seed")
+            state.update_trust_scores({"a": 0.82}, reason="success")
+            state.update_suppression_state("b", is_suppressed=True, redemption_cycle=2)
+            state.update_agent_status("b", "suppressed")
+            state.record_drift("a", 0.8, 0.82)
+            assert counting.commits == 0
+            assert state.get_trust_scores() == {}
+
+        assert counting.commits == 1
+        assert state.get_trust_scores() == {"a": 0.82, "b": 0.7}
+        assert state.get_suppression_state()["b"]["is_suppressed"] is True
+        history = state.get_trust_history("a")
+        assert sorted(round(h["delta"], 3) for h in history) == [0.02, 0.8]
+    finally:
+        state.close()
+
+
+def test_unchanged_rows_are_skipped(tmp_path):
+    state = PersistentStateManager(db_path=str(tmp_path / "skip.db"))
+    try:
+        state.update_trust_scores({"a": 0.8}, reason="seed")
+        state.update_suppression_state("a", is_suppressed=True, redemption_cycle=3)
+        since = state.get_suppression_state()["a"]["suppressed_since"]
+
+        state.update_trust_scores({"a": 0.8}, reason="noop")
+        state.update_suppression_state("a", is_suppressed=True, redemption_cycle=3)
+
+        assert _history_count(state, "a") == 1
+        updated_at = state.conn.execute(
+            "SELECT updated_at FROM trust_scores WHERE agent_id = 'a'"
+        ).fetchone()["updated_at"]
+        assert state.get_trust_history("a")[0]["timestamp"] == updated_at
+        assert state.get_suppression_state()["a"]["suppressed_since"] == since
+    finally:
+        state.close()
+
+
+def test_execute_cycle_commits_once_per_phase(tmp_path):
+    state = PersistentStateManager(db_path=str(tmp_path / "cycle.db"))
+    counting = CommitCounter(state)
+    agents = {
+        "a": Agent(id="a", trust_score=0.90, capabilities=["x"], status="active"),
+        "b": Agent(id="b", trust_score=0.80, capabilities=["x"], status="active"),
+    }
+    tasks = [Task(id=f"t{i}", impact=0.8, urgency=0.5, risk=0.2 + i * 0.2) for i in range(4)]
+    try:
+        result = GovernanceLoop(state_manager=state).execute_cycle(
+            tasks, agents, DeterministicExecutor(), run_id="TX"
+        )
+        assert counting.commits == 1
+        assert state.get_statistics()["total_executions"] == 4
+        assert state.get_trust_scores() == result["trust_updates"]
+    finally:
+        state.close()
+
+
+def test_other_threads_do_not_write_into_an_open_transaction(tmp_path):
+    state = PersistentStateManager(db_path=str(tmp_path / "threads.db"))
+    try:
+        with state.cycle_transaction():
+            state.update_trust_scores({"owner": 0.8}, reason="cycle")
+            other = threading.Thread(
+                target=state.update_trust_scores, args=({"other": 0.6},), kwargs={"reason": "api"}
+            )
+            other.start()
+            other.join()
+            # The other thread committed on its own; the cycle's write is still buffered.
+            assert state.get_trust_scores() == {"other": 0.6}
+
+        assert state.get_trust_scores() == {"owner": 0.8, "other": 0.6}
+    finally:
+        state.close()
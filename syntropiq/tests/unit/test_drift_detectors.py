@@ -0,0 +1,92 @@
+import pytest
+
+from syntropiq.core.models import Agent, Task
+from syntropiq.governance.drift_detectors import (
+    CUSUMDriftDetector,
+    DriftDetector,
+    EWMADriftDetector,
+    PageHinkleyDriftDetector,
+    create_drift_detector,
+)
+from syntropiq.governance.loop import GovernanceLoop
+from syntropiq.governance.trust_engine import SyntropiqTrustEngine
+from syntropiq.persistence.state_manager import PersistentStateManager
+
+DETECTORS = [EWMADriftDetector, CUSUMDriftDetector, PageHinkleyDriftDetector]
+
+
+def _feed(detector, series, drift_delta=0.1):
+    verdicts = []
+    for score in series:
+        verdict = detector.observe("a", score, drift_delta)
+        if verdict is not None:
+            verdicts.append(verdict)
+    return verdicts
+
+
+@pytest.mark.parametrize("detector_cls", DETECTORS)
+def test_slow_drift_flagged_then_cleared(detector_cls):
+    # -0.02 per cycle never trips the built-in |delta| > drift_delta check.
+    declining = [round(0.95 - 0.02 * i, 2) for i in range(8)]
+    detector = detector_cls()
+    assert _feed(detector, declining)[-1] is True
+
+    recovering = [round(declining[-1] + 0.03 * i, 2) for i in range(1, 10)]
+    assert _feed(detector, recovering)[-1] is False
+
+    detector.reset("a")
+    assert detector.observe("a", 0.5, 0.1) is None
+
+
+@pytest.mark.parametrize("detector_cls", DETECTORS)
+def test_alternating_noise_not_flagged(detector_cls):
+    noisy = [0.9, 0.85] * 10
+    assert True not in _feed(detector_cls(), noisy)
+
+
+def test_engine_uses_detector_for_drift_warnings():
+    engine = SyntropiqTrustEngine(trust_threshold=0.5, drift_detector=create_drift_detector("cusum"))
+    agents = {
+        "steady": Agent(id="steady", trust_score=0.75, capabilities=["x"], status="active"),
+        "sliding": Agent(id="sliding", trust_score=1.0, capabilities=["x"], status="active"),
+    }
+    task = [Task(id="t", impact=0.5, urgency=0.5, risk=0.5)]
+    for _ in range(9):
+        assignment = engine.assign_agents(task, agents)
+        agents["sliding"].trust_score = round(agents["sliding"].trust_score - 0.02, 2)
+
+    assert engine.drift_warnings["sliding"] is True
+    assert assignment[0].agent_id == "steady"
+
+
+@pytest.mark.parametrize("name", ["ewma", "cusum", "page_hinkley"])
+def test_array_engine_matches_with_detector(name):
+    pytest.importorskip("numpy")
+    from syntropiq.governance.array_trust_engine import ArrayTrustEngine
+
+    reference = SyntropiqTrustEngine(trust_threshold=0.5, drift_detector=create_drift_detector(name))
+    vectorized = ArrayTrustEngine(trust_threshold=0.5, drift_detector=create_drift_detector(name))
+    fleets = [
+        {f"a{i}": Agent(id=f"a{i}", trust_score=0.9, capabilities=["x"], status="active") for i in range(6)}
+        for _ in range(2)
+    ]
+    task = [Task(id="t", impact=0.5, urgency=0.5, risk=0.5)]
+    for cycle in range(12):
+        picks = [engine.assign_agents(task, fleet)[0].agent_id for engine, fleet in zip((reference, vectorized), fleets)]
+        assert picks[0] == picks[1]
+        assert vectorized.drift_warnings == reference.drift_warnings
+        for fleet in fleets:
+            for i, agent in enumerate(fleet.values()):
+                agent.trust_score = round(max(0.55, agent.trust_score - 0.01 * (i % 3) + (0.02 if cycle % 4 == 3 else 0.0)), 2)
+
+
+def test_unknown_detector_rejected(tmp_path):
+    assert create_drift_detector("last_delta") is None
+    with pytest.raises(TypeError):
+        DriftDetector()
+    state = PersistentStateManager(db_path=str(tmp_path / "drift.db"))
+    try:
+        with pytest.raises(ValueError, match="drift_detector"):
+            GovernanceLoop(state_manager=state, drift_detector="spc")
+    finally:
+        state.close()
@@ -0,0 +1,116 @@
+import asyncio
+import time
+
+from syntropiq.core.context import get_request_id, request_id_var
+from syntropiq.core.models import Agent, ExecutionResult, Task
+from syntropiq.execution.deterministic_executor import DeterministicExecutor
+from syntropiq.governance.loop import GovernanceLoop
+from syntropiq.persistence.state_manager import PersistentStateManager
+
+
+class BlockingExecutor:
+    """Sync-only executor (no aexecute) that blocks its thread."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.inner = DeterministicExecutor()
+
+    def execute(self, task: Task, agent: Agent) -> ExecutionResult:
+        time.sleep(self.delay)
+        return self.inner.execute(task, agent)
+
+
+class NativeAsyncExecutor(DeterministicExecutor):
+    def __init__(self):
+        super().__init__()
+        self.request_ids = []
+
+    def execute(self, task: Task, agent: Agent) -> ExecutionResult:  # pragma: no cover
+        raise AssertionError("sync execute must not be used when aexecute exists")
+
+    async def aexecute(self, task: Task, agent: Agent) -> ExecutionResult:
+        await asyncio.sleep(0.01)
+        self.request_ids.append(get_request_id())
+        return DeterministicExecutor.execute(self, task, agent)
+
+
+def _agents():
+    return {
+        "a": Agent(id="a", trust_score=0.90, capabilities=["x"], status="active"),
+        "b": Agent(id="b", trust_score=0.80, capabilities=["x"], status="active"),
+    }
+
+
+def _tasks():
+    return [Task(id=f"t{i}", impact=0.8, urgency=0.5, risk=0.2 + i * 0.2) for i in range(4)]
+
+
+def test_execute_cycle_async_matches_sync(tmp_path):
+    sync_state = PersistentStateManager(db_path=str(tmp_path / "sync.db"))
+    async_state = PersistentStateManager(db_path=str(tmp_path / "async.db"))
+    try:
+        expected = GovernanceLoop(state_manager=sync_state).execute_cycle(
+            _tasks(), _agents(), DeterministicExecutor(), run_id="ASYNC"
+        )
+        actual = asyncio.run(
+            GovernanceLoop(state_manager=async_state, max_concurrency=4).execute_cycle_async(
+                _tasks(), _agents(), DeterministicExecutor(), run_id="ASYNC"
+            )
+        )
+    finally:
+        sync_state.close()
+        async_state.close()
+
+    assert actual["cycle_id"] == expected["cycle_id"]
+    assert [(r.task_id, r.agent_id, r.success) for r in actual["results"]] == [
+        (r.task_id, r.agent_id, r.success) for r in expected["results"]
+    ]
+    assert actual["trust_updates"] == expected["trust_updates"]
+    assert actual["mutation"] == expected["mutation"]
+
+
+def test_execute_cycle_async_prefers_aexecute_and_keeps_request_id(tmp_path):
+    state = PersistentStateManager(db_path=str(tmp_path / "native.db"))
+    executor = NativeAsyncExecutor()
+
+    async def run():
+        request_id_var.set("req-async")
+        loop = GovernanceLoop(state_manager=state, max_concurrency=2)
+        return await loop.execute_cycle_async(_tasks(), _agents(), executor, run_id="NATIVE")
+
+    try:
+        result = asyncio.run(run())
+    finally:
+        state.close()
+
+    assert [r.task_id for r in result["results"]] == ["t3", "t2", "t1", "t0"]
+    assert executor.request_ids == ["req-async"] * 4
+
+
+def test_execute_cycle_async_does_not_block_event_loop(tmp_path):
+    state = PersistentStateManager(db_path=str(tmp_path / "blocking.db"))
+
+    async def run():
+        ticks = 0
+        done = asyncio.Event()
+
+        async def ticker():
+            nonlocal ticks
+            while not done.is_set():
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticker_task = asyncio.create_task(ticker())
+        loop = GovernanceLoop(state_manager=state)
+        result = await loop.execute_cycle_async(_tasks(), _agents(), BlockingExecutor(0.05), run_id="BLOCK")
+        done.set()
+        await ticker_task
+        return result, ticks
+
+    try:
+        result, ticks = asyncio.run(run())
+    finally:
+        state.close()
+
+    assert result["statistics"]["tasks_executed"] == 4
+    assert ticks > 10
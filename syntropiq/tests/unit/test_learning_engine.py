@@ -0,0 +1,51 @@
+import random
+
+from syntropiq.core.models import Agent, ExecutionResult, Task
+from syntropiq.execution.deterministic_executor import DeterministicExecutor
+from syntropiq.governance.learning_engine import update_trust_scores, update_trust_scores_batch
+from syntropiq.governance.loop import GovernanceLoop
+from syntropiq.persistence.state_manager import PersistentStateManager
+
+
+def _sequential(results, agents, reward, penalty):
+    scores = {}
+    for result in results:
+        if result.agent_id in agents:
+            current = scores.get(result.agent_id, agents[result.agent_id].trust_score)
+            if result.success:
+                scores[result.agent_id] = round(min(1.0, current + reward), 3)
+            else:
+                scores[result.agent_id] = round(max(0.0, current - penalty), 3)
+    return scores
+
+
+def test_batch_matches_sequential_recurrence():
+    rng = random.Random(4)
+    for _ in range(200):
+        size = rng.randint(1, 20)
+        agents = {
+            f"a{i}": Agent(id=f"a{i}", trust_score=rng.choice([rng.random(), 0.0, 1.0, 0.985, 0.03]), capabilities=[], status="active")
+            for i in range(size)
+        }
+        reward, penalty = rng.choice([(0.02, 0.05), (0.0125, 0.05), (0.03, 0.1)])
+        results = [
+            ExecutionResult(task_id="t", agent_id=f"a{rng.randrange(size + 2)}", success=rng.random() < 0.7, latency=0.0)
+            for _ in range(rng.randint(1, 300))
+        ]
+        expected = _sequential(results, agents, reward, penalty)
+        assert update_trust_scores_batch(results, agents, reward, penalty) == expected
+        assert update_trust_scores(results, agents, reward, penalty) == expected
+
+
+def test_loop_uses_configured_rates(tmp_path):
+    state = PersistentStateManager(db_path=str(tmp_path / "rates.db"))
+    try:
+        loop = GovernanceLoop(state_manager=state, asymmetric_reward=0.01, asymmetric_penalty=0.1)
+        agents = {"a": Agent(id="a", trust_score=0.9, capabilities=["x"], status="active")}
+        result = loop.execute_cycle(
+            [Task(id="t", impact=0.5, urgency=0.5, risk=0.1)], agents, DeterministicExecutor(), run_id="RATES"
+        )
+        success = result["results"][0].success
+        assert result["trust_updates"]["a"] == (0.91 if success else 0.8)
+    finally:
+        state.close()
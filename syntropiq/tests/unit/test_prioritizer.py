@@ -0,0 +1,51 @@
+import random
+
+import pytest
+
+from syntropiq.core.models import Task
+from syntropiq.governance import prioritizer as prioritizer_module
+from syntropiq.governance.prioritizer import OptimusPrioritizer
+
+
+def _tasks(n, seed=7):
+    rng = random.Random(seed)
+    # Coarse values so many tasks tie on score.
+    grid = [0.0, 0.25, 0.5, 0.75, 1.0]
+    return [
+        Task(id=f"t{i}", impact=rng.choice(grid), urgency=rng.choice(grid), risk=rng.choice(grid))
+        for i in range(n)
+    ]
+
+
+def _full_sort(prioritizer, tasks):
+    return [t.id for t in sorted(tasks, key=prioritizer.score, reverse=True)]
+
+
+@pytest.mark.parametrize("top_k", [None, 0, 1, 17, 500])
+def test_top_k_matches_full_sort_prefix(top_k):
+    prioritizer = OptimusPrioritizer()
+    tasks = _tasks(300)
+    expected = _full_sort(prioritizer, tasks)[: top_k]
+
+    result = prioritizer.optimize(tasks, top_k=top_k)
+
+    assert [t.id for t in result["sorted_tasks"]] == expected
+    assert result["total_tasks"] == len(expected)
+
+
+@pytest.mark.parametrize("top_k", [None, 0, 5, 2999, 5000])
+def test_vectorized_path_matches_python_order(monkeypatch, top_k):
+    pytest.importorskip("numpy")
+    prioritizer = OptimusPrioritizer()
+    tasks = _tasks(3000, seed=11)
+    expected = _full_sort(prioritizer, tasks)[: top_k]
+
+    monkeypatch.setattr(prioritizer_module, "VECTOR_MIN_TASKS", 1)
+    result = prioritizer.optimize(tasks, top_k=top_k)
+
+    assert [t.id for t in result["sorted_tasks"]] == expected
+
+
+def test_negative_top_k_rejected():
+    with pytest.raises(ValueError):
+        OptimusPrioritizer().optimize(_tasks(3), top_k=-1)
@@ -1,5 +1,6 @@
 import pytest
 
+from syntropiq.reflect.constraint_kernel import default_constraints
 from syntropiq.reflect.engine import run_reflect
 
 
@@ -56,3 +57,72 @@ def test_reflect_classification_states():
 
     assert degraded.classification in {"degrading", "crisis"}
     assert degraded.Fs <= stable.Fs
+
+
+def test_consensus_matches_per_profile_reflect_with_one_projection(monkeypatch):
+    import syntropiq.reflect.engine as engine
+    from syntropiq.reflect.consensus import PerspectiveProfile, default_perspectives, run_consensus_reflect
+
+    kwargs = _base_kwargs()
+    kwargs["trust_by_agent"] = {f"agent_{i}": 0.5 + (i % 7) * 0.05 for i in range(40)}
+    kwargs["suppression_active"] = True
+    kwargs["latest_replay_score"] = 0.9
+    profiles = default_perspectives() + [
+        PerspectiveProfile(name=f"custom_{i}", weights_decay=0.5 + i * 0.04,
+                           constraint_weight_overrides={"drift_limit": 0.05 * i}, theta_override=0.01 * i)
+        for i in range(12)
+    ]
+
+    calls = []
+    project_horizon = engine.project_horizon
+    monkeypatch.setattr(engine, "project_horizon", lambda **kw: calls.append(1) or project_horizon(**kw))
+
+    consensus_kwargs = {k: v for k, v in kwargs.items() if k not in {"weights_decay", "mode"}}
+    consensus = run_consensus_reflect(**consensus_kwargs, profiles=profiles)
+    assert len(calls) == 1
+
+    for profile, item in zip(profiles, consensus["profiles"]):
+        specs = []
+        for spec in default_constraints():
+            spec.weight = float(profile.constraint_weight_overrides.get(spec.name, spec.weight))
+            specs.append(spec)
+        single = run_reflect(**{
+            **kwargs,
+            "weights_decay": profile.weights_decay,
+            "theta": profile.theta_override if profile.theta_override is not None else kwargs["theta"],
+            "constraint_specs": specs,
+        })
+        assert item["Fs"] == single.Fs
+        assert item["classification"] == single.classification
+
+
+@pytest.mark.parametrize("expected_delta", [0.0, 0.07, -0.09, 0.3, -0.4])
+@pytest.mark.parametrize("suppression_active", [False, True])
+def test_closed_form_horizon_averages_match_projections(expected_delta, suppression_active):
+    from syntropiq.reflect.foresight import project_horizon, project_horizon_averages
+
+    trust = {f"agent_{i}": v for i, v in enumerate([0.0, 0.03, 0.2, 0.5, 0.5, 0.81, 0.97, 1.0, 1.2, -0.1])}
+    projections = project_horizon(trust, 8, expected_delta, suppression_active)
+    averages = project_horizon_averages(trust, 8, expected_delta, suppression_active)
+
+    assert averages == pytest.approx([sum(p.values()) / len(p) for p in projections], abs=1e-12)
+    assert project_horizon_averages({}, 3, expected_delta, suppression_active) == [0.0, 0.0, 0.0]
+
+
+def test_large_fleet_reflect_skips_per_step_dicts(monkeypatch):
+    import syntropiq.reflect.engine as engine
+
+    kwargs = _base_kwargs()
+    kwargs["trust_by_agent"] = {f"agent_{i}": (i * 7919 % 1000) / 1000 for i in range(engine.FAST_FORESIGHT_MIN_AGENTS)}
+    kwargs["recent_cycles"] = [{"trust_delta_total": -40.0, "successes": 3, "failures": 1}]
+    kwargs["suppression_active"] = True
+    fast = run_reflect(**kwargs)
+
+    monkeypatch.setattr(engine, "FAST_FORESIGHT_MIN_AGENTS", 10**9)
+    exact = run_reflect(**kwargs)
+
+    assert fast.Fs == pytest.approx(exact.Fs, abs=1e-12)
+    for fast_step, exact_step in zip(fast.foresight, exact.foresight):
+        assert fast_step.A == pytest.approx(exact_step.A, abs=1e-12)
+        assert fast_step.D == pytest.approx(exact_step.D, abs=1e-12)
+        assert fast_step.notes["avg_trust"] == pytest.approx(exact_step.notes["avg_trust"], abs=1e-12)
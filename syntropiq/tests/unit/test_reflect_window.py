@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import threading
+
+from syntropiq.api.state_manager import PersistentStateManager
+from syntropiq.api.telemetry import _RUN_LOCK_STRIPES, GovernanceTelemetryHub
+from syntropiq.core.models import Agent, Task
+from syntropiq.execution.deterministic_executor import DeterministicExecutor
+from syntropiq.governance import loop as loop_module
+from syntropiq.governance.loop import GovernanceLoop
+from syntropiq.persistence.state_manager import PersistentStateManager as GovernanceStateManager
+
+
+def _event(run_id: str, n: int):
+    return {
+        "run_id": run_id,
+        "cycle_id": f"{run_id}:{n}",
+        "timestamp": f"2026-03-01T10:{n // 60:02d}:{n % 60:02d}Z",
+        "type": "trust_update",
+        "agent_id": "agent_a",
+        "trust_before": 0.7,
+        "trust_after": 0.71,
+        "authority_before": 0.3,
+        "authority_after": 0.31,
+        "metadata": {"n": n},
+    }
+
+
+def _cycle(run_id: str, n: int):
+    return {
+        "run_id": run_id,
+        "cycle_id": f"{run_id}:{n}",
+        "timestamp": f"2026-03-01T10:{n // 60:02d}:{n % 60:02d}Z",
+        "total_agents": 1,
+        "successes": 1,
+        "failures": 0,
+        "trust_delta_total": 0.01,
+        "authority_redistribution": {},
+        "events": [],
+    }
+
+
+class LoadCounter:
+    def __init__(self, manager: PersistentStateManager):
+        self.loads = 0
+        for name in ("load_cycles_by_run_id", "load_events_by_run_id"):
+            original = getattr(manager, name)
+
+            def counted(*args, _original=original, **kwargs):
+                self.loads += 1
+                return _original(*args, **kwargs)
+
+            setattr(manager, name, counted)
+
+
+def test_latest_run_loads_keep_newest_rows(monkeypatch, tmp_path):
+    monkeypatch.setenv("AUDIT_CHAIN_MODE", "log")
+    manager = PersistentStateManager(db_path=tmp_path / "telemetry.db")
+    manager.save_events([_event("RUN_L", n) for n in range(10)])
+
+    oldest = manager.load_events_by_run_id("RUN_L", limit=3)
+    newest = manager.load_events_by_run_id("RUN_L", limit=3, latest=True)
+    assert [e["metadata"]["n"] for e in oldest] == [0, 1, 2]
+    assert [e["metadata"]["n"] for e in newest] == [7, 8, 9]
+    manager.close()
+
+
+def test_run_window_seeds_once_then_tracks_publishes(monkeypatch, tmp_path):
+    monkeypatch.setenv("AUDIT_CHAIN_MODE", "log")
+    manager = PersistentStateManager(db_path=tmp_path / "telemetry.db")
+    hub = GovernanceTelemetryHub(state_manager=manager, window_cycles=5, window_events=8)
+    for n in range(6):
+        hub.publish_event(_event("RUN_W", n))
+        hub.record_cycle(_cycle("RUN_W", n))
+
+    counter = LoadCounter(manager)
+    cycles, events = hub.run_window("RUN_W", cycle_limit=5, event_limit=8)
+    assert counter.loads == 2
+    assert [c["cycle_id"] for c in cycles] == [f"RUN_W:{n}" for n in range(1, 6)]
+    assert len(events) == 6
+
+    for n in range(6, 12):
+        hub.publish_events([_event("RUN_W", n)])
+        hub.record_cycle(_cycle("RUN_W", n))
+        cycles, events = hub.run_window("RUN_W", cycle_limit=5, event_limit=8)
+    assert counter.loads == 2
+
+    assert hub.flush(timeout=5) is True
+    assert cycles == manager.load_cycles_by_run_id("RUN_W", limit=5, latest=True)
+    assert events == manager.load_events_by_run_id("RUN_W", limit=8, latest=True)
+    hub.close()
+    manager.close()
+
+
+def test_latest_records_cached_and_invalidated_by_other_writers(monkeypatch, tmp_path):
+    monkeypatch.setenv("AUDIT_CHAIN_MODE", "log")
+    db_path = tmp_path / "telemetry.db"
+    manager = PersistentStateManager(db_path=db_path)
+    other = PersistentStateManager(db_path=db_path)
+
+    assert manager.latest_replay_validation("RUN_C") is None
+    manager.save_replay_validation({"run_id": "RUN_C", "timestamp": "2026-03-01T10:00:01Z", "r_score": 0.9})
+    assert manager.latest_replay_validation("RUN_C") == manager.load_replay_validations("RUN_C", limit=1)[0]
+
+    manager.save_replay_validation({"run_id": "RUN_C", "timestamp": "2026-03-01T09:00:00Z", "r_score": 0.1})
+    assert manager.latest_replay_validation("RUN_C")["r_score"] == 0.9
+
+    other.save_replay_validation({"run_id": "RUN_C", "timestamp": "2026-03-01T10:00:05Z", "r_score": 0.5})
+    assert manager.latest_replay_validation("RUN_C")["r_score"] == 0.5
+
+    manager.save_bayes_posterior({"run_id": "RUN_C", "timestamp": "2026-03-01T10:00:01Z", "posterior_mean": 0.7})
+    other.save_bayes_posterior({"run_id": "RUN_C", "timestamp": "2026-03-01T10:00:02Z", "posterior_mean": 0.8})
+    assert manager.latest_bayes_posterior("RUN_C")["mean"] == 0.8
+    assert manager.latest_bayes_posterior("RUN_C") == manager.load_bayes_posteriors("RUN_C", limit=1)[0]
+    manager.close()
+    other.close()
+
+
+def test_integrated_reflect_reads_window(monkeypatch, tmp_path):
+    monkeypatch.setenv("AUDIT_CHAIN_MODE", "log")
+    monkeypatch.setenv("REFLECT_MODE", "integrate")
+    manager = PersistentStateManager(db_path=tmp_path / "telemetry.db")
+    hub = GovernanceTelemetryHub(state_manager=manager)
+    loop = GovernanceLoop(state_manager=GovernanceStateManager(db_path=str(tmp_path / "gov.db")), telemetry=hub)
+    agents = {
+        "a": Agent(id="a", trust_score=0.90, capabilities=["x"], status="active"),
+        "b": Agent(id="b", trust_score=0.80, capabilities=["x"], status="active"),
+    }
+
+    loop.execute_cycle([Task(id="t0", impact=0.8, urgency=0.5, risk=0.2)], agents, DeterministicExecutor(), run_id="RUN_I")
+    counter = LoadCounter(manager)
+    for i in range(1, 4):
+        tasks = [Task(id=f"t{i}", impact=0.8, urgency=0.5, risk=0.2)]
+        loop.execute_cycle(tasks, agents, DeterministicExecutor(), run_id="RUN_I")
+
+    assert counter.loads == 0
+    assert len(manager.load_reflect_decisions("RUN_I")) == 4
+    hub.close()
+    manager.close()
+
+
+def test_integrated_reflect_sees_newest_history(monkeypatch, tmp_path):
+    monkeypatch.setenv("AUDIT_CHAIN_MODE", "log")
+    monkeypatch.setenv("REFLECT_MODE", "integrate")
+    manager = PersistentStateManager(db_path=tmp_path / "telemetry.db")
+    hub = GovernanceTelemetryHub(state_manager=manager)
+    for n in range(60):
+        hub.record_cycle(_cycle("RUN_N", n))
+    assert hub.flush(timeout=5) is True
+
+    seen = {}
+    real_run_reflect = loop_module.run_reflect
+
+    def capture(**kwargs):
+        seen["cycles"] = [c["cycle_id"] for c in kwargs["recent_cycles"]]
+        return real_run_reflect(**kwargs)
+
+    monkeypatch.setattr(loop_module, "run_reflect", capture)
+    loop = GovernanceLoop(state_manager=GovernanceStateManager(db_path=str(tmp_path / "gov.db")), telemetry=hub)
+    agents = {"a": Agent(id="a", trust_score=0.90, capabilities=["x"], status="active")}
+    loop.execute_cycle([Task(id="t", impact=0.8, urgency=0.5, risk=0.2)], agents, DeterministicExecutor(), run_id="RUN_N")
+
+    # 61 cycles exist; reflect gets the newest 50, oldest first.
+    assert len(seen["cycles"]) == 50
+    assert seen["cycles"][0] == "RUN_N:11"
+    assert seen["cycles"][-2] == "RUN_N:59"
+    hub.close()
+    manager.close()
+
+
+def test_cold_seed_does_not_block_other_runs(monkeypatch, tmp_path):
+    monkeypatch.setenv("AUDIT_CHAIN_MODE", "log")
+    manager = PersistentStateManager(db_path=tmp_path / "telemetry.db")
+    hub = GovernanceTelemetryHub(state_manager=manager)
+    hub.record_cycle(_cycle("RUN_S", 0))
+
+    loading, release = threading.Event(), threading.Event()
+    original = manager.load_cycles_by_run_id
+
+    def slow_load(run_id, **kwargs):
+        loading.set()
+        release.wait(5)
+        return original(run_id, **kwargs)
+
+    monkeypatch.setattr(manager, "load_cycles_by_run_id", slow_load)
+    seeder = threading.Thread(target=hub.run_window, args=("RUN_S",))
+    seeder.start()
+    assert loading.wait(5)
+
+    # A run on a different lock stripe publishes while RUN_S is mid-seed.
+    other = next(f"RUN_O{i}" for i in range(100) if hash(f"RUN_O{i}") % _RUN_LOCK_STRIPES != hash("RUN_S") % _RUN_LOCK_STRIPES)
+    published = threading.Event()
+    publisher = threading.Thread(target=lambda: (hub.record_cycle(_cycle(other, 0)), published.set()))
+    publisher.start()
+    assert published.wait(2)
+
+    release.set()
+    seeder.join(5)
+    publisher.join(5)
+    assert [c["cycle_id"] for c in hub.run_window("RUN_S")[0]] == ["RUN_S:0"]
+    hub.close()
+    manager.close()
@@ -0,0 +1,111 @@
+import pytest
+
+from syntropiq.governance.loop import GovernanceLoop
+from syntropiq.optimize.config import get_current_lambda, set_current_lambda
+from syntropiq.optimize.lambda_adaptation import compute_adaptive_lambda
+from syntropiq.optimize.schema import LambdaVector
+from syntropiq.persistence.run_state import RunStateStore, get_run_state_store, set_run_state_store
+from syntropiq.persistence.state_manager import PersistentStateManager
+
+
+@pytest.fixture
+def shared_store(tmp_path):
+    store = RunStateStore(db_path=str(tmp_path / "run_state.db"))
+    previous = set_run_state_store(store)
+    yield store
+    set_run_state_store(previous)
+    store.close()
+
+
+def test_lru_bound_and_write_through_rehydration(tmp_path):
+    db_path = str(tmp_path / "lru.db")
+    store = RunStateStore(db_path=db_path, max_entries=2)
+    for i in range(5):
+        store.put("ns", f"RUN_{i}", {"n": i})
+    assert len(store) == 2
+
+    # Evicted entries come back from SQLite on access.
+    assert store.get("ns", "RUN_0") == {"n": 0}
+    assert len(store) == 2
+    store.close()
+
+    restarted = RunStateStore(db_path=db_path, max_entries=2)
+    try:
+        assert restarted.get("ns", "RUN_3") == {"n": 3}
+        assert restarted.get("other", "RUN_3") is None
+        restarted.clear("ns")
+        assert restarted.get("ns", "RUN_3") is None
+    finally:
+        restarted.close()
+
+
+def test_memory_only_store_ttl_and_copies():
+    now = [0.0]
+    store = RunStateStore(max_entries=10, ttl_seconds=5, clock=lambda: now[0])
+    store.put("ns", "A", {"history": [1]})
+    store.get("ns", "A")["history"].append(2)
+    assert store.get("ns", "A") == {"history": [1]}
+
+    now[0] = 4.0
+    store.put("ns", "B", {})
+    now[0] = 8.5  # A idle since 0.0 -> expired; B idle since 4.0 -> kept
+    assert store.get("ns", "A") is None
+    assert store.get("ns", "B") == {}
+    now[0] = 14.0
+    assert store.get("ns", "B") is None
+    assert len(store) == 0
+
+    with pytest.raises(ValueError):
+        RunStateStore(max_entries=0)
+
+
+def test_applied_lambda_and_adaptation_state_survive_restart(shared_store, tmp_path):
+    set_current_lambda(LambdaVector(0.4, 0.3, 0.2, 0.1), run_id="FRAUD_000123")
+    base = LambdaVector(0.25, 0.25, 0.25, 0.25)
+    signals = {"run_id": "FRAUD_000123", "Fs": 0.1, "fs_threshold": 0.5, "suppression_active": True}
+    for _ in range(2):
+        compute_adaptive_lambda(base, signals, bounds={})
+
+    restarted = RunStateStore(db_path=str(tmp_path / "run_state.db"))
+    set_run_state_store(restarted)
+    try:
+        assert get_run_state_store().get("lambda_adaptation", "FRAUD_000123")["crisis_cycles"] == 2
+        assert get_current_lambda("FRAUD_000123").as_dict() == pytest.approx(
+            {"l_cost": 0.4, "l_time": 0.3, "l_risk": 0.2, "l_trust": 0.1}
+        )
+        assert get_current_lambda("UNSEEN").as_dict() == pytest.approx(
+            {"l_cost": 0.25, "l_time": 0.25, "l_risk": 0.25, "l_trust": 0.25}
+        )
+    finally:
+        set_run_state_store(shared_store)
+        restarted.close()
+
+
+def test_healing_state_survives_loop_restart(tmp_path):
+    state = PersistentStateManager(db_path=str(tmp_path / "gov.db"))
+    store_path = str(tmp_path / "healing.db")
+    decision = {"Fs": 0.2, "classification": "crisis"}
+    try:
+        for _ in range(2):
+            store = RunStateStore(db_path=store_path)
+            loop = GovernanceLoop(state_manager=state, run_state=store)
+            loop._maybe_apply_healing(
+                run_id="INFRA_042:7",
+                cycle_id="INFRA_042:7",
+                timestamp="t",
+                agents={},
+                trust_after={},
+                reflect_decision=decision,
+                telemetry_state=None,
+            )
+            store.close()
+
+        store = RunStateStore(db_path=store_path)
+        assert store.get("healing", "INFRA_042") == {
+            "crisis_cycles": 2,
+            "fs_history": [0.2, 0.2],
+            "stable_cycles": 0,
+        }
+        store.close()
+    finally:
+        state.close()
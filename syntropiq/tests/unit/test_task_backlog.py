@@ -0,0 +1,174 @@
+import pytest
+
+from syntropiq.core.exceptions import CircuitBreakerTriggered
+from syntropiq.core.models import Agent, Task
+from syntropiq.execution.deterministic_executor import DeterministicExecutor
+from syntropiq.governance.backlog import TaskBacklog
+from syntropiq.governance.loop import GovernanceLoop
+from syntropiq.persistence.state_manager import PersistentStateManager
+
+
+def _task(task_id, impact, risk=0.1):
+    return Task(id=task_id, impact=impact, urgency=impact, risk=risk)
+
+
+def test_schedule_orders_by_score_and_ages_waiting_tasks():
+    backlog = TaskBacklog(aging_rate=0.2)
+    drained = backlog.schedule("R", [_task("low", 0.1), _task("high", 0.9), _task("tie", 0.9)], limit=1)
+    assert [t.id for t in drained] == ["high"]
+
+    # "low" has waited one cycle: 0.1 * 0.7 + 0.03 + 0.2 beats a fresh 0.3-impact task.
+    drained = backlog.schedule("R", [_task("fresh", 0.3)], limit=2)
+    assert [t.id for t in drained] == ["tie", "low"]
+    assert backlog.pending("R") == 1
+    assert backlog.pending("OTHER") == 0
+
+
+def test_deferred_tasks_keep_their_age():
+    backlog = TaskBacklog(aging_rate=0.0)
+    first = backlog.schedule("R", [_task("a", 0.5), _task("b", 0.5)])
+    backlog.defer("R", first)
+
+    drained = backlog.schedule("R", [_task("c", 0.5)])
+    assert [t.id for t in drained] == ["a", "b", "c"]
+
+    with pytest.raises(ValueError):
+        backlog.schedule("R", [], limit=-1)
+
+
+def test_backlog_survives_restart(tmp_path):
+    db_path = str(tmp_path / "backlog.db")
+    state = PersistentStateManager(db_path=db_path)
+    backlog = TaskBacklog(state, aging_rate=0.1)
+    with state.cycle_transaction():
+        drained = backlog.schedule("R", [_task(f"t{i}", i / 10) for i in range(5)], limit=2)
+    with state.cycle_transaction():
+        backlog.complete("R", [t.id for t in drained])
+    with state.cycle_transaction():
+        backlog.defer("R", backlog.schedule("R", [], limit=1))
+    state.close()
+
+    state = PersistentStateManager(db_path=db_path)
+    try:
+        restored = TaskBacklog(state, aging_rate=0.1)
+        assert restored.pending("R") == 3
+        with state.cycle_transaction():
+            drained = restored.schedule("R", [])
+        assert [t.id for t in drained] == ["t2", "t1", "t0"]
+        # In flight until the cycle completes: still persisted.
+        assert len(state.load_backlog("R")[2]) == 3
+        with state.cycle_transaction():
+            restored.complete("R", [t.id for t in drained])
+        assert state.load_backlog("R") == (0, 0, [])
+        assert restored.pending("R") == 0
+        restored.schedule("OTHER", [])
+        assert "R" not in restored._runs
+    finally:
+        state.close()
+
+
+def test_drained_tasks_survive_a_crash_before_completion(tmp_path):
+    db_path = str(tmp_path / "crash.db")
+    state = PersistentStateManager(db_path=db_path)
+    backlog = TaskBacklog(state)
+    with state.cycle_transaction():
+        backlog.schedule("R", [_task("a", 0.9), _task("b", 0.1)], limit=1)
+    with state.cycle_transaction():
+        assert [t.id for t in backlog.schedule("R", [])] == ["b"]
+    with state.cycle_transaction():
+        assert [t.id for t in backlog.schedule("R", [_task("c", 0.5)])] == ["c"]
+    state.close()  # crash: no cycle completed, including "c" drained on arrival
+
+    state = PersistentStateManager(db_path=db_path)
+    try:
+        assert [t.id for t in TaskBacklog(state).schedule("R", [])] == ["a", "c", "b"]
+    finally:
+        state.close()
+
+
+def test_empty_run_queues_are_not_retained():
+    backlog = TaskBacklog()
+    for i in range(100):
+        drained = backlog.schedule(f"RUN_{i}", [_task("t", 0.5)])
+        backlog.complete(f"RUN_{i}", [t.id for t in drained])
+        assert backlog.pending(f"RUN_{i}") == 0
+    assert list(backlog._runs) == ["RUN_99"]  # dropped by the next schedule()
+
+    drained = backlog.schedule("R", [_task("a", 0.5), _task("b", 0.4)])
+    backlog.release("R", ["a"])
+    assert backlog.pending("R") == 1
+    assert [t.id for t in backlog.schedule("R", [_task("b", 0.4)])] == ["a"]
+
+
+def _loop(state, **kwargs):
+    return GovernanceLoop(state_manager=state, backlog=TaskBacklog(state), **kwargs)
+
+
+def test_capacity_cycles_drain_backlog(tmp_path):
+    state = PersistentStateManager(db_path=str(tmp_path / "loop_backlog.db"))
+    try:
+        loop = _loop(state, routing_mode="capacity", agent_capacity=1)
+        agents = {"a": Agent(id="a", trust_score=0.9, capabilities=[], status="active")}
+        tasks = [_task("t1", 0.9), _task("t2", 0.5), _task("t3", 0.1)]
+
+        result = loop.execute_cycle(tasks, agents, DeterministicExecutor(), run_id="BURST")
+        assert [r.task_id for r in result["results"]] == ["t1"]
+        assert result["statistics"]["backlog_size"] == 2
+
+        result = loop.execute_cycle([], agents, DeterministicExecutor(), run_id="BURST")
+        assert [r.task_id for r in result["results"]] == ["t2"]
+        assert result["statistics"]["backlog_size"] == 1
+
+        class FailingExecutor:
+            def execute(self, task, agent):
+                raise RuntimeError("executor down")
+
+        with pytest.raises(RuntimeError):
+            loop.execute_cycle([], agents, FailingExecutor(), run_id="BURST")
+        assert loop.backlog.pending("BURST") == 1
+
+        result = loop.execute_cycle([], agents, DeterministicExecutor(), run_id="BURST")
+        assert [r.task_id for r in result["results"]] == ["t3"]
+        assert result["statistics"]["backlog_size"] == 0
+        assert state.load_backlog("BURST") == (0, 0, [])
+    finally:
+        state.close()
+
+
+def test_risk_and_capability_refusals_wait_instead_of_failing(tmp_path):
+    state = PersistentStateManager(db_path=str(tmp_path / "breaker.db"))
+    try:
+        untrusted = {"a": Agent(id="a", trust_score=0.2, capabilities=[], status="active")}
+        with pytest.raises(CircuitBreakerTriggered):
+            GovernanceLoop(state_manager=state).execute_cycle(
+                [_task("t1", 0.5, risk=0.9)], dict(untrusted), DeterministicExecutor(), run_id="HALT"
+            )
+
+        loop = _loop(state)
+        result = loop.execute_cycle([_task("t1", 0.5, risk=0.9)], untrusted, DeterministicExecutor(), run_id="HALT")
+        assert result["results"] == []
+        assert result["statistics"]["tasks_deferred"] == ["t1"]
+        assert result["statistics"]["backlog_size"] == 1
+
+        trusted = {"b": Agent(id="b", trust_score=0.9, capabilities=[], status="active")}
+        needs_gpu = Task(id="gpu", impact=0.9, urgency=0.9, risk=0.1, metadata={"required_capability": "gpu"})
+        result = loop.execute_cycle([needs_gpu], trusted, DeterministicExecutor(), run_id="HALT")
+        assert [r.task_id for r in result["results"]] == ["t1"]
+        assert result["statistics"]["tasks_deferred"] == ["gpu"]
+    finally:
+        state.close()
+
+
+def test_open_circuit_breaker_defers_whole_cycle(tmp_path):
+    state = PersistentStateManager(db_path=str(tmp_path / "open_breaker.db"))
+    try:
+        loop = _loop(state)
+        agents = {"a": Agent(id="a", trust_score=0.2, capabilities=[], status="suppressed")}
+        loop.trust_engine.suppressed_agents["a"] = loop.trust_engine.MAX_REDEMPTION_CYCLES + 1
+
+        result = loop.execute_cycle([_task("t1", 0.5), _task("t2", 0.9)], agents, DeterministicExecutor(), run_id="OPEN")
+        assert result["results"] == []
+        assert result["statistics"]["tasks_deferred"] == ["t2", "t1"]
+        assert result["statistics"]["backlog_size"] == 2
+    finally:
+        state.close()
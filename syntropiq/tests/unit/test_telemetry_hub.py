@@ -1,3 +1,6 @@
+import pytest
+from pydantic import ValidationError
+
 from syntropiq.api.telemetry import GovernanceTelemetryHub
 
 
@@ -38,3 +41,24 @@ def test_get_events_since_filters_correctly():
     filtered = hub.get_events_since("2026-01-01T00:03:00Z")
     assert len(filtered) == 1
     assert filtered[0].cycle_id == "RUN_1:2"
+
+
+def test_publish_events_validates_batch_before_publishing():
+    hub = GovernanceTelemetryHub(max_events=10, max_cycles=2)
+    bad = make_event("2026-01-01T00:02:00Z", 3)
+    bad.pop("trust_before")
+
+    with pytest.raises(ValidationError):
+        hub.publish_events([make_event("2026-01-01T00:00:00Z", 1), bad])
+    assert hub.get_events_since() == []
+
+
+def test_publish_events_fans_out_batch_in_order():
+    hub = GovernanceTelemetryHub(max_events=10, max_cycles=2)
+    _, subscriber = hub.subscribe()
+
+    published = hub.publish_events([make_event(f"2026-01-01T00:0{i}:00Z", i) for i in range(3)])
+
+    assert [event.cycle_id for event in published] == ["RUN_1:0", "RUN_1:1", "RUN_1:2"]
+    assert [subscriber.get_nowait().cycle_id for _ in range(3)] == ["RUN_1:0", "RUN_1:1", "RUN_1:2"]
+    assert hub.metrics()["execute_calls"] == 0
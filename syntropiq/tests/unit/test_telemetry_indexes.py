@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import sqlite3
+
+from syntropiq.api.state_manager import _SCHEMA_MIGRATIONS, PersistentStateManager
+
+
+def _plan(db_path, sql: str, params):
+    with sqlite3.connect(db_path) as conn:
+        return " | ".join(row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+
+
+def test_migrations_are_versioned_and_idempotent(tmp_path):
+    db_path = tmp_path / "telemetry.db"
+    PersistentStateManager(db_path=db_path).close()
+    PersistentStateManager(db_path=db_path).close()
+
+    with sqlite3.connect(db_path) as conn:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+
+    assert version == _SCHEMA_MIGRATIONS[-1][0]
+    assert {"idx_events_chain_ts", "idx_events_type_ts", "idx_lambda_history_run_ts"} <= indexes
+
+
+def test_run_queries_use_indexes(tmp_path):
+    db_path = tmp_path / "telemetry.db"
+    manager = PersistentStateManager(db_path=db_path)
+    manager.close()
+
+    recent = _plan(db_path, "SELECT payload FROM events ORDER BY timestamp DESC LIMIT ?", (10,))
+    by_run = _plan(
+        db_path,
+        "SELECT payload, timestamp AS ts, rowid AS rid FROM events WHERE chain_id=? "
+        "UNION ALL SELECT payload, timestamp AS ts, rowid AS rid FROM events WHERE chain_id=? "
+        "ORDER BY ts ASC, rid ASC LIMIT ?",
+        ("telemetry:RUN", "RUN", 10),
+    )
+    assert "idx_events_ts" in recent
+    assert "idx_events_chain_ts" in by_run
+    assert "TEMP B-TREE" not in recent + by_run
+
+
+def test_load_events_by_run_id_merges_chains_in_order(tmp_path):
+    db_path = tmp_path / "telemetry.db"
+    manager = PersistentStateManager(db_path=db_path)
+    manager.save_event({"run_id": "RUN_M", "timestamp": "2026-03-01T10:00:01Z", "type": "a"})
+    manager.save_event({"run_id": "RUN_M", "timestamp": "2026-03-01T10:00:03Z", "type": "c"})
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "INSERT INTO events (id, timestamp, type, payload, chain_id) VALUES (?, ?, ?, ?, ?)",
+            ("legacy-1", "2026-03-01T10:00:02Z", "b", '{"type": "b"}', "RUN_M"),
+        )
+        conn.commit()
+
+    events = manager.load_events_by_run_id("RUN_M")
+    assert [event["type"] for event in events] == ["a", "b", "c"]
+    assert [event["type"] for event in manager.load_events_by_run_id("RUN_M", limit=2)] == ["a", "b"]
+    manager.close()
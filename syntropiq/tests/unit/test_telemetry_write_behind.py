@@ -0,0 +1,121 @@
+import threading
+import time
+
+from syntropiq.api.state_manager import PersistentStateManager
+from syntropiq.api.telemetry import GovernanceTelemetryHub
+
+
+def make_event(idx: int):
+    return {
+        "run_id": "RUN_WB",
+        "cycle_id": f"RUN_WB:{idx}",
+        "timestamp": f"2026-01-01T00:00:{idx:02d}Z",
+        "type": "trust_update",
+        "agent_id": f"agent_{idx}",
+        "trust_before": 0.7,
+        "trust_after": 0.8,
+        "authority_before": 0.3,
+        "authority_after": 0.4,
+        "metadata": {"idx": idx},
+    }
+
+
+class GatedStateManager:
+    """Records saves; each save waits until the gate is opened."""
+
+    def __init__(self, delay: float = 0.0):
+        self.gate = threading.Event()
+        self.delay = delay
+        self.saved = []
+
+    def save_event(self, event):
+        self.gate.wait(timeout=5)
+        time.sleep(self.delay)
+        self.saved.append(event["cycle_id"])
+
+    def save_cycle(self, cycle):
+        self.gate.wait(timeout=5)
+        self.saved.append(("cycle", cycle["cycle_id"]))
+
+
+def test_publish_does_not_wait_for_persistence():
+    state = GatedStateManager()
+    hub = GovernanceTelemetryHub(state_manager=state, flush_interval=0.01)
+
+    started = time.perf_counter()
+    for idx in range(20):
+        hub.publish_event(make_event(idx))
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 1.0
+    assert hub.write_stats()["pending"] == 20
+    assert len(hub.get_events_since()) == 20
+
+    state.gate.set()
+    assert hub.flush(timeout=5) is True
+    assert state.saved == [f"RUN_WB:{idx}" for idx in range(20)]
+    assert hub.stats()["persistence"]["persisted"] == 20
+    hub.close()
+
+
+def test_drop_policy_counts_dropped_writes():
+    state = GatedStateManager()
+    hub = GovernanceTelemetryHub(state_manager=state, max_pending_writes=2, max_write_batch=1, overflow="drop")
+
+    for idx in range(10):
+        hub.publish_event(make_event(idx))
+
+    stats = hub.write_stats()
+    assert stats["dropped"] > 0
+    assert stats["queue_depth"] <= 2
+
+    state.gate.set()
+    assert hub.flush(timeout=5) is True
+    assert len(state.saved) + hub.write_stats()["dropped"] == 10
+    assert len(hub.get_events_since()) == 10
+    hub.close()
+
+
+def test_block_policy_applies_backpressure():
+    state = GatedStateManager()
+    hub = GovernanceTelemetryHub(state_manager=state, max_pending_writes=1, max_write_batch=1)
+
+    publisher = threading.Thread(target=lambda: [hub.publish_event(make_event(idx)) for idx in range(5)])
+    publisher.start()
+    time.sleep(0.1)
+    assert publisher.is_alive()
+    assert hub.write_stats()["blocked"] >= 1
+
+    state.gate.set()
+    publisher.join(timeout=5)
+    assert hub.flush(timeout=5) is True
+    assert state.saved == [f"RUN_WB:{idx}" for idx in range(5)]
+    hub.close()
+
+
+def test_close_flushes_to_hash_chained_ledger(monkeypatch, tmp_path):
+    monkeypatch.setenv("AUDIT_CHAIN_MODE", "log")
+    manager = PersistentStateManager(db_path=tmp_path / "telemetry.db")
+    hub = GovernanceTelemetryHub(state_manager=manager)
+
+    for idx in range(12):
+        hub.publish_event(make_event(idx))
+    hub.record_cycle(
+        {
+            "run_id": "RUN_WB",
+            "cycle_id": "RUN_WB:1",
+            "timestamp": "2026-01-01T00:01:00Z",
+            "total_agents": 1,
+            "successes": 1,
+            "failures": 0,
+            "trust_delta_total": 0.1,
+            "authority_redistribution": {},
+            "events": [],
+        }
+    )
+
+    assert hub.close() is True
+    assert len(manager.load_events_by_run_id("RUN_WB")) == 12
+    assert len(manager.load_cycles_by_run_id("RUN_WB")) == 1
+    assert manager.verify_events_chain(chain_id="RUN_WB")["ok"] is True
+    manager.close()
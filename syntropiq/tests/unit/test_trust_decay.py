@@ -0,0 +1,113 @@
+import pytest
+
+from syntropiq.core.models import Agent, Task
+from syntropiq.execution.deterministic_executor import DeterministicExecutor
+from syntropiq.governance.loop import GovernanceLoop
+from syntropiq.governance.trust_decay import IdleTrustDecay
+from syntropiq.persistence.agent_registry import AgentRegistry
+from syntropiq.persistence.state_manager import PersistentStateManager
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_decay_halves_excess_above_floor():
+    clock = FakeClock()
+    decay = IdleTrustDecay(half_life_seconds=60, floor=0.5, clock=clock)
+    agents = [
+        Agent(id="idle", trust_score=0.9, capabilities=[], status="active"),
+        Agent(id="low", trust_score=0.4, capabilities=[], status="suppressed"),
+    ]
+    assert decay.apply(agents) == {}  # clocks start on first read
+
+    clock.now += 60
+    assert decay.apply(agents) == {"idle": 0.7}
+    assert agents[0].trust_score == 0.7
+    assert agents[1].trust_score == 0.4
+
+    clock.now += 0.01  # below rounding resolution: nothing to persist
+    assert decay.apply(agents) == {}
+
+    with pytest.raises(ValueError):
+        IdleTrustDecay(half_life_seconds=0)
+
+
+def test_registry_persists_only_used_decay(tmp_path):
+    clock = FakeClock()
+    state = PersistentStateManager(db_path=str(tmp_path / "decay.db"))
+    try:
+        registry = AgentRegistry(state, idle_decay=IdleTrustDecay(half_life_seconds=100, clock=clock))
+        registry.register_agent("a", ["x"], 0.9)
+        registry.register_agent("b", ["x"], 0.8)
+        registry.idle_decay.touch("a")
+        registry.idle_decay.touch("b")
+
+        clock.now += 100
+        agents = registry.get_agents_dict()
+        assert agents["a"].trust_score == 0.7
+        assert state.get_trust_scores() == {"a": 0.7, "b": 0.65}
+        assert registry.top_trusted(1) == ["a"]
+
+        registry.get_agents_dict()
+        reasons = [row["reason"] for row in state.get_trust_history("a")]
+        assert reasons.count("idle_decay") == 1
+    finally:
+        state.close()
+
+
+def test_loop_resets_clock_for_active_agents(tmp_path):
+    clock = FakeClock()
+    state = PersistentStateManager(db_path=str(tmp_path / "loop_decay.db"))
+    try:
+        decay = IdleTrustDecay(half_life_seconds=50, clock=clock)
+        loop = GovernanceLoop(state_manager=state, idle_decay=decay)
+        agents = {
+            "busy": Agent(id="busy", trust_score=0.95, capabilities=["x"], status="active"),
+            "idle": Agent(id="idle", trust_score=0.90, capabilities=["x"], status="active"),
+        }
+        task = [Task(id="t", impact=0.5, urgency=0.5, risk=0.1)]
+        loop.execute_cycle(task, agents, DeterministicExecutor(), run_id="DECAY")
+
+        clock.now += 50
+        loop.execute_cycle(task, agents, DeterministicExecutor(), run_id="DECAY")
+        assert agents["idle"].trust_score == 0.7
+        assert decay.last_updated["busy"] == clock.now
+    finally:
+        state.close()
+
+
+def test_restart_seeds_clock_from_last_activity_not_score_change(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "activity.db")
+    state = PersistentStateManager(db_path=db_path)
+    try:
+        state.update_trust_scores({"pinned": 1.0, "idle": 0.9}, reason="initial_registration")
+        with state._pool.write() as conn:  # both last changed long ago
+            conn.execute("UPDATE trust_scores SET updated_at = '2000-01-01T00:00:00'")
+            conn.execute("UPDATE agent_activity SET last_active_at = '2000-01-01T00:00:00'")
+        state.update_trust_scores({"pinned": 1.0}, reason="RUN")  # learning at the cap
+    finally:
+        state.close()
+
+    state = PersistentStateManager(db_path=db_path)
+    try:
+        registry = AgentRegistry(state, idle_decay=IdleTrustDecay(half_life_seconds=3600))
+        reads = []
+        original = state.get_agent_trust_state
+        monkeypatch.setattr(state, "get_agent_trust_state", lambda *a: reads.append(a) or original(*a))
+        registry.load_agents_from_defaults([
+            Agent(id="pinned", trust_score=0.5, capabilities=["x"], status="active"),
+            Agent(id="idle", trust_score=0.5, capabilities=["x"], status="active"),
+            Agent(id="new", trust_score=0.5, capabilities=["x"], status="active"),
+        ])
+        assert reads == [()]
+
+        agents = registry.get_agents_dict()
+        assert agents["pinned"].trust_score == 1.0
+        assert agents["idle"].trust_score == 0.5
+    finally:
+        state.close()
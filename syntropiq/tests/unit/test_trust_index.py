@@ -0,0 +1,148 @@
+import random
+import threading
+
+import syntropiq.api.server  # noqa: F401  (routes is imported through the server module)
+from syntropiq.api.routes import select_highest_trust, select_top_n_trust
+from syntropiq.governance.trust_index import TrustRankedIndex
+from syntropiq.persistence.agent_registry import AgentRegistry
+from syntropiq.persistence.state_manager import PersistentStateManager
+
+
+def _reference(scores, order):
+    eligible = {aid: {"trust_score": scores[aid]} for aid in order if aid in scores}
+    return select_top_n_trust(eligible, n=len(eligible))
+
+
+def test_index_matches_stable_sort_under_updates():
+    rng = random.Random(3)
+    index = TrustRankedIndex()
+    index.BUCKET_SIZE = 4
+    order = [f"a{i}" for i in range(200)]
+    scores = {aid: 0.5 for aid in order}
+    for aid in order:  # first insertion fixes tie order, as registration does
+        index.upsert(aid, 0.5)
+
+    for step in range(3000):
+        aid = rng.choice(order)
+        if rng.random() < 0.15:
+            index.discard(aid)
+            scores.pop(aid, None)
+        else:
+            score = rng.choice([0.5, 0.7, 0.75, 0.9, 1.0])
+            index.upsert(aid, score)
+            scores[aid] = score
+        if step % 250 == 0:
+            assert list(index) == _reference(scores, order)
+
+    assert len(index) == len(scores)
+    assert index.top(5) == _reference(scores, order)[:5]
+    assert index.top(0) == []
+
+
+def test_registry_tracks_status_and_in_place_edits(tmp_path):
+    state = PersistentStateManager(db_path=str(tmp_path / "registry.db"))
+    try:
+        registry = AgentRegistry(state)
+        registry.register_agent("alpha", ["x"], 0.80)
+        registry.register_agent("beta", ["x"], 0.90)
+        registry.register_agent("gamma", ["x"], 0.90)
+        assert registry.top_trusted(2) == ["beta", "gamma"]
+
+        registry.update_agent_status("beta", "suppressed")
+        assert registry.top_trusted(1) == ["gamma"]
+
+        # Edited in place (as the governance loop does): the write re-ranks the agent.
+        registry.agents["gamma"].trust_score = 0.10
+        assert registry.top_trusted(1) == ["alpha"]
+
+        state.update_trust_scores({"alpha": 0.95, "gamma": 0.99}, reason="test")
+        registry.agents["beta"].status = "active"
+        registry.sync_trust_scores()
+        assert registry.top_trusted(3) == ["gamma", "alpha", "beta"]
+
+        eligible = {a.id: {"trust_score": a.trust_score} for a in registry.list_agents()}
+        assert select_highest_trust(eligible, ranked=registry.top_trusted) == select_highest_trust(eligible)
+        assert select_top_n_trust(eligible, ranked=registry.top_trusted) == select_top_n_trust(eligible)
+    finally:
+        state.close()
+
+
+def test_in_place_edits_outside_the_head_are_seen(tmp_path):
+    state = PersistentStateManager(db_path=str(tmp_path / "registry.db"))
+    try:
+        registry = AgentRegistry(state)
+        registry.register_agent("a", ["x"], 0.9)
+        registry.register_agent("b", ["x"], 0.5)
+        assert registry.top_trusted(1) == ["a"]
+
+        registry.agents["b"].trust_score = 0.99
+        assert registry.top_trusted(1) == ["b"]
+
+        registry.agents["a"].status = "suspended"  # still routable, like the execute route
+        registry.agents["b"].status = "suppressed"
+        assert registry.top_trusted(2) == ["a"]
+
+        registry.agents["b"].status = "active"
+        eligible = {a.id: {"trust_score": a.trust_score} for a in registry.list_agents()}
+        assert select_top_n_trust(eligible, ranked=registry.top_trusted) == select_top_n_trust(eligible)
+
+        # A ranked id missing from the route's map falls back to sorting the map.
+        del eligible["b"]
+        assert select_highest_trust(eligible, ranked=registry.top_trusted) == ["a"]
+    finally:
+        state.close()
+
+
+def test_index_is_consistent_under_concurrent_updates():
+    index = TrustRankedIndex()
+    index.BUCKET_SIZE = 4
+    ids = [f"a{i}" for i in range(64)]
+    errors = []
+
+    def writer(seed):
+        rng = random.Random(seed)
+        for _ in range(2000):
+            aid = rng.choice(ids)
+            if rng.random() < 0.2:
+                index.discard(aid)
+            else:
+                index.upsert(aid, rng.random())
+
+    def reader():
+        for _ in range(2000):
+            top = index.top(10)
+            if len(top) != len(set(top)):
+                errors.append(top)
+
+    threads = [threading.Thread(target=writer, args=(seed,)) for seed in range(3)]
+    threads.append(threading.Thread(target=reader))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    listed = list(index)
+    assert len(listed) == len(set(listed)) == len(index)
+    assert [index.trust_of(aid) for aid in listed] == sorted((index.trust_of(aid) for aid in listed), reverse=True)
+
+
+def test_reads_do_not_rescan_and_copies_are_ignored(tmp_path, monkeypatch):
+    state = PersistentStateManager(db_path=str(tmp_path / "registry.db"))
+    try:
+        registry = AgentRegistry(state)
+        for i in range(50):
+            registry.register_agent(f"a{i}", ["x"], 0.5)
+        copy = registry.agents["a7"].model_copy()
+
+        refreshed = []
+        refresh = registry.refresh_agent
+        monkeypatch.setattr(registry, "refresh_agent", lambda aid: refreshed.append(aid) or refresh(aid))
+
+        registry.agents["a3"].trust_score = 0.9
+        copy.trust_score = 1.0  # not the registry's object
+        assert refreshed == ["a3"]
+        assert registry.top_trusted(2) == ["a3", "a0"]
+        assert refreshed == ["a3"]
+    finally:
+        state.close()
@@ -137,6 +137,7 @@ def run_full_system_demo():
             break
 
         # Persist adaptive ledgers
+        telemetry_hub.flush()
         recent_cycles = telemetry_state.load_cycles_by_run_id(run_id, limit=100)
 
         posterior = posterior_from_cycles(recent_cycles[-50:])
@@ -179,6 +180,7 @@ def run_full_system_demo():
 
         set_current_lambda(recommended, run_id=run_id)
 
+    telemetry_hub.close()
     artifacts = load_run_artifacts(telemetry_state, run_id)
 
     replayed = replay_run(artifacts, seed=123, mode="light")
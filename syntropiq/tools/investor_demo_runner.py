@@ -17,7 +17,7 @@ from syntropiq.core.models import Task
 from syntropiq.core.replay import compare_runs, compute_r, replay_run
 from syntropiq.execution.deterministic_executor import DeterministicExecutor
 from syntropiq.governance.loop import GovernanceLoop
-from syntropiq.optimize.bayes_posterior import posterior_from_cycles
+from syntropiq.optimize.bayes_posterior import BayesPosteriorTracker
 from syntropiq.optimize.config import get_current_lambda, set_current_lambda
 from syntropiq.optimize.lambda_adaptation import compute_adaptive_lambda
 from syntropiq.optimize.lambda_optimizer import optimize_tasks
@@ -314,6 +314,10 @@ def run_investor_demo(args: argparse.Namespace) -> bool:
 
     telemetry_state = TelemetryStateManager(db_path=telemetry_db_path)
     telemetry_hub = GovernanceTelemetryHub(state_manager=telemetry_state, max_events=10000, max_cycles=3000)
+    # Fed from the prefix query below; the prefix was just cleared, so it starts at the prior.
+    bayes_tracker = BayesPosteriorTracker(window=50)
+    bayes_tracker.posterior(args.run_id, seed=list)
+    observed_prefix_cycles = 0
 
     runtime_state = RuntimeStateManager(db_path=runtime_db_path)
     registry = AgentRegistry(runtime_state)
@@ -435,6 +439,7 @@ def run_investor_demo(args: argparse.Namespace) -> bool:
             suppression_deadlock = True
 
         # Adaptive lambda + posterior ledgers for base run id.
+        telemetry_hub.flush()
         recent_cycles = telemetry_state.load_cycles_by_run_id(cycle_run_id, limit=1)
         # Aggregate failures via prefix query from telemetry DB.
         with sqlite3.connect(telemetry_db_path) as conn:
@@ -444,8 +449,11 @@ def run_investor_demo(args: argparse.Namespace) -> bool:
             ).fetchall()
         all_prefix_cycles = [json.loads(row[0]) for row in rows]
 
-        posterior = posterior_from_cycles(all_prefix_cycles[-50:])
-        telemetry_state.save_bayes_posterior({"run_id": args.run_id, **posterior})
+        for cycle in all_prefix_cycles[observed_prefix_cycles:]:
+            bayes_tracker.observe_cycle({**cycle, "run_id": args.run_id})
+        observed_prefix_cycles = len(all_prefix_cycles)
+        posterior = bayes_tracker.snapshot(args.run_id, telemetry_state)
+        posterior.pop("run_id", None)
 
         success_total = sum(int(c.get("successes", 0)) for c in all_prefix_cycles[-10:])
         fail_total = sum(int(c.get("failures", 0)) for c in all_prefix_cycles[-10:])
@@ -560,6 +568,7 @@ def run_investor_demo(args: argparse.Namespace) -> bool:
         )
 
     # Replay validation from persisted telemetry prefix artifacts.
+    telemetry_hub.close()
     replay_cycles = _load_cycle_snapshots_from_telemetry(telemetry_db_path, args.run_id)
     original = {"run_id": args.run_id, "cycles": replay_cycles}
     replayed = replay_run({"run_id": args.run_id, "cycles": replay_cycles, "mode_capabilities": {}}, seed=args.seed, mode="light")